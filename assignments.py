@@ -0,0 +1,252 @@
+import dataclasses
+from dataclasses import dataclass
+import datetime
+import heapq
+import itertools
+
+# -------------------------------------------------
+# 과제 모델
+# -------------------------------------------------
+# no-touch.tsx 의 Assignment 인터페이스와 같은 필드.
+# 마감일은 date, 예상 시간은 분 단위 정수로 입력 시점에 변환해 둔다.
+
+PRIORITIES = ("high", "medium", "low")
+PRIORITY_RANK = {p: i for i, p in enumerate(PRIORITIES)}
+REMINDERS = ("none", "10min", "30min", "1hour", "1day")  # 마감 몇 분 전 (reminders.REMINDER_OFFSETS)
+
+
+@dataclass(slots=True)
+class Assignment:
+    id: str
+    title: str
+    due_date: datetime.date
+    estimated_time: int  # 분
+    priority: str = "medium"
+    completed: bool = False
+    type: str = "school"
+    progress: int = 0  # 0~100
+    added_to_ai: bool = False
+    memo: str = ""
+    repeat: str = "none"
+    reminder: str = "none"
+
+    def __post_init__(self):
+        if isinstance(self.due_date, str):
+            self.due_date = datetime.date.fromisoformat(self.due_date)
+        if self.priority not in PRIORITY_RANK:
+            raise ValueError(f"알 수 없는 우선순위입니다: {self.priority!r}")
+        if self.reminder not in REMINDERS:
+            # 저장소가 바뀐 뒤 알림 등록에서 실패하지 않도록 만들 때 거른다
+            raise ValueError(f"알 수 없는 알림 설정입니다: {self.reminder!r}")
+        if self.estimated_time < 0 or not 0 <= self.progress <= 100:
+            raise ValueError(f"예상 시간/진도율이 올바르지 않습니다: {self.estimated_time}, {self.progress}")
+
+    @property
+    def priority_rank(self):
+        return PRIORITY_RANK[self.priority]
+
+    @property
+    def remaining_time(self):
+        # 진도율만큼 뺀 남은 시간 (올림)
+        return -(-self.estimated_time * (100 - self.progress) // 100)
+
+    @property
+    def pending_for_ai(self):
+        return self.added_to_ai and not self.completed and self.remaining_time > 0
+
+
+# -------------------------------------------------
+# 과제 저장소 (보조 인덱스 + 힙)
+# -------------------------------------------------
+# 과제 목록을 바꿀 때마다 전체를 filter/sort 하지 않도록
+#   - id -> 과제, 상태별(STATUSES) / 종류(type)별 id 집합을 유지하고
+#   - 미완료 과제를 (우선순위, 마감일) 힙과 (마감일, 우선순위) 힙에 넣어 둔다.
+# 힙 항목은 지우지 않고 버전으로 무효 처리한다(lazy deletion) — 완료/우선순위 변경은
+# 새 항목을 넣거나 버전만 올리면 되므로 O(log n). 무효 항목이 살아 있는 항목보다
+# 많아지면 힙을 다시 만든다. 버전은 저장소 전체에서 계속 늘어나는 번호라서 지운 id 를
+# 다시 넣어도 예전 힙 항목이 되살아나지 않는다.
+# "앞에서 N개" 조회는 힙을 정렬하지 않고 힙 트리를 작은 값부터 따라 내려가며
+# 꺼낸다 (O(N log N), 전체 크기와 무관).
+#
+# 저장소에 넣은 과제는 저장소 메서드로만 바꾼다 (직접 고치면 인덱스가 어긋난다).
+# on_change(과제, removed) 는 추가/수정/삭제 뒤에 불린다 (알림 등록 등, reminders.watch).
+
+STATUS_PENDING = "pending"
+STATUS_COMPLETED = "completed"
+STATUS_AI = "ai"  # AI 에 추가됐고 남은 시간이 있는 미완료 과제 (pending_for_ai)
+STATUSES = (STATUS_PENDING, STATUS_COMPLETED, STATUS_AI)
+
+_ORDER_FIELDS = ("priority", "due_date", "completed")
+
+
+class AssignmentError(ValueError):
+    """없는 과제/중복 id 등 저장소 작업이 잘못되었을 때 발생"""
+
+
+class AssignmentStore:
+    def __init__(self, assignments=(), on_change=None):
+        self.on_change = on_change
+        self._by_id = {}
+        self._status = {s: set() for s in STATUSES}
+        self._types = {}
+        self._by_priority = []  # (우선순위, 마감일, 순번, 버전, id)
+        self._by_due = []  # (마감일, 우선순위, 순번, 버전, id)
+        self._version = {}  # id -> 유효한 힙 항목의 버전
+        self._seq = {}
+        self._tick = itertools.count()  # 순번/버전 공용 (줄어들거나 재사용되지 않음)
+        self._stale = 0
+        for a in assignments:
+            self.add(a)
+
+    def __len__(self):
+        return len(self._by_id)
+
+    def __iter__(self):
+        # 넣은 순서 (과제 목록 화면, LLM 프롬프트 등 기존 리스트 자리에 그대로 쓸 수 있다)
+        return iter(self._by_id.values())
+
+    def __contains__(self, assignment_id):
+        return assignment_id in self._by_id
+
+    def get(self, assignment_id):
+        a = self._by_id.get(assignment_id)
+        if a is None:
+            raise AssignmentError(f"없는 과제입니다: {assignment_id!r}")
+        return a
+
+    # -------------------------------------------------
+    # 쓰기
+    # -------------------------------------------------
+    def add(self, a):
+        if a.id in self._by_id:
+            raise AssignmentError(f"이미 있는 과제 id 입니다: {a.id!r}")
+        self._by_id[a.id] = a
+        self._seq[a.id] = next(self._tick)
+        self._types.setdefault(a.type, set()).add(a.id)
+        self._index(a)
+        if self.on_change is not None:
+            self.on_change(a)
+        return a
+
+    def remove(self, assignment_id):
+        a = self.get(assignment_id)
+        self._unindex(a)
+        self._types[a.type].discard(a.id)
+        del self._by_id[a.id]
+        del self._version[a.id], self._seq[a.id]
+        self._maybe_compact()
+        if self.on_change is not None:
+            self.on_change(a, removed=True)
+        return a
+
+    def complete(self, assignment_id, completed=True):
+        return self.update(assignment_id, completed=completed)
+
+    def set_progress(self, assignment_id, progress):
+        """진도율 변경 (100 이면 완료, 100 미만이면 미완료)"""
+        return self.update(assignment_id, progress=progress, completed=progress >= 100)
+
+    def update(self, assignment_id, **changes):
+        """필드 변경. 우선순위/마감일/완료 여부가 바뀔 때만 힙에 새 항목을 넣는다"""
+        a = self.get(assignment_id)
+        changes = {k: v for k, v in changes.items() if v is not None}
+        if "id" in changes:
+            raise AssignmentError("과제 id 는 바꿀 수 없습니다")
+        reorder = any(k in changes and getattr(a, k) != changes[k] for k in _ORDER_FIELDS)
+        old_type = a.type
+        self._unindex(a, heaps=reorder)
+        try:
+            candidate = dataclasses.replace(a, **changes)  # __post_init__ 검증
+        except (TypeError, ValueError):
+            self._index(a, heaps=reorder)
+            raise
+        for k in changes:
+            setattr(a, k, getattr(candidate, k))
+        if a.type != old_type:
+            self._types[old_type].discard(a.id)
+            self._types.setdefault(a.type, set()).add(a.id)
+        self._index(a, heaps=reorder)
+        self._maybe_compact()
+        if self.on_change is not None:
+            self.on_change(a)
+        return a
+
+    def _index(self, a, heaps=True):
+        self._status[STATUS_COMPLETED if a.completed else STATUS_PENDING].add(a.id)
+        if a.pending_for_ai:
+            self._status[STATUS_AI].add(a.id)
+        if heaps:
+            version = self._version[a.id] = next(self._tick)  # 이전 항목은 모두 무효
+            if not a.completed:
+                seq = self._seq[a.id]
+                heapq.heappush(self._by_priority, (a.priority_rank, a.due_date, seq, version, a.id))
+                heapq.heappush(self._by_due, (a.due_date, a.priority_rank, seq, version, a.id))
+
+    def _unindex(self, a, heaps=True):
+        for ids in self._status.values():
+            ids.discard(a.id)
+        if heaps:
+            # 이전 힙 항목은 _index 가 새 버전을 매기거나 remove 가 버전을 지우면 무효
+            self._stale += 2
+
+    def _maybe_compact(self):
+        if self._stale > 64 and self._stale > 2 * len(self._by_id):
+            live = [a for a in self._by_id.values() if not a.completed]
+            self._by_priority = [(a.priority_rank, a.due_date, self._seq[a.id], self._version[a.id], a.id) for a in live]
+            self._by_due = [(a.due_date, a.priority_rank, self._seq[a.id], self._version[a.id], a.id) for a in live]
+            heapq.heapify(self._by_priority)
+            heapq.heapify(self._by_due)
+            self._stale = 0
+
+    # -------------------------------------------------
+    # 조회
+    # -------------------------------------------------
+    def _walk(self, heap):
+        """힙 트리를 작은 값부터 따라가며 유효한 과제를 내보낸다 (힙은 그대로)"""
+        if not heap:
+            return
+        frontier = [(heap[0], 0)]
+        while frontier:
+            entry, i = heapq.heappop(frontier)
+            aid, version = entry[-1], entry[-2]
+            if self._version.get(aid) == version:
+                yield self._by_id[aid]
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (heap[child], child))
+
+    def by_priority(self):
+        """미완료 과제, (우선순위, 마감일) 순 제너레이터"""
+        return self._walk(self._by_priority)
+
+    def by_due(self):
+        """미완료 과제, (마감일, 우선순위) 순 제너레이터"""
+        return self._walk(self._by_due)
+
+    def next_due(self, n, type=None):
+        """마감이 가까운 미완료 과제 n 개"""
+        it = self.by_due()
+        if type is not None:
+            it = (a for a in it if a.type == type)
+        return list(itertools.islice(it, n))
+
+    def pending_for_ai(self):
+        """AI 배치 대상, (우선순위, 마감일) 순 — 스케줄러가 그대로 쓴다"""
+        ai = self._status[STATUS_AI]
+        # 대상 수만큼 찾으면 더 내려가지 않는다
+        return list(itertools.islice((a for a in self.by_priority() if a.id in ai), len(ai)))
+
+    def with_status(self, status):
+        if status not in self._status:
+            raise AssignmentError(f"알 수 없는 상태입니다: {status!r}")
+        return [self._by_id[i] for i in self._status[status]]
+
+    def with_type(self, type):
+        return [self._by_id[i] for i in self._types.get(type, ())]
+
+    def types(self):
+        return sorted(t for t, ids in self._types.items() if ids)
+
+    def counts(self):
+        """상태별 개수"""
+        return {s: len(ids) for s, ids in self._status.items()}
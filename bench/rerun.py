@@ -0,0 +1,272 @@
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+
+# -------------------------------------------------
+# rerun 지연 시간 벤치마크
+# -------------------------------------------------
+# Streamlit 앱 테스트 도구(AppTest)로 app.py / test1.py / test2.py 를 브라우저 없이 돌리면서
+# 이벤트 10 / 1천 / 1만 개짜리 합성 시간표로 상호작용 한 번(= rerun 한 번)에 드는
+#   - 실행 시간 (여러 번 재서 중앙값)
+#   - 화면에 보낸 HTML 바이트 / 전체 요소 페이로드 바이트
+#   - 최대 메모리 (tracemalloc, 시간 측정과 따로 한 번 더 실행)
+# 를 기록해서 커밋별 JSON 으로 남긴다.
+#
+#   python bench/rerun.py                          # 전체 -> bench/results/<커밋>.json
+#   python bench/rerun.py --apps app.py --sizes 10 1000 --repeat 3
+#   python bench/rerun.py --compare bench/results/a.json bench/results/b.json
+#
+# --compare 는 실행 시간이 --threshold 배 넘게 느려진 항목이 있으면 종료 코드 1.
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(ROOT, "bench", "results")
+SIZES = (10, 1000, 10000)
+APPS = ("app.py", "test1.py", "test2.py")
+
+# 저장소/LLM 캐시는 임시 폴더로 (앱 모듈을 import 하기 전에 정해야 한다)
+_TMP = tempfile.mkdtemp(prefix="ai-timetable-bench-")
+os.environ.setdefault("AI_TIMETABLE_DB", os.path.join(_TMP, "bench.sqlite3"))
+os.environ.setdefault("AI_TIMETABLE_CACHE_DIR", os.path.join(_TMP, "llm"))
+sys.path.insert(0, ROOT)
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from catalog import Overlay  # noqa: E402
+from events import KINDS, make_event  # noqa: E402
+from render_cache import timetable_cache  # noqa: E402
+from storage import default_store  # noqa: E402
+
+_TITLES = [f"과목 {i}" for i in range(40)]
+
+
+def synthetic_events(n, seed=0):
+    """요일 7일, 06~23시에 고르게 흩어진 n 개 (겹침 포함, 같은 seed 면 항상 같다)"""
+    rng = random.Random(seed)
+    events = []
+    for _ in range(n):
+        start = rng.randrange(6 * 6, 22 * 6) * 10
+        end = min(start + rng.choice((30, 50, 60, 90, 120)), 23 * 60)
+        events.append(make_event(rng.randrange(7), start, end, rng.choice(_TITLES),
+                                 rng.choice(KINDS[:3]), rng.choice(("", "메모"))))
+    return tuple(events)
+
+
+# -------------------------------------------------
+# 측정
+# -------------------------------------------------
+def _elements(node):
+    children = getattr(node, "children", None)
+    if children is None:
+        yield node
+        return
+    for child in children.values():
+        yield from _elements(child)
+
+
+def payload(at):
+    """(HTML 바이트, 전체 요소 proto 바이트) — 이번 실행이 화면에 보낸 양"""
+    html = 0
+    total = 0
+    for el in _elements(at._tree):
+        proto = getattr(el, "proto", None)
+        if proto is None:
+            continue
+        total += proto.ByteSize()
+        if el.type == "markdown":
+            html += len(proto.body.encode())
+        elif el.type == "html":
+            html += len(proto.body.encode())
+    return html, total
+
+
+def _button(at, label):
+    return next(b for b in at.button if b.label == label)
+
+
+def _tab(label):
+    return lambda at: at.radio(key="bottom_nav_radio").set_value(label).run()
+
+
+def _click(label):
+    return lambda at: _button(at, label).click().run()
+
+
+def _rerun_cold(at):
+    # 렌더 캐시(+ 세션의 주간 미리 계산 캐시)를 비운 채 다시 실행 — render_timetable 자체의 비용
+    timetable_cache.clear()
+    if "_week_prefetch" in at.session_state:
+        at.session_state["_week_prefetch"].clear()
+    return at.run()
+
+
+def _rename(app):
+    if app == "test2.py":
+        # ✏️ 로 폼을 열고 제출까지 (rerun 두 번)
+        def act(at):
+            _button(at, "✏️").click().run()
+            at.text_input[0].set_value(f"이름 {uuid.uuid4().hex[:6]}")
+            return _button(at, "변경").click().run()
+        return act
+    # test1: ✏️ 를 누른 실행 안에서 곧바로 이름을 바꾸고 rerun 한다
+    return _click("✏️")
+
+
+def actions(app):
+    """(이름, 동작) — 앞 동작이 만든 상태 위에서 차례로 실행된다"""
+    if app == "app.py":
+        return [
+            ("rerun", lambda at: at.run()),
+            ("rerun_cold_render", _rerun_cold),
+            ("tab:과제", _tab("과제")),
+            ("tab:AI", _tab("AI")),
+            ("tab:설정", _tab("설정")),
+            ("tab:홈", _tab("홈")),
+        ]
+    return [
+        ("rerun", lambda at: at.run()),
+        ("rerun_cold_render", _rerun_cold),
+        ("week_next", _click("▶")),
+        ("week_prev", _click("◀")),
+        ("tab:과제", _tab("과제")),
+        ("tab:설정", _tab("설정")),
+        ("tab:시간표", _tab("시간표")),
+        ("rename", _rename(app)),
+        ("create", _click("➕")),
+    ]
+
+
+def prepare(app, events):
+    """합성 시간표를 가진 새 세션"""
+    at = AppTest.from_file(os.path.join(ROOT, app), default_timeout=300)
+    if app == "app.py":
+        at.session_state["timetable"] = Overlay(events)
+    else:
+        owner = f"bench-{uuid.uuid4().hex}"
+        default_store().create_timetable(owner, "시간표 1", events)
+        at.query_params["u"] = owner
+    return at
+
+
+def _timed(fn, at):
+    started = time.perf_counter()
+    fn(at)
+    elapsed = time.perf_counter() - started
+    if at.exception:
+        raise RuntimeError(f"{[e.value for e in at.exception]}")
+    return elapsed
+
+
+def bench_app(app, n, repeat):
+    events = synthetic_events(n)
+    at = prepare(app, events)
+    rows = [{"app": app, "events": n, "action": "first_run", "wall_ms": [_timed(lambda a: a.run(), at) * 1000]}]
+    rows[0].update(zip(("html_bytes", "payload_bytes"), payload(at)))
+    for name, fn in actions(app):
+        walls = [_timed(fn, at) * 1000 for _ in range(repeat)]
+        rows.append({"app": app, "events": n, "action": name, "wall_ms": walls})
+        html, total = payload(at)
+        rows[-1].update(html_bytes=html, payload_bytes=total)
+
+        # 메모리는 따로 한 번 더 (tracemalloc 이 실행 시간을 부풀리므로)
+        tracemalloc.start()
+        try:
+            fn(at)
+            rows[-1]["peak_kib"] = tracemalloc.get_traced_memory()[1] / 1024
+        finally:
+            tracemalloc.stop()
+
+    for row in rows:
+        walls = row.pop("wall_ms")
+        row["wall_ms"] = statistics.median(walls)
+        row["wall_ms_min"] = min(walls)
+        row["runs"] = len(walls)
+    return rows
+
+
+def _commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run(apps, sizes, repeat):
+    import streamlit
+
+    results = []
+    for app in apps:
+        for n in sizes:
+            rows = bench_app(app, n, repeat)
+            for row in rows:
+                print(f"{row['app']:9} {row['events']:>6} {row['action']:18} {row['wall_ms']:9.1f}ms "
+                      f"{row['html_bytes']:>9,}B {row.get('peak_kib', 0):>9,.0f}KiB", file=sys.stderr)
+            results.extend(rows)
+    return {
+        "commit": _commit(),
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "streamlit": streamlit.__version__,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+# -------------------------------------------------
+# 커밋 간 비교
+# -------------------------------------------------
+def compare(old_path, new_path, threshold):
+    with open(old_path, encoding="utf-8") as f:
+        old = {(r["app"], r["events"], r["action"]): r for r in json.load(f)["results"]}
+    with open(new_path, encoding="utf-8") as f:
+        new = json.load(f)["results"]
+    regressed = 0
+    for row in new:
+        before = old.get((row["app"], row["events"], row["action"]))
+        if before is None:
+            continue
+        ratio = row["wall_ms"] / before["wall_ms"] if before["wall_ms"] else float("inf")
+        flag = ""
+        if ratio > threshold:
+            flag = "  <-- 느려짐"
+            regressed += 1
+        print(f"{row['app']:9} {row['events']:>6} {row['action']:18} "
+              f"{before['wall_ms']:9.1f} -> {row['wall_ms']:9.1f}ms (x{ratio:.2f}) "
+              f"html {before.get('html_bytes', 0):,} -> {row.get('html_bytes', 0):,}B{flag}")
+    return regressed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="rerun 지연 시간 벤치마크")
+    parser.add_argument("--apps", nargs="+", default=list(APPS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(SIZES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="결과 JSON 경로 (기본: bench/results/<커밋>.json)")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"))
+    parser.add_argument("--threshold", type=float, default=1.25, help="이 배율보다 느려지면 회귀로 본다")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        return 1 if compare(*args.compare, args.threshold) else 0
+
+    report = run(args.apps, args.sizes, args.repeat)
+    output = args.output or os.path.join(RESULTS_DIR, f"{report['commit']}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
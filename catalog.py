@@ -0,0 +1,121 @@
+from types import MappingProxyType
+
+import streamlit as st
+
+from assignments import Assignment
+from events import compile_events
+
+# -------------------------------------------------
+# 프로세스 공유 시간표 카탈로그
+# -------------------------------------------------
+# 데모/기본 시간표를 세션마다 복사하거나 rerun 마다 다시 만들지 않고,
+# 프로세스에서 한 번만 파싱해 불변(튜플 + 읽기 전용 매핑)으로 공유한다.
+# 세션은 카탈로그 항목을 참조만 하고, 자기 수정분은 Overlay 에 따로 둔다.
+# 수정이 없으면 Overlay.events() 는 카탈로그 튜플 그 자체를 돌려주므로
+# 메모리는 세션 수가 아니라 사용자 수정량에 비례한다.
+
+# 시간표 데이터 (스크린샷과 동일)
+DEMO_TIMETABLE = [
+    {"day": "월", "start": "09:00", "end": "10:00", "title": "데이터구조", "kind": "class"},
+    {"day": "월", "start": "10:00", "end": "11:00", "title": "데이터구조 과제", "kind": "task", "sub": "연결리스트 구현"},
+    {"day": "월", "start": "11:00", "end": "12:00", "title": "알고리즘", "kind": "class"},
+    {"day": "월", "start": "13:00", "end": "13:50", "title": "알고리즘 숙제", "kind": "task", "sub": "50분"},
+
+    {"day": "화", "start": "09:00", "end": "10:00", "title": "운영체제", "kind": "class"},
+    {"day": "화", "start": "14:00", "end": "15:00", "title": "데이터베이스", "kind": "class"},
+
+    {"day": "수", "start": "10:00", "end": "11:00", "title": "네트워크", "kind": "class"},
+
+    {"day": "목", "start": "09:00", "end": "10:00", "title": "소프트웨어공학", "kind": "class"},
+
+    {"day": "금", "start": "09:00", "end": "10:00", "title": "데이터구조 과제", "kind": "task", "sub": "스택/큐 구현"},
+    {"day": "금", "start": "13:00", "end": "14:00", "title": "인공지능", "kind": "class"},
+]
+
+# 새 사용자의 "시간표 1" 기본값
+DEFAULT_TIMETABLE = [
+    {"day": "월", "start": "09:00", "end": "10:00", "title": "데이터구조", "kind": "class"},
+    {"day": "월", "start": "10:00", "end": "11:00", "title": "데이터구조 과제", "kind": "task", "sub": "연결리스트"},
+]
+
+
+def demo_assignments():
+    """no-touch.tsx 의 테스트용 초기 과제 (세션마다 새 객체 — Assignment 는 변경 가능)"""
+    return [
+        Assignment("test-1", "데이터구조 과제 - 연결 리스트 구현", "2025-12-05", 60, "high",
+                   added_to_ai=True, memo="도서관에서 하기"),
+        Assignment("test-2", "알고리즘 숙제 - 정렬 알고리즘 분석", "2025-12-07", 50, "medium",
+                   added_to_ai=True, reminder="1day"),
+    ]
+
+
+class Catalog:
+    """이름 -> 이벤트 튜플. 만든 뒤에는 바꿀 수 없다."""
+
+    __slots__ = ("_entries",)
+
+    def __init__(self, entries):
+        self._entries = MappingProxyType({name: tuple(compile_events(items)) for name, items in entries.items()})
+
+    def __getitem__(self, name):
+        return self._entries[name]
+
+    def __contains__(self, name):
+        return name in self._entries
+
+    def names(self):
+        return tuple(self._entries)
+
+
+@st.cache_resource
+def shared_catalog():
+    """프로세스당 한 번만 로드되는 카탈로그"""
+    return Catalog({"demo": DEMO_TIMETABLE, "default": DEFAULT_TIMETABLE})
+
+
+# -------------------------------------------------
+# 세션별 copy-on-write 오버레이
+# -------------------------------------------------
+class Overlay:
+    """공유 이벤트 튜플 위에 세션 수정분(숨긴 인덱스, 추가 이벤트)만 얹는다"""
+
+    __slots__ = ("base", "hidden", "added", "_view")
+
+    def __init__(self, base, hidden=(), added=()):
+        self.base = base
+        self.hidden = frozenset(hidden)
+        self.added = tuple(added)
+        self._view = None
+
+    @property
+    def modified(self):
+        return bool(self.hidden or self.added)
+
+    def events(self):
+        if not self.modified:
+            return self.base  # 공유 튜플을 그대로
+        if self._view is None:
+            kept = (ev for i, ev in enumerate(self.base) if i not in self.hidden)
+            self._view = (*kept, *self.added)
+        return self._view
+
+    def add(self, ev):
+        self.added = (*self.added, ev)
+        self._view = None
+
+    def remove(self, ev):
+        """첫 번째로 일치하는 이벤트를 지운다 (공유 쪽이면 숨김 처리)"""
+        for i, base_ev in enumerate(self.base):
+            if i not in self.hidden and base_ev == ev:
+                self.hidden = self.hidden | {i}
+                self._view = None
+                return
+        added = list(self.added)
+        added.remove(ev)
+        self.added = tuple(added)
+        self._view = None
+
+    def reset(self):
+        self.hidden = frozenset()
+        self.added = ()
+        self._view = None
@@ -0,0 +1,189 @@
+import hashlib
+from collections import namedtuple
+import re
+import struct
+import threading
+
+# -------------------------------------------------
+# 시간표 이벤트 모델
+# -------------------------------------------------
+# "HH:MM" 문자열 dict 를 매 rerun 마다 split/int 하던 방식 대신,
+# 데이터가 입력될 때 한 번만 검증·파싱해서 정수(분) 기반 이벤트로 보관한다.
+# 렌더러와 스케줄러는 모두 이 모델만 읽는다.
+
+DAYS = ("월", "화", "수", "목", "금", "토", "일")
+DAY_INDEX = {d: i for i, d in enumerate(DAYS)}
+
+# 이벤트 종류 (정수 코드)
+KIND_CLASS = 0
+KIND_TASK = 1
+KIND_PERSONAL = 2
+KIND_FREE = 3  # 공강 (free-slot 엔진이 만든 오버레이)
+KINDS = ("class", "task", "personal", "free")
+KIND_INDEX = {k: i for i, k in enumerate(KINDS)}
+
+MINUTES_PER_DAY = 24 * 60
+
+
+class EventError(ValueError):
+    """잘못된 요일/시간/종류가 입력되었을 때 발생"""
+
+
+# -------------------------------------------------
+# 제목 인터닝 (프로세스 전체 공유)
+# -------------------------------------------------
+# 같은 과목명이 여러 세션·시간표에 반복되므로 문자열은 한 번만 저장하고
+# 이벤트에는 정수 id 만 둔다. 0 은 빈 문자열.
+_titles = [""]
+_title_ids = {"": 0}
+_title_lock = threading.Lock()
+
+
+def intern_title(text):
+    text = (text or "").strip()
+    tid = _title_ids.get(text)
+    if tid is not None:
+        return tid
+    with _title_lock:
+        tid = _title_ids.get(text)
+        if tid is None:
+            tid = len(_titles)
+            _titles.append(text)
+            _title_ids[text] = tid
+    return tid
+
+
+def title_of(tid):
+    return _titles[tid]
+
+
+# -------------------------------------------------
+# 시간 파싱
+# -------------------------------------------------
+# "9:00", "09:00", "9시", "09시 00분", "0900" 등을 분 단위 정수로 변환
+_TIME_RE = re.compile(r"^(\d{1,2}):?(\d{2})?$")
+
+
+def parse_time(text):
+    if isinstance(text, int):
+        minutes = text
+    else:
+        m = _TIME_RE.match(re.sub(r"시|분|\s", "", str(text)))
+        if not m:
+            raise EventError(f"시간 형식이 올바르지 않습니다: {text!r}")
+        hour, minute = int(m.group(1)), int(m.group(2) or 0)
+        if minute >= 60:
+            raise EventError(f"분은 0~59 사이여야 합니다: {text!r}")
+        minutes = hour * 60 + minute
+    if not 0 <= minutes <= MINUTES_PER_DAY:
+        raise EventError(f"하루 범위를 벗어난 시간입니다: {text!r}")
+    return minutes
+
+
+def format_time(minutes):
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def parse_day(day):
+    if isinstance(day, int):
+        if 0 <= day < len(DAYS):
+            return day
+    elif day in DAY_INDEX:
+        return DAY_INDEX[day]
+    raise EventError(f"알 수 없는 요일입니다: {day!r}")
+
+
+def parse_kind(kind):
+    if isinstance(kind, int):
+        if 0 <= kind < len(KINDS):
+            return kind
+    elif kind in KIND_INDEX:
+        return KIND_INDEX[kind]
+    raise EventError(f"알 수 없는 일정 종류입니다: {kind!r}")
+
+
+# -------------------------------------------------
+# 이벤트 타입
+# -------------------------------------------------
+# namedtuple 기반이라 인스턴스 dict 가 없고(슬롯), 불변이며 해시 가능하다.
+# day: 요일 인덱스(0=월), start/end: 0시 기준 분, kind: 종류 코드,
+# title_id/sub_id: 인터닝된 제목·부제 id
+class Event(namedtuple("Event", "day start end kind title_id sub_id")):
+    __slots__ = ()
+
+    @property
+    def title(self):
+        return _titles[self.title_id]
+
+    @property
+    def sub(self):
+        return _titles[self.sub_id]
+
+    @property
+    def kind_name(self):
+        return KINDS[self.kind]
+
+    @property
+    def duration(self):
+        return self.end - self.start
+
+    def to_dict(self):
+        d = {
+            "day": DAYS[self.day],
+            "start": format_time(self.start),
+            "end": format_time(self.end),
+            "title": self.title,
+            "kind": self.kind_name,
+        }
+        if self.sub_id:
+            d["sub"] = self.sub
+        return d
+
+
+def make_event(day, start, end, title="", kind=KIND_CLASS, sub=""):
+    """입력값을 검증해서 Event 를 만든다 (데이터 입력 시점에 한 번만 호출)"""
+    s = parse_time(start)
+    e = parse_time(end)
+    if e <= s:
+        raise EventError(f"종료 시간은 시작 시간보다 늦어야 합니다: {start}~{end}")
+    return Event(parse_day(day), s, e, parse_kind(kind), intern_title(title), intern_title(sub))
+
+
+def compile_event(item):
+    """기존 dict 형식({"day","start","end","title","kind","sub"})을 Event 로 변환"""
+    if isinstance(item, Event):
+        return item
+    return make_event(
+        item["day"],
+        item["start"],
+        item["end"],
+        item.get("title", ""),
+        item.get("kind", "class"),
+        item.get("sub", ""),
+    )
+
+
+def compile_events(items):
+    return [compile_event(item) for item in items]
+
+
+# -------------------------------------------------
+# 내용 기반 지문(fingerprint)
+# -------------------------------------------------
+# 같은 내용의 시간표는 세션/프로세스와 무관하게 같은 값이 나오도록
+# 인터닝 id 대신 실제 문자열을 해시에 넣는다. params 로 보기 옵션 등을 섞을 수 있다.
+_EVENT_STRUCT = struct.Struct("<BHHB")
+
+
+def fingerprint(events, *params):
+    h = hashlib.blake2b(digest_size=16)
+    for p in params:
+        h.update(repr(p).encode())
+        h.update(b"\x00")
+    for ev in events:
+        h.update(_EVENT_STRUCT.pack(ev.day, ev.start, ev.end, ev.kind))
+        h.update(_titles[ev.title_id].encode())
+        h.update(b"\x1f")
+        h.update(_titles[ev.sub_id].encode())
+        h.update(b"\x1e")
+    return h.hexdigest()
@@ -0,0 +1,153 @@
+import csv
+import datetime
+import hashlib
+import io
+
+from events import DAYS, format_time
+from semester import DEFAULT_SEMESTER
+
+# -------------------------------------------------
+# 시간표 / 추천 학습 블록 내보내기 (iCalendar / CSV)
+# -------------------------------------------------
+# 큰 문자열 하나를 만들지 않고 줄 단위 제너레이터로 내보낸다.
+# 매주 반복되는 수업은 학기 전체를 펼치지 않고 RRULE 하나로 표현하므로
+# 파일 크기와 생성 시간은 학기 길이와 상관없이 거의 일정하다. 반복 기간은 학기 달력
+# (semester.py) 에서 가져온다 — 화면에서 보고 있는 주와 상관없이 학기 첫 주부터 끝까지.
+# LineStream 으로 감싸면 st.download_button 에 파일 객체로 넘길 수 있다.
+
+TZID = "Asia/Seoul"
+UTC_OFFSET = datetime.timedelta(hours=9)  # _VTIMEZONE 과 같은 고정 오프셋
+PRODID = "-//AI Timetable//KO"
+
+_VTIMEZONE = (
+    "BEGIN:VTIMEZONE",
+    f"TZID:{TZID}",
+    "BEGIN:STANDARD",
+    "DTSTART:19700101T000000",
+    "TZOFFSETFROM:+0900",
+    "TZOFFSETTO:+0900",
+    "TZNAME:KST",
+    "END:STANDARD",
+    "END:VTIMEZONE",
+)
+_ICS_WEEKDAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+
+
+def _escape(text):
+    return text.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+
+
+def _fold(line):
+    """RFC 5545: 75 옥텟마다 줄을 접는다 (UTF-8 문자 중간에서 자르지 않음)"""
+    if len(line.encode()) <= 75:
+        yield line + "\r\n"
+        return
+    chunk, size = [], 0
+    for ch in line:
+        n = len(ch.encode())
+        if size + n > 75:
+            yield "".join(chunk) + "\r\n"
+            chunk, size = [" "], 1
+        chunk.append(ch)
+        size += n
+    yield "".join(chunk) + "\r\n"
+
+
+def _local(date, minutes):
+    # 24:00 (= 1440분) 은 T240000 이 아니라 다음 날 T000000
+    days, minutes = divmod(minutes, 24 * 60)
+    date += datetime.timedelta(days=days)
+    return f"{date:%Y%m%d}T{minutes // 60:02d}{minutes % 60:02d}00"
+
+
+def _uid(*parts):
+    return hashlib.blake2b("\x1f".join(map(str, parts)).encode(), digest_size=12).hexdigest() + "@ai-timetable"
+
+
+def _vevent(uid, stamp, date, start, end, title, sub, kind, rrule=None):
+    yield "BEGIN:VEVENT"
+    yield f"UID:{uid}"
+    yield f"DTSTAMP:{stamp}"
+    yield f"DTSTART;TZID={TZID}:{_local(date, start)}"
+    yield f"DTEND;TZID={TZID}:{_local(date, end)}"
+    if rrule:
+        yield f"RRULE:{rrule}"
+    yield f"SUMMARY:{_escape(title)}"
+    if sub:
+        yield f"DESCRIPTION:{_escape(sub)}"
+    yield f"CATEGORIES:{kind}"
+    yield "END:VEVENT"
+
+
+def iter_ics(events, blocks=(), calendar=DEFAULT_SEMESTER, name="시간표"):
+    """시간표 이벤트는 학기 동안 주간 반복(RRULE)으로, 추천 블록은 날짜 지정 일정으로"""
+    # UNTIL 은 DTSTART 에 TZID 가 있으면 UTC 로 — 학기 마지막 날 23:59:59 (한국 시각)
+    until = datetime.datetime.combine(calendar.end, datetime.time()) - UTC_OFFSET - datetime.timedelta(seconds=1)
+    stamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+    header = ("BEGIN:VCALENDAR", "VERSION:2.0", f"PRODID:{PRODID}", "CALSCALE:GREGORIAN",
+              f"X-WR-CALNAME:{_escape(name)}", f"X-WR-TIMEZONE:{TZID}", *_VTIMEZONE)
+    for line in header:
+        yield from _fold(line)
+
+    for ev in events:
+        first = calendar.start + datetime.timedelta(days=ev.day)
+        rrule = f"FREQ=WEEKLY;BYDAY={_ICS_WEEKDAYS[ev.day]};UNTIL={until:%Y%m%dT%H%M%S}Z"
+        uid = _uid(name, ev.day, ev.start, ev.end, ev.title, ev.sub)
+        for line in _vevent(uid, stamp, first, ev.start, ev.end, ev.title, ev.sub, ev.kind_name, rrule):
+            yield from _fold(line)
+
+    for b in blocks:
+        uid = _uid("block", b.date, b.start, b.assignment_id)
+        for line in _vevent(uid, stamp, b.date, b.start, b.end, b.title, b.reason, "task"):
+            yield from _fold(line)
+
+    yield "END:VCALENDAR\r\n"
+
+
+class _LineWriter:
+    """csv.writer 가 쓴 한 줄을 바로 꺼내 가기 위한 버퍼"""
+
+    def __init__(self):
+        self.line = ""
+
+    def write(self, text):
+        self.line = text
+
+
+def iter_csv(events, blocks=()):
+    """importer.iter_csv 로 다시 읽을 수 있는 형식. 날짜 칸은 추천 블록에만 채운다."""
+    buf = _LineWriter()
+    writer = csv.writer(buf, lineterminator="\r\n")
+    writer.writerow(("day", "start", "end", "title", "kind", "sub", "date"))
+    yield "\ufeff" + buf.line  # 엑셀에서 한글이 깨지지 않도록 BOM
+    for ev in events:
+        writer.writerow((DAYS[ev.day], format_time(ev.start), format_time(ev.end),
+                         ev.title, ev.kind_name, ev.sub, ""))
+        yield buf.line
+    for b in blocks:
+        writer.writerow((DAYS[b.date.weekday()], format_time(b.start), format_time(b.end),
+                         b.title, "task", b.reason, b.date.isoformat()))
+        yield buf.line
+
+
+class LineStream(io.RawIOBase):
+    """문자열 제너레이터를 UTF-8 바이트 파일 객체로 (필요한 만큼만 당겨 읽음)"""
+
+    def __init__(self, lines):
+        self._lines = iter(lines)
+        self._pending = b""
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while not self._pending:
+            line = next(self._lines, None)
+            if line is None:
+                return 0
+            self._pending = line.encode()
+        n = min(len(buffer), len(self._pending))
+        buffer[:n] = self._pending[:n]
+        self._pending = self._pending[n:]
+        return n
@@ -0,0 +1,121 @@
+from events import DAYS, KIND_FREE, Event, format_time, intern_title, parse_time
+
+# -------------------------------------------------
+# 공강(빈 시간) 찾기
+# -------------------------------------------------
+# no-touch.tsx 의 findFreeSlots 는 고정된 1시간 칸마다 모든 수업과 겹침을
+# 검사한다(O(칸 × 수업)). 여기서는 요일별로 바쁜 구간을 정렬·병합한 뒤
+# 한 번 훑는 sweep line 으로 빈 구간을 구한다. 전체 O(n log n).
+#
+# 결과는 kind=KIND_FREE 인 Event 리스트라 timetable_html 에 그대로 겹쳐 그릴 수 있다.
+
+FREE_TITLE = "공강"
+
+
+def _merge(intervals):
+    """정렬 후 겹치거나 맞닿은 구간을 합친다"""
+    merged = []
+    for s, e in sorted(intervals):
+        if merged and s <= merged[-1][1]:
+            if e > merged[-1][1]:
+                merged[-1][1] = e
+        else:
+            merged.append([s, e])
+    return merged
+
+
+def _windows(ranges):
+    """[("12:00", "13:00"), ...] 또는 [(720, 780), ...] 를 병합된 분 단위 구간으로"""
+    return _merge((parse_time(s), parse_time(e)) for s, e in ranges)
+
+
+def _subtract(free, busy):
+    """정렬·병합된 두 구간 리스트에 대해 free - busy (투 포인터)"""
+    out = []
+    j = 0
+    for s, e in free:
+        while j < len(busy) and busy[j][1] <= s:
+            j += 1
+        k = j
+        cur = s
+        while k < len(busy) and busy[k][0] < e:
+            if busy[k][0] > cur:
+                out.append((cur, busy[k][0]))
+            cur = max(cur, busy[k][1])
+            k += 1
+        if cur < e:
+            out.append((cur, e))
+    return out
+
+
+def _intersect(free, allowed):
+    """정렬·병합된 두 구간 리스트의 교집합 (투 포인터)"""
+    out = []
+    i = j = 0
+    while i < len(free) and j < len(allowed):
+        s = max(free[i][0], allowed[j][0])
+        e = min(free[i][1], allowed[j][1])
+        if s < e:
+            out.append((s, e))
+        if free[i][1] < allowed[j][1]:
+            i += 1
+        else:
+            j += 1
+    return out
+
+
+def free_ranges(events, days=(0, 1, 2, 3, 4), day_start="09:00", day_end="17:00",
+                min_minutes=30, avoid=(), preferred=()):
+    """요일 인덱스 -> [(시작분, 끝분), ...] 빈 구간
+
+    avoid: 피하고 싶은 시간대 (모든 요일에 적용, 빈 시간에서 제외)
+    preferred: 선호 시간대 (지정하면 이 안의 빈 시간만 남김)
+    """
+    lo, hi = parse_time(day_start), parse_time(day_end)
+    avoid = _windows(avoid)
+    preferred = _windows(preferred)
+
+    busy = {d: [] for d in days}
+    for ev in events:
+        if ev.day in busy and ev.kind != KIND_FREE:
+            busy[ev.day].append((ev.start, ev.end))
+
+    result = {}
+    for d in days:
+        # sweep: 병합된 바쁜 구간 사이의 틈이 빈 시간
+        free = []
+        cur = lo
+        for s, e in _merge(busy[d]):
+            if e <= cur:
+                continue
+            if s >= hi:
+                break
+            if s > cur:
+                free.append((cur, s))
+            cur = max(cur, e)
+        if cur < hi:
+            free.append((cur, hi))
+
+        if avoid:
+            free = _subtract(free, avoid)
+        if preferred:
+            free = _intersect(free, preferred)
+        result[d] = [(s, e) for s, e in free if e - s >= min_minutes]
+    return result
+
+
+def find_free_slots(events, days=(0, 1, 2, 3, 4), day_start="09:00", day_end="17:00",
+                    min_minutes=30, avoid=(), preferred=()):
+    """빈 시간을 요일·시간순 Event(kind=KIND_FREE) 리스트로 돌려준다"""
+    ranges = free_ranges(events, days, day_start, day_end, min_minutes, avoid, preferred)
+    title_id = intern_title(FREE_TITLE)
+    return [
+        Event(d, s, e, KIND_FREE, title_id, 0)
+        for d in sorted(ranges)
+        for s, e in ranges[d]
+    ]
+
+
+def describe(slot):
+    """사람이 읽는 형태: '월 12:00-13:00 (60분)'"""
+    return f"{DAYS[slot.day]} {format_time(slot.start)}-{format_time(slot.end)} ({slot.duration}분)"
@@ -0,0 +1,383 @@
+import math
+
+import numpy as np
+
+# -------------------------------------------------
+# 성적 분석 (열 단위 NumPy 배열)
+# -------------------------------------------------
+# 과목 한 줄마다 객체를 두고 매 rerun 마다 학기별/영역별로 다시 합산하면
+# 학기가 많은 사용자나 학과 전체(수천 명) 통계에서 느려진다.
+#
+#   - 과목은 열(column) 배열로 보관한다: 학생, 학기, 영역, 학점, 평점, 점수
+#     (학생/학기/영역 이름은 정수 코드로 바꿔 둔다)
+#   - (학생 × 학기), (학생 × 영역) 합계 배열을 유지한다 — 평점에 들어가는 학점,
+#     학점 × 평점, 취득 학점. 과목을 추가하면 np.add.at 으로 한 번에 더하고,
+#     성적 하나를 바꾸면 그 과목의 이전 기여를 빼고 새 기여를 더한다 (O(1)).
+#   - 평점 추이, 학기/영역별 평균, 학과 전체 누적 평점은 합계 배열에서 벡터 연산으로
+#     만든다. 학과 전체 누적 평점은 캐시해 두고 바뀐 학생 줄만 다시 계산한다.
+#
+# 평점은 4.3 만점 (A+ 4.3 ~ D- 0.7, F 0). P/NP 는 학점에만 들어가고 평점에는 안 들어간다.
+
+GRADE_POINTS = {
+    "A+": 4.3, "A0": 4.0, "A-": 3.7,
+    "B+": 3.3, "B0": 3.0, "B-": 2.7,
+    "C+": 2.3, "C0": 2.0, "C-": 1.7,
+    "D+": 1.3, "D0": 1.0, "D-": 0.7,
+    "F": 0.0,
+}
+PASS_GRADES = ("P", "NP")
+GRADES = (*GRADE_POINTS, *PASS_GRADES)
+MAX_POINTS = 4.3
+
+CATEGORIES = ("전공", "교양", "일반선택")
+
+
+class GradeError(ValueError):
+    """잘못된 성적/학점/점수가 입력되었을 때 발생"""
+
+
+def grade_values(grade):
+    """성적 -> (평점 또는 NaN, 취득 여부). None 은 아직 성적이 없는 과목 (수강 중/계획)"""
+    if grade is None:
+        return math.nan, False
+    if grade in GRADE_POINTS:
+        points = GRADE_POINTS[grade]
+        return points, points > 0
+    if grade in PASS_GRADES:
+        return math.nan, grade == "P"
+    raise GradeError(f"알 수 없는 성적입니다: {grade!r}")
+
+
+def letter_for(points):
+    """평점 이상인 가장 낮은 성적 (목표 평점 계산 결과를 글자로 보여 줄 때)"""
+    for grade, value in reversed(GRADE_POINTS.items()):
+        if value >= points - 1e-9:
+            return grade
+    return None  # 만점으로도 안 됨
+
+
+class _Codes:
+    """이름 <-> 정수 코드 (넣은 순서대로 0, 1, 2, ...)"""
+
+    __slots__ = ("names", "index")
+
+    def __init__(self, names=()):
+        self.names = []
+        self.index = {}
+        for name in names:
+            self.code(name)
+
+    def code(self, name):
+        i = self.index.get(name)
+        if i is None:
+            i = self.index[name] = len(self.names)
+            self.names.append(name)
+        return i
+
+    def __len__(self):
+        return len(self.names)
+
+
+# -------------------------------------------------
+# 성적부
+# -------------------------------------------------
+class GradeBook:
+    _COLUMNS = (
+        ("student", np.int32),
+        ("semester", np.int32),
+        ("category", np.int32),
+        ("credits", np.float64),
+        ("points", np.float64),  # NaN = 평점에 안 들어감 (P/NP/미입력)
+        ("earned", np.bool_),
+        ("score", np.float64),  # 원점수 0~100, NaN = 없음
+    )
+
+    def __init__(self, capacity=64):
+        self.students = _Codes()
+        self.semesters = _Codes()
+        self.categories = _Codes(CATEGORIES)
+        self.titles = []
+        self.grades = []  # 과목별 성적 문자열 (표시용)
+        self.size = 0
+        self._cols = {name: np.zeros(capacity, dtype) for name, dtype in self._COLUMNS}
+        # 합계 배열 (학생 × 학기 / 학생 × 영역)
+        self._sem_credits = np.zeros((0, 0))  # 평점에 들어가는 학점
+        self._sem_weighted = np.zeros((0, 0))  # 학점 × 평점
+        self._sem_earned = np.zeros((0, 0))  # 취득 학점
+        self._cat_credits = np.zeros((0, 0))
+        self._cat_weighted = np.zeros((0, 0))
+        # 학생별 점수 합계 (학점 가중 평균/표준편차용)
+        self._score_w = np.zeros(0)
+        self._score_wx = np.zeros(0)
+        self._score_wxx = np.zeros(0)
+        # 학과 전체 누적 평점 캐시 + 다시 계산할 학생
+        self._cum_gpa = None
+        self._dirty = set()
+
+    def __len__(self):
+        return self.size
+
+    def column(self, name):
+        """채워진 부분의 열 배열 (읽기 전용으로 쓴다)"""
+        return self._cols[name][:self.size]
+
+    # -------------------------------------------------
+    # 쓰기
+    # -------------------------------------------------
+    def _reserve(self, n):
+        need = self.size + n
+        cap = len(self._cols["credits"])
+        if need > cap:
+            cap = max(need, cap * 2)
+            for name, col in self._cols.items():
+                grown = np.zeros(cap, col.dtype)
+                grown[:self.size] = col[:self.size]
+                self._cols[name] = grown
+        # 새 학생/학기/영역이 생겼으면 합계 배열을 넓힌다
+        shape = (len(self.students), len(self.semesters))
+        if self._sem_credits.shape != shape:
+            self._sem_credits = _pad(self._sem_credits, shape)
+            self._sem_weighted = _pad(self._sem_weighted, shape)
+            self._sem_earned = _pad(self._sem_earned, shape)
+        shape = (len(self.students), len(self.categories))
+        if self._cat_credits.shape != shape:
+            self._cat_credits = _pad(self._cat_credits, shape)
+            self._cat_weighted = _pad(self._cat_weighted, shape)
+        if len(self._score_w) != len(self.students):
+            self._score_w = _pad(self._score_w, (len(self.students),))
+            self._score_wx = _pad(self._score_wx, (len(self.students),))
+            self._score_wxx = _pad(self._score_wxx, (len(self.students),))
+            self._cum_gpa = None
+
+    def add_courses(self, rows):
+        """(학생, 학기, 과목명, 학점, 성적, 영역, 점수) 튜플들을 한 번에 추가 -> 행 번호 범위"""
+        rows = list(rows)
+        for student, semester, title, credits, grade, category, score in rows:
+            if not 0 < credits <= 30:
+                raise GradeError(f"학점이 올바르지 않습니다: {title} {credits}")
+            if score is not None and not 0 <= score <= 100:
+                raise GradeError(f"점수는 0~100 사이여야 합니다: {title} {score}")
+            grade_values(grade)
+        # 검증이 끝난 뒤에만 코드/이름을 늘린다 (중간에 실패해도 성적부는 그대로)
+        parsed = []
+        for student, semester, title, credits, grade, category, score in rows:
+            points, earned = grade_values(grade)
+            parsed.append((self.students.code(student), self.semesters.code(semester),
+                           self.categories.code(category), credits, points, earned,
+                           math.nan if score is None else score))
+            self.titles.append(title)
+            self.grades.append(grade)
+        first = self.size
+        self._reserve(len(parsed))
+        if parsed:
+            for (name, dtype), values in zip(self._COLUMNS, zip(*parsed)):
+                self._cols[name][first:first + len(parsed)] = np.asarray(values, dtype)
+            self.size += len(parsed)
+            self._apply(np.arange(first, self.size), 1.0)
+        return range(first, self.size)
+
+    def add_course(self, student, semester, title, credits, grade=None, category="전공", score=None):
+        return self.add_courses([(student, semester, title, credits, grade, category, score)])[0]
+
+    def set_grade(self, row, grade, score=None):
+        """성적 하나 변경 — 그 과목의 기여만 빼고 다시 더한다"""
+        if not 0 <= row < self.size:
+            raise GradeError(f"없는 과목입니다: {row}")
+        if score is not None and not 0 <= score <= 100:
+            raise GradeError(f"점수는 0~100 사이여야 합니다: {score}")
+        points, earned = grade_values(grade)
+        rows = np.array([row])
+        self._apply(rows, -1.0)
+        self._cols["points"][row] = points
+        self._cols["earned"][row] = earned
+        if score is not None:
+            self._cols["score"][row] = score
+        self.grades[row] = grade
+        self._apply(rows, 1.0)
+
+    def _apply(self, rows, sign):
+        """rows 과목들의 기여를 합계 배열에 더하거나(sign=1) 뺀다(-1)"""
+        c = self._cols
+        student, semester, category = c["student"][rows], c["semester"][rows], c["category"][rows]
+        credits, points = c["credits"][rows], c["points"][rows]
+        graded = ~np.isnan(points)
+        gpa_credits = np.where(graded, credits, 0.0) * sign
+        weighted = np.where(graded, credits * np.nan_to_num(points), 0.0) * sign
+        earned = np.where(c["earned"][rows], credits, 0.0) * sign
+        np.add.at(self._sem_credits, (student, semester), gpa_credits)
+        np.add.at(self._sem_weighted, (student, semester), weighted)
+        np.add.at(self._sem_earned, (student, semester), earned)
+        np.add.at(self._cat_credits, (student, category), gpa_credits)
+        np.add.at(self._cat_weighted, (student, category), weighted)
+
+        score = c["score"][rows]
+        has_score = ~np.isnan(score)
+        w = np.where(has_score, credits, 0.0) * sign
+        x = np.nan_to_num(score)
+        np.add.at(self._score_w, student, w)
+        np.add.at(self._score_wx, student, w * x)
+        np.add.at(self._score_wxx, student, w * x * x)
+
+        if self._cum_gpa is not None:
+            self._dirty.update(np.unique(student).tolist())
+
+    # -------------------------------------------------
+    # 한 학생
+    # -------------------------------------------------
+    def _student(self, student):
+        i = self.students.index.get(student)
+        if i is None:
+            raise GradeError(f"성적이 없는 학생입니다: {student!r}")
+        return i
+
+    def semester_order(self):
+        """학기 코드를 이름순("2024-1" < "2024-2" < "2025-1")으로"""
+        return np.array(sorted(range(len(self.semesters)), key=self.semesters.names.__getitem__), dtype=np.intp)
+
+    def trend(self, student):
+        """학기순 (학기 이름, 학기 평점, 누적 평점, 취득 학점) — 성적이 없는 학기는 평점 NaN"""
+        i = self._student(student)
+        order = self.semester_order()
+        credits = self._sem_credits[i, order]
+        weighted = self._sem_weighted[i, order]
+        earned = self._sem_earned[i, order]
+        taken = (credits > 0) | (earned > 0)
+        order, credits, weighted, earned = order[taken], credits[taken], weighted[taken], earned[taken]
+        cum_c, cum_w = np.cumsum(credits), np.cumsum(weighted)
+        return (
+            [self.semesters.names[k] for k in order],
+            _ratio(weighted, credits),
+            _ratio(cum_w, cum_c),
+            earned,
+        )
+
+    def category_averages(self, student):
+        """영역 이름 -> (평점, 평점에 들어간 학점)"""
+        i = self._student(student)
+        gpa = _ratio(self._cat_weighted[i], self._cat_credits[i])
+        return {
+            name: (gpa[k], self._cat_credits[i, k])
+            for k, name in enumerate(self.categories.names)
+            if self._cat_credits[i, k] > 0
+        }
+
+    def summary(self, student):
+        """누적 평점, 평점에 들어간 학점, 취득 학점, 학점 가중 점수 평균/표준편차"""
+        i = self._student(student)
+        credits = self._sem_credits[i].sum()
+        w = self._score_w[i]
+        mean = self._score_wx[i] / w if w else math.nan
+        var = self._score_wxx[i] / w - mean * mean if w else math.nan
+        return {
+            "gpa": self._sem_weighted[i].sum() / credits if credits else math.nan,
+            "gpa_credits": credits,
+            "earned": self._sem_earned[i].sum(),
+            "score_mean": mean,
+            "score_std": math.sqrt(max(var, 0.0)) if w else math.nan,
+        }
+
+    def needed_average(self, student, target, remaining_credits):
+        """남은 학점에서 평균 몇 점을 받아야 누적 평점이 target 이 되는지 (None: 남은 학점 없음)"""
+        if remaining_credits <= 0:
+            return None
+        i = self._student(student)
+        credits = self._sem_credits[i].sum()
+        weighted = self._sem_weighted[i].sum()
+        return (target * (credits + remaining_credits) - weighted) / remaining_credits
+
+    def courses(self, student):
+        """그 학생의 과목 행 번호 (학기순)"""
+        i = self._student(student)
+        rows = np.flatnonzero(self.column("student") == i)
+        rank = np.empty(len(self.semesters), np.intp)
+        rank[self.semester_order()] = np.arange(len(self.semesters))
+        return rows[np.argsort(rank[self.column("semester")[rows]], kind="stable")]
+
+    # -------------------------------------------------
+    # 학과 전체
+    # -------------------------------------------------
+    def cumulative_gpas(self):
+        """학생 코드 순 누적 평점 배열 (캐시 — 바뀐 학생 줄만 다시 계산)"""
+        if self._cum_gpa is None or len(self._cum_gpa) != len(self.students):
+            self._cum_gpa = _ratio(self._sem_weighted.sum(axis=1), self._sem_credits.sum(axis=1))
+            self._dirty.clear()
+        elif self._dirty:
+            rows = np.fromiter(self._dirty, np.intp, len(self._dirty))
+            self._cum_gpa[rows] = _ratio(self._sem_weighted[rows].sum(axis=1), self._sem_credits[rows].sum(axis=1))
+            self._dirty.clear()
+        return self._cum_gpa
+
+    def percentile(self, gpa):
+        """학과 전체 누적 평점 중 gpa 보다 낮은 비율 (0~1)"""
+        all_gpa = self.cumulative_gpas()
+        valid = all_gpa[~np.isnan(all_gpa)]
+        if not len(valid) or math.isnan(gpa):
+            return math.nan
+        return np.count_nonzero(valid < gpa) / len(valid)
+
+    def semester_means(self):
+        """학기순 (학기 이름, 학과 평균 학기 평점) — 학생 평균은 학점 가중 없이"""
+        order = self.semester_order()
+        gpa = _ratio(self._sem_weighted[:, order], self._sem_credits[:, order])
+        with np.errstate(invalid="ignore"):
+            counts = np.count_nonzero(~np.isnan(gpa), axis=0)
+            means = np.where(counts > 0, np.nansum(gpa, axis=0) / np.maximum(counts, 1), np.nan)
+        return [self.semesters.names[k] for k in order], means
+
+
+def _pad(array, shape):
+    grown = np.zeros(shape)
+    grown[tuple(slice(0, n) for n in array.shape)] = array
+    return grown
+
+
+def _ratio(num, den):
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(den > 0, num / np.where(den > 0, den, 1), np.nan)
+
+
+# -------------------------------------------------
+# 데모 데이터
+# -------------------------------------------------
+DEMO_COURSES = [
+    # (학기, 과목명, 학점, 성적, 영역, 점수)
+    ("2024-1", "미적분학", 3, "A0", "교양", 91),
+    ("2024-1", "프로그래밍 기초", 3, "A+", "전공", 97),
+    ("2024-1", "글쓰기", 2, "B+", "교양", 85),
+    ("2024-1", "채플", 1, "P", "일반선택", None),
+    ("2024-2", "선형대수", 3, "B0", "교양", 80),
+    ("2024-2", "자료구조 입문", 3, "A-", "전공", 90),
+    ("2024-2", "심리학개론", 3, "A0", "일반선택", 93),
+    ("2025-1", "데이터구조", 3, "A0", "전공", 92),
+    ("2025-1", "알고리즘", 3, "B+", "전공", 86),
+    ("2025-1", "확률과 통계", 3, "B+", "교양", 84),
+    ("2025-2", "운영체제", 3, None, "전공", None),
+    ("2025-2", "데이터베이스", 3, None, "전공", None),
+    ("2025-2", "인공지능", 3, None, "전공", None),
+]
+
+
+def demo_gradebook(student="me"):
+    """세션마다 새 성적부 (성적을 바꿀 수 있으므로)"""
+    book = GradeBook()
+    book.add_courses((student, sem, title, credits, grade, cat, score)
+                     for sem, title, credits, grade, cat, score in DEMO_COURSES)
+    return book
+
+
+def synthetic_department(students=2000, semesters=("2024-1", "2024-2", "2025-1"), per_semester=6, seed=0):
+    """학과 전체 비교용 합성 성적부 (같은 seed 면 항상 같다)"""
+    rng = np.random.default_rng(seed)
+    letters = np.array(list(GRADE_POINTS))
+    n = students * len(semesters) * per_semester
+    # 학생마다 실력 차이를 두고 그 주변에서 성적을 뽑는다
+    skill = rng.normal(0, 2.0, students).repeat(len(semesters) * per_semester)
+    idx = np.clip(np.rint(3 + skill + rng.normal(0, 1.5, n)), 0, len(letters) - 1).astype(int)
+    credits = rng.choice((2, 3, 3, 3), n)
+    book = GradeBook(capacity=n)
+    book.add_courses(
+        (f"s{k // (len(semesters) * per_semester)}", semesters[k // per_semester % len(semesters)],
+         "", int(credits[k]), str(letters[idx[k]]), CATEGORIES[k % 2], None)
+        for k in range(n)
+    )
+    return book
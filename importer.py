@@ -0,0 +1,221 @@
+import csv
+from dataclasses import dataclass, field
+import datetime
+import io
+import time
+import zoneinfo
+
+from events import DAY_INDEX, KIND_INDEX, EventError, make_event
+
+# -------------------------------------------------
+# 시간표 일괄 가져오기 (CSV / iCalendar)
+# -------------------------------------------------
+# 파일 전체를 읽지 않고 한 줄씩 제너레이터로 파싱한다.
+#   - 요일/시간을 검증·정규화해서 Event 로 만들고 (events.make_event)
+#   - 요일별 1440칸 비트맵으로 겹침을 바로 검사하고
+#   - batch_size 개씩 모아 저장소에 한 트랜잭션으로 쓴다.
+# 메모리는 배치 크기 + 요일별 비트맵(7 × 1440 바이트)으로 고정이라
+# 학과 전체 내보내기(10만 행 이상)도 같은 메모리로 처리된다.
+
+IMPORT_TZ = zoneinfo.ZoneInfo("Asia/Seoul")
+MAX_ERRORS = 50  # 보고서에 남길 거부 행 수 (개수는 전부 센다)
+
+_DAY_ALIASES = dict(DAY_INDEX)
+_DAY_ALIASES.update({d: i for i, d in enumerate(("mon", "tue", "wed", "thu", "fri", "sat", "sun"))})
+_DAY_ALIASES.update({f"{d}요일": i for d, i in DAY_INDEX.items()})
+
+_CSV_COLUMNS = {
+    "day": ("day", "요일"),
+    "start": ("start", "시작", "시작시간"),
+    "end": ("end", "종료", "종료시간", "끝"),
+    "title": ("title", "subject", "과목", "제목"),
+    "kind": ("kind", "종류"),
+    "sub": ("sub", "memo", "메모", "비고"),
+}
+_CSV_ORDER = ("day", "start", "end", "title", "kind", "sub")
+
+
+@dataclass
+class ImportReport:
+    rows: int = 0
+    imported: int = 0
+    rejected: int = 0
+    overlaps: int = 0
+    seconds: float = 0.0
+    errors: list = field(default_factory=list)  # [(줄 번호, 사유), ...] 앞쪽 MAX_ERRORS 개
+
+    @property
+    def rows_per_sec(self):
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def reject(self, line_no, reason):
+        self.rejected += 1
+        if len(self.errors) < MAX_ERRORS:
+            self.errors.append((line_no, reason))
+
+
+def _day(text):
+    key = str(text).strip().lower()
+    if key not in _DAY_ALIASES:
+        raise EventError(f"알 수 없는 요일입니다: {text!r}")
+    return _DAY_ALIASES[key]
+
+
+# -------------------------------------------------
+# CSV
+# -------------------------------------------------
+def iter_csv(lines):
+    """(줄 번호, Event 또는 EventError) 를 하나씩 내보낸다"""
+    reader = csv.reader(lines)
+    columns = None
+    for row in reader:
+        line_no = reader.line_num
+        if not row or not any(cell.strip() for cell in row):
+            continue
+        if columns is None:
+            header = [cell.strip().lower() for cell in row]
+            found = {name: header.index(alias)
+                     for name, aliases in _CSV_COLUMNS.items()
+                     for alias in aliases if alias in header}
+            if "day" in found and "start" in found:
+                columns = found
+                continue
+            columns = {name: i for i, name in enumerate(_CSV_ORDER)}  # 헤더 없음: 기본 순서
+
+        def cell(name, default=""):
+            i = columns.get(name)
+            return row[i].strip() if i is not None and i < len(row) else default
+
+        try:
+            yield line_no, make_event(
+                _day(cell("day")), cell("start"), cell("end"),
+                cell("title"), cell("kind") or "class", cell("sub"),
+            )
+        except EventError as e:
+            yield line_no, e
+
+
+# -------------------------------------------------
+# iCalendar
+# -------------------------------------------------
+def _unfold(lines):
+    """접힌 줄(공백/탭으로 시작)을 이어 붙여 (줄 번호, 논리 줄) 로"""
+    pending, pending_no = None, 0
+    for no, raw in enumerate(lines, 1):
+        line = raw.rstrip("\r\n")
+        if line[:1] in (" ", "\t") and pending is not None:
+            pending += line[1:]
+            continue
+        if pending is not None:
+            yield pending_no, pending
+        pending, pending_no = line, no
+    if pending is not None:
+        yield pending_no, pending
+
+
+def _ics_datetime(params, value):
+    if "VALUE=DATE" in params or len(value) == 8:
+        raise EventError("종일 일정은 시간표에 넣을 수 없습니다")
+    dt = datetime.datetime.strptime(value.rstrip("Z"), "%Y%m%dT%H%M%S")
+    if value.endswith("Z"):
+        dt = dt.replace(tzinfo=datetime.timezone.utc).astimezone(IMPORT_TZ)
+    return dt
+
+
+def _ics_text(value):
+    return value.replace("\\n", " ").replace("\\,", ",").replace("\\;", ";").replace("\\\\", "\\")
+
+
+def iter_ics(lines):
+    """VEVENT 마다 (시작 줄 번호, Event 또는 EventError). 반복 규칙은 요일 하나로 본다."""
+    props, start_no = None, 0
+    for no, line in _unfold(lines):
+        if line == "BEGIN:VEVENT":
+            props, start_no = {}, no
+            continue
+        if props is None:
+            continue
+        if line == "END:VEVENT":
+            try:
+                yield start_no, _ics_event(props)
+            except (EventError, ValueError) as e:
+                yield start_no, EventError(str(e))
+            props = None
+            continue
+        name, _, value = line.partition(":")
+        key, _, params = name.partition(";")
+        props[key.upper()] = (params.upper(), value)
+
+
+def _ics_event(props):
+    if "DTSTART" not in props:
+        raise EventError("DTSTART 가 없습니다")
+    if "DTEND" not in props:
+        raise EventError("DTEND 가 없습니다")
+    start = _ics_datetime(*props["DTSTART"])
+    end = _ics_datetime(*props["DTEND"])
+    end_minute = end.hour * 60 + end.minute
+    if end.date() != start.date():
+        # 자정에 끝나는 일정은 DTEND 가 다음 날 00:00 — 24:00 으로 읽는다
+        if end_minute or end.second or end.date() - start.date() != datetime.timedelta(days=1):
+            raise EventError("하루를 넘는 일정은 시간표에 넣을 수 없습니다")
+        end_minute = 24 * 60
+    kind = props.get("CATEGORIES", ("", "class"))[1].strip().lower()
+    return make_event(
+        start.weekday(),
+        start.hour * 60 + start.minute,
+        end_minute,
+        _ics_text(props.get("SUMMARY", ("", ""))[1]),
+        kind if kind in KIND_INDEX else "class",
+        _ics_text(props.get("DESCRIPTION", ("", ""))[1]),
+    )
+
+
+# -------------------------------------------------
+# 저장소로 가져오기
+# -------------------------------------------------
+def import_rows(rows, store, tt_id, batch_size=1000, skip_overlaps=False):
+    """(줄 번호, Event|EventError) 스트림을 저장소에 배치로 쓴다"""
+    report = ImportReport()
+    coverage = [bytearray(24 * 60) for _ in range(7)]  # 요일별 분 단위 점유 비트맵
+    for ev in store.load_events(tt_id):  # 이미 있는 일정과의 겹침도 센다
+        coverage[ev.day][ev.start:ev.end] = b"\x01" * ev.duration
+    batch = []
+    started = time.perf_counter()
+
+    for line_no, item in rows:
+        report.rows += 1
+        if isinstance(item, EventError):
+            report.reject(line_no, str(item))
+            continue
+        cov = coverage[item.day]
+        if cov.find(1, item.start, item.end) != -1:
+            report.overlaps += 1
+            if skip_overlaps:
+                report.reject(line_no, "다른 일정과 겹칩니다")
+                continue
+        cov[item.start:item.end] = b"\x01" * item.duration
+        batch.append(item)
+        if len(batch) >= batch_size:
+            store.add_events(tt_id, batch)
+            report.imported += len(batch)
+            batch.clear()
+
+    if batch:
+        store.add_events(tt_id, batch)
+        report.imported += len(batch)
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+def import_file(fileobj, filename, store, tt_id, **options):
+    """업로드된 바이너리 파일을 확장자에 따라 CSV/ICS 로 스트리밍 가져오기"""
+    text = io.TextIOWrapper(fileobj, encoding="utf-8-sig", newline="")
+    if filename.lower().endswith(".ics"):
+        rows = iter_ics(text)
+    else:
+        rows = iter_csv(text)
+    try:
+        return import_rows(rows, store, tt_id, **options)
+    finally:
+        text.detach()  # 업로드 객체는 Streamlit 이 닫는다
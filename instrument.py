@@ -0,0 +1,183 @@
+from collections import defaultdict, deque
+import json
+import os
+import sys
+import threading
+import time
+
+import streamlit as st
+
+# -------------------------------------------------
+# rerun 계측 (구간 타이머 / 카운터 / 마크다운 바이트)
+# -------------------------------------------------
+# "앱이 느리다"고 할 때 시간이 상태 초기화, CSS, 시간표 HTML 조립, 위젯 배치 중
+# 어디에 드는지 보려고 쓴다.
+#
+#   with instrument.section("render_timetable"):   # 중첩하면 "tab:홈/render_timetable"
+#       ...
+#   instrument.count("render_cache_miss")
+#   st.markdown(instrument.payload("timetable", html), unsafe_allow_html=True)
+#
+# 꺼져 있으면 section() 은 미리 만든 빈 컨텍스트, count()/payload() 는 바로 반환이라
+# 스레드 로컬 조회 한 번 정도의 비용만 든다.
+# 켜는 방법: 환경 변수 AI_TIMETABLE_PROFILE=1 (전체) 또는 URL 에 ?debug=1 (그 세션만).
+# 켜져 있으면 rerun 마다 한 줄짜리 JSON 기록을 AI_TIMETABLE_PROFILE_LOG
+# (기본 profile.jsonl)에 덧붙이고, 설정 탭에 숨은 디버그 패널을 보여 준다.
+#
+#   python instrument.py profile.jsonl     # 구간별 p50/p95 집계
+
+ENABLED = os.environ.get("AI_TIMETABLE_PROFILE", "") not in ("", "0")
+LOG_PATH = os.environ.get("AI_TIMETABLE_PROFILE_LOG", "profile.jsonl")
+KEEP_RECORDS = 20  # 세션에 남길 최근 기록 수 (디버그 패널용)
+
+_RECORDS_KEY = "_instrument_records"
+
+_local = threading.local()
+_log_lock = threading.Lock()
+
+
+class _Null:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL = _Null()
+
+
+class _Run:
+    __slots__ = ("app", "started", "sections", "counters", "payloads", "stack")
+
+    def __init__(self, app):
+        self.app = app
+        self.started = time.perf_counter()
+        self.sections = defaultdict(float)  # 구간 경로 -> 초 (같은 구간이 여러 번이면 합)
+        self.counters = defaultdict(int)
+        self.payloads = defaultdict(int)  # 이름 -> 바이트
+        self.stack = []
+
+
+class _Section:
+    __slots__ = ("run", "name", "path", "started")
+
+    def __init__(self, run, name):
+        self.run = run
+        self.name = name
+
+    def __enter__(self):
+        self.path = "/".join((*self.run.stack, self.name))
+        self.run.stack.append(self.name)
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.run.sections[self.path] += time.perf_counter() - self.started
+        self.run.stack.pop()
+        return False
+
+
+def enabled():
+    return getattr(_local, "run", None) is not None
+
+
+def begin_run(app):
+    """스크립트 맨 앞에서 호출 — 이번 실행을 계측할지 정한다"""
+    on = ENABLED or st.query_params.get("debug") == "1"
+    _local.run = _Run(app) if on else None
+
+
+def section(name):
+    run = getattr(_local, "run", None)
+    if run is None:
+        return _NULL
+    return _Section(run, name)
+
+
+def count(name, n=1):
+    run = getattr(_local, "run", None)
+    if run is not None:
+        run.counters[name] += n
+
+
+def payload(name, body):
+    """st.markdown 에 넘길 문자열의 바이트 수를 기록하고 그대로 돌려준다"""
+    run = getattr(_local, "run", None)
+    if run is not None:
+        run.payloads[name] += len(body.encode())
+    return body
+
+
+def end_run(**fields):
+    """스크립트 맨 끝에서 호출 — 기록을 로그 파일과 세션에 남긴다"""
+    run = getattr(_local, "run", None)
+    _local.run = None
+    if run is None:
+        return None
+    total = time.perf_counter() - run.started
+    top = sum(v for k, v in run.sections.items() if "/" not in k)
+    record = {
+        "ts": time.time(),
+        "app": run.app,
+        **fields,
+        "total_ms": total * 1000,
+        "sections_ms": {k: v * 1000 for k, v in run.sections.items()},
+        "other_ms": (total - top) * 1000,  # 구간 밖 (위젯 배치 등)
+        "counters": dict(run.counters),
+        "payload_bytes": dict(run.payloads),
+    }
+    line = json.dumps(record, ensure_ascii=False)
+    with _log_lock:
+        with open(LOG_PATH, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+    st.session_state.setdefault(_RECORDS_KEY, deque(maxlen=KEEP_RECORDS)).append(record)
+    return record
+
+
+def render_panel():
+    """설정 탭의 디버그 패널 (계측이 켜져 있을 때만)"""
+    if not enabled():
+        return
+    records = list(st.session_state.get(_RECORDS_KEY, ()))
+    with st.expander("🛠 디버그: rerun 계측"):
+        if not records:
+            st.caption("아직 기록이 없습니다 (다음 rerun 부터 표시).")
+            return
+        last = records[-1]
+        st.caption(f"직전 실행 {last['total_ms']:.1f}ms · 최근 {len(records)}회 평균 "
+                   f"{sum(r['total_ms'] for r in records) / len(records):.1f}ms · 로그 {LOG_PATH}")
+        st.json(last, expanded=False)
+
+
+# -------------------------------------------------
+# 로그 집계 (명령줄)
+# -------------------------------------------------
+def _percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def summarize(lines):
+    """JSON 기록 줄들 -> (앱, 구간)별 횟수/p50/p95 한 줄씩"""
+    samples = defaultdict(list)
+    for line in lines:
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        samples[(record["app"], "total")].append(record["total_ms"])
+        samples[(record["app"], "other")].append(record["other_ms"])
+        for path, ms in record["sections_ms"].items():
+            samples[(record["app"], path)].append(ms)
+        for name, size in record["payload_bytes"].items():
+            samples[(record["app"], f"bytes:{name}")].append(size)
+    for (app, path), values in sorted(samples.items()):
+        yield f"{app:10} {path:40} n={len(values):<5} p50={_percentile(values, 0.5):10.1f} p95={_percentile(values, 0.95):10.1f}"
+
+
+if __name__ == "__main__":
+    with open(sys.argv[1] if len(sys.argv) > 1 else LOG_PATH, encoding="utf-8") as f:
+        for row in summarize(f):
+            print(row)
@@ -0,0 +1,152 @@
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+
+# -------------------------------------------------
+# 백그라운드 추천 작업
+# -------------------------------------------------
+# 추천 계산(로컬 스케줄러, Gemini 호출)을 스크립트 안에서 바로 돌리면
+# 그동안 rerun 전체가 멈춘다. 작업은 워커 스레드에서 돌리고, 스크립트는
+# 매 rerun 마다 상태와 지금까지 나온 부분 결과만 읽는다(블로킹 없음).
+#
+# 작업 함수는 제너레이터를 돌려주는 callable 이다. yield 하는 값이 부분 결과로
+# 쌓이고, return 값이 최종 결과가 된다. yield 사이마다 취소 여부를 확인한다.
+#
+# owner(보통 (세션 키, 작업 종류))마다 작업은 하나다. 같은 입력 키로 다시
+# 요청하면 기존 작업을 그대로 돌려주고(실패했거나 취소된 작업은 다시 돌린다),
+# 입력 키가 바뀌면(시간표 변경 등) 진행 중이던 작업은 취소된다.
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+CANCELLED = "cancelled"
+ERROR = "error"
+
+
+class Job:
+    __slots__ = ("owner", "input_key", "status", "partial", "result", "error",
+                 "created", "finished", "_cancel", "_lock")
+
+    def __init__(self, owner, input_key):
+        self.owner = owner
+        self.input_key = input_key
+        self.status = PENDING
+        self.partial = []
+        self.result = None
+        self.error = None
+        self.created = time.monotonic()
+        self.finished = None
+        self._cancel = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def done(self):
+        return self.status in (DONE, CANCELLED, ERROR)
+
+    def cancel(self):
+        with self._lock:
+            self._cancel.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def snapshot(self):
+        """(상태, 부분 결과 복사본) — 스크립트에서 읽을 때 사용"""
+        with self._lock:
+            return self.status, list(self.partial)
+
+    def _reusable(self, input_key):
+        # 같은 입력이어도 실패(일시적인 Gemini/솔버 오류)나 취소된 작업은 다시 돌린다
+        with self._lock:
+            return (self.input_key == input_key and self.status not in (CANCELLED, ERROR)
+                    and not self._cancel.is_set())
+
+    def _start(self):
+        """워커에서 시작할 때 — 이미 취소됐으면 CANCELLED 로 끝내고 False"""
+        with self._lock:
+            if self._cancel.is_set():
+                self.status = CANCELLED
+                self.finished = time.monotonic()
+                return False
+            self.status = RUNNING
+            return True
+
+    def _emit(self, item):
+        with self._lock:
+            self.partial.append(item)
+
+    def _finish(self, status, result=None, error=None):
+        with self._lock:
+            self.status = status
+            self.result = result
+            self.error = error
+            self.finished = time.monotonic()
+
+
+class JobManager:
+    def __init__(self, max_workers=4, keep_finished=600):
+        self.keep_finished = keep_finished
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+
+    def submit(self, owner, input_key, fn):
+        with self._lock:
+            self._gc()
+            job = self._jobs.get(owner)
+            if job is not None:
+                if job._reusable(input_key):
+                    return job
+                job.cancel()  # 입력이 바뀜 — 이전 작업은 더 볼 필요가 없다
+            job = Job(owner, input_key)
+            self._jobs[owner] = job
+        self._pool.submit(self._run, job, fn)
+        return job
+
+    def get(self, owner):
+        with self._lock:
+            return self._jobs.get(owner)
+
+    def cancel(self, owner):
+        with self._lock:
+            job = self._jobs.pop(owner, None)
+        if job is not None:
+            job.cancel()
+
+    def _run(self, job, fn):
+        if not job._start():
+            return
+        try:
+            gen = fn()
+            while True:
+                if job.cancelled:
+                    gen.close()
+                    job._finish(CANCELLED)
+                    return
+                try:
+                    item = next(gen)
+                except StopIteration as stop:
+                    job._finish(DONE, result=stop.value)
+                    return
+                job._emit(item)
+        except Exception as exc:
+            job._finish(ERROR, error=exc)
+
+    def _gc(self):
+        # 끝난 지 오래된 작업은 버린다 (세션이 사라져도 메모리가 쌓이지 않게)
+        now = time.monotonic()
+        stale = [
+            owner for owner, job in self._jobs.items()
+            if job.finished is not None and now - job.finished > self.keep_finished
+        ]
+        for owner in stale:
+            del self._jobs[owner]
+
+    def __len__(self):
+        with self._lock:
+            return len(self._jobs)
+
+
+# 프로세스 전체에서 공유하는 작업 관리자
+recommendation_jobs = JobManager()
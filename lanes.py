@@ -0,0 +1,65 @@
+from collections import namedtuple
+import heapq
+
+# -------------------------------------------------
+# 겹치는 일정의 레인 배치
+# -------------------------------------------------
+# 같은 요일에 시간이 겹치는 일정(수업 위에 잡은 과제 등)은 같은 grid-column 에
+# 그려져서 서로 덮였다. 요일마다
+#   1. 시작 시각 순으로 정렬하고
+#   2. 한 번 훑으면서(sweep) 서로 이어서 겹치는 묶음(cluster)을 찾고
+#   3. 묶음 안에서는 구간 그래프 색칠로 레인을 정한다 — 끝난 레인은 다시 쓰고,
+#      비어 있는 레인 중 가장 작은 번호를 준다 (필요한 최소 레인 수 = 최대 동시 겹침 수).
+# 정렬 O(n log n) + 힙 연산 O(n log k) 이므로 일정이 많은 주도 거의 선형이다.
+# 겹치지 않는 일정은 lanes=1 로 나와서 기존 마크업 그대로 그려진다.
+
+# lane: 0부터, lanes: 그 묶음의 레인 수 (칸 너비를 lanes 로 나눈다)
+Placement = namedtuple("Placement", "event lane lanes")
+
+
+def _day_placements(events):
+    """한 요일의 이벤트 -> Placement 리스트 (시작 시각 순)"""
+    placed = []
+    cluster_start = 0  # placed 안에서 현재 묶음이 시작하는 위치
+    cluster_end = -1
+    active = []  # (끝 시각, 레인) — 아직 안 끝난 일정
+    free = []  # 다시 쓸 수 있는 레인 번호
+    used = 0  # 현재 묶음에서 쓴 레인 수
+
+    def close(lanes):
+        for i in range(cluster_start, len(placed)):
+            placed[i] = placed[i]._replace(lanes=lanes)
+
+    for ev in sorted(events, key=lambda e: (e.start, e.end)):
+        if ev.start >= cluster_end and placed:
+            # 이전 묶음과 겹치지 않는다 -> 묶음 마감
+            close(used)
+            cluster_start = len(placed)
+            active.clear()
+            free.clear()
+            used = 0
+        while active and active[0][0] <= ev.start:
+            heapq.heappush(free, heapq.heappop(active)[1])
+        if free:
+            lane = heapq.heappop(free)
+        else:
+            lane = used
+            used += 1
+        heapq.heappush(active, (ev.end, lane))
+        placed.append(Placement(ev, lane, 0))
+        cluster_end = max(cluster_end, ev.end)
+
+    if placed:
+        close(used)
+    return placed
+
+
+def assign_lanes(events):
+    """요일 순, 요일 안에서는 시작 시각 순 Placement 리스트"""
+    by_day = {}
+    for ev in events:
+        by_day.setdefault(ev.day, []).append(ev)
+    placements = []
+    for day in sorted(by_day):
+        placements.extend(_day_placements(by_day[day]))
+    return placements
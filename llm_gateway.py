@@ -0,0 +1,297 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+import hashlib
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+from events import DAYS, fingerprint, format_time
+
+# -------------------------------------------------
+# google-genai 게이트웨이
+# -------------------------------------------------
+# 모델 호출은 느리고 과금되므로 rerun 마다 부르면 안 된다. 이 모듈은
+#   1. 입력(시간표 지문, 대기 과제, 선호 설정)을 정규화해서 캐시 키를 만들고
+#   2. 같은 키로 동시에 들어온 요청은 진행 중인 호출 하나에 합치고(coalescing)
+#   3. 짧은 요청들은 잠깐 모아서 한 번에 보내고(batching)
+#   4. 응답은 TTL·용량 제한이 있는 디스크 캐시(SQLite)에 저장한다.
+# 클라이언트는 generate(prompts) -> 응답 리스트 만 있으면 되므로
+# 오프라인에서는 FakeClient 를 꽂아서 쓴다.
+
+DEFAULT_MODEL = "gemini-2.5-flash"
+CACHE_DIR = os.environ.get("AI_TIMETABLE_CACHE_DIR", os.path.expanduser("~/.cache/ai-timetable"))
+
+
+class GatewayError(RuntimeError):
+    """클라이언트가 요청 수만큼 응답을 돌려주지 않았을 때 발생"""
+
+
+# -------------------------------------------------
+# 캐시 키 / 프롬프트
+# -------------------------------------------------
+def prompt_key(prompt, model=DEFAULT_MODEL):
+    return hashlib.blake2b(f"{model}\x00{prompt}".encode(), digest_size=16).hexdigest()
+
+
+def recommendation_prompt(events, assignments, preferences=None, model=DEFAULT_MODEL):
+    """(캐시 키, 프롬프트). 키는 입력 순서·표기 차이에 영향받지 않게 정규화한다."""
+    pending = sorted(
+        (a.id, a.title, a.due_date.isoformat(), a.priority, a.remaining_time)
+        for a in assignments
+        if a.pending_for_ai
+    )
+    prefs = json.dumps(preferences or {}, sort_keys=True, ensure_ascii=False)
+    key = hashlib.blake2b(
+        json.dumps([model, fingerprint(events), pending, prefs], ensure_ascii=False).encode(),
+        digest_size=16,
+    ).hexdigest()
+
+    lines = ["다음 시간표와 과제를 보고 공강 시간에 과제를 어떻게 배치하면 좋을지 짧게 조언해 주세요.", "", "[시간표]"]
+    for ev in sorted(events):
+        lines.append(f"- {DAYS[ev.day]} {format_time(ev.start)}-{format_time(ev.end)} {ev.title}")
+    lines.append("[과제]")
+    for _, title, due, priority, left in pending:
+        lines.append(f"- {title} (마감 {due}, 우선순위 {priority}, 남은 {left}분)")
+    if preferences:
+        lines.append(f"[선호 설정] {prefs}")
+    return key, "\n".join(lines)
+
+
+# -------------------------------------------------
+# 클라이언트
+# -------------------------------------------------
+class FakeClient:
+    """오프라인 테스트용. 호출 횟수와 받은 프롬프트를 기록한다."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = 0
+        self.prompts = []
+        self._lock = threading.Lock()
+
+    def generate(self, prompts, model=DEFAULT_MODEL):
+        with self._lock:
+            self.calls += 1
+            self.prompts.extend(prompts)
+        if self.delay:
+            time.sleep(self.delay)
+        return [f"[fake:{model}] {prompt_key(p, model)[:8]}" for p in prompts]
+
+
+class GeminiClient:
+    """google-genai 클라이언트. 배치는 번호 붙인 프롬프트 하나로 보내고 JSON 배열로 받는다."""
+
+    def __init__(self, api_key=None):
+        from google import genai  # AI 탭을 쓸 때만 import
+
+        self._client = genai.Client(api_key=api_key)
+
+    def _call(self, prompt, model):
+        return self._client.models.generate_content(model=model, contents=prompt).text
+
+    def generate(self, prompts, model=DEFAULT_MODEL):
+        if len(prompts) == 1:
+            return [self._call(prompts[0], model)]
+        combined = (
+            "아래 요청들에 각각 답하고, 답만 순서대로 담은 JSON 문자열 배열로 출력하세요.\n\n"
+            + "\n\n".join(f"### 요청 {i + 1}\n{p}" for i, p in enumerate(prompts))
+        )
+        try:
+            answers = json.loads(self._call(combined, model).strip().removeprefix("```json").removesuffix("```"))
+            if isinstance(answers, list) and len(answers) == len(prompts):
+                return [str(a) for a in answers]
+        except ValueError:
+            pass
+        # 배치 응답을 해석하지 못하면 하나씩 다시 보낸다
+        return [self._call(p, model) for p in prompts]
+
+
+# -------------------------------------------------
+# 디스크 캐시 (SQLite)
+# -------------------------------------------------
+class DiskCache:
+    def __init__(self, path=None, ttl=7 * 24 * 3600, max_bytes=32 * 1024 * 1024):
+        if path is None:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            path = os.path.join(CACHE_DIR, "llm_cache.sqlite3")
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY, value TEXT NOT NULL,"
+            " created REAL NOT NULL, accessed REAL NOT NULL, size INTEGER NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses(accessed)")
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            row = self._db.execute("SELECT value, created FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if now - row[1] > self.ttl:
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            self._db.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+            return row[0]
+
+    def put(self, key, value):
+        now = time.time()
+        size = len(value.encode())
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)", (key, value, now, now, size)
+            )
+            self._evict(now)
+
+    def _evict(self, now):
+        # 만료 항목 먼저, 그다음 용량을 넘는 만큼 오래 안 쓴 항목부터
+        self._db.execute("DELETE FROM responses WHERE created < ?", (now - self.ttl,))
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in self._db.execute("SELECT key, size FROM responses ORDER BY accessed").fetchall():
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+
+# -------------------------------------------------
+# 게이트웨이
+# -------------------------------------------------
+class LLMGateway:
+    def __init__(self, client, cache=None, model=DEFAULT_MODEL,
+                 batch_window=0.05, max_batch=8, small_prompt_chars=2000):
+        self.client = client
+        self.cache = cache
+        self.model = model
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.small_prompt_chars = small_prompt_chars
+
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self._batch_queue = queue.Queue()
+        self._batcher = None
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="llm")
+        self.counters = {"requests": 0, "cache_hits": 0, "coalesced": 0, "calls": 0, "batched": 0,
+                         "errors": 0, "cache_errors": 0}
+
+    def submit(self, prompt, key=None):
+        """응답 Future 를 돌려준다. 같은 키의 요청이 진행 중이면 그 Future 를 공유한다."""
+        key = key or prompt_key(prompt, self.model)
+        with self._lock:
+            self.counters["requests"] += 1
+            fut = self._inflight.get(key)
+            if fut is not None:
+                self.counters["coalesced"] += 1
+                return fut
+
+        cached = self.cache.get(key) if self.cache is not None else None
+        with self._lock:
+            if cached is not None:
+                self.counters["cache_hits"] += 1
+                fut = Future()
+                fut.set_result(cached)
+                return fut
+            fut = self._inflight.get(key)
+            if fut is not None:
+                self.counters["coalesced"] += 1
+                return fut
+            fut = Future()
+            self._inflight[key] = fut
+
+        if len(prompt) <= self.small_prompt_chars and self.max_batch > 1:
+            self._ensure_batcher()
+            self._batch_queue.put((key, prompt, fut))
+        else:
+            self._pool.submit(self._run, [(key, prompt, fut)])
+        return fut
+
+    def request(self, prompt, key=None, timeout=None):
+        return self.submit(prompt, key).result(timeout)
+
+    def _ensure_batcher(self):
+        with self._lock:
+            if self._batcher is None:
+                self._batcher = threading.Thread(target=self._batch_loop, name="llm-batcher", daemon=True)
+                self._batcher.start()
+
+    def _batch_loop(self):
+        while True:
+            items = [self._batch_queue.get()]
+            deadline = time.monotonic() + self.batch_window
+            while len(items) < self.max_batch:
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    break
+                try:
+                    items.append(self._batch_queue.get(timeout=left))
+                except queue.Empty:
+                    break
+            self._pool.submit(self._run, items)
+
+    def _run(self, items):
+        with self._lock:
+            self.counters["calls"] += 1
+            if len(items) > 1:
+                self.counters["batched"] += len(items)
+        # 무슨 일이 있어도 모든 Future 를 끝내고 진행 중 키를 지운다 — 남겨 두면 같은 키의
+        # 이후 요청이 영원히 끝나지 않는 Future 에 합류한다
+        try:
+            answers = list(self.client.generate([p for _, p, _ in items], model=self.model))
+            if len(answers) != len(items):
+                # 순서로 짝을 맞추므로 개수가 다르면 어느 응답도 믿을 수 없다
+                raise GatewayError(f"응답 {len(answers)}개를 받았지만 요청은 {len(items)}개입니다.")
+            for (key, _, fut), answer in zip(items, answers):
+                if self.cache is not None:
+                    try:
+                        self.cache.put(key, answer)
+                    except Exception:
+                        with self._lock:
+                            self.counters["cache_errors"] += 1  # 캐시 쓰기 실패는 응답과 무관
+                fut.set_result(answer)
+        except Exception as exc:
+            with self._lock:
+                self.counters["errors"] += 1
+            for _, _, fut in items:
+                if not fut.done():
+                    fut.set_exception(exc)
+        finally:
+            for key, _, fut in items:
+                self._finish(key)
+                if not fut.done():
+                    fut.set_exception(GatewayError("응답을 받지 못했습니다."))
+
+    def _finish(self, key):
+        with self._lock:
+            self._inflight.pop(key, None)
+
+    def stats(self):
+        with self._lock:
+            return dict(self.counters, inflight=len(self._inflight))
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def default_gateway():
+    """프로세스 전체에서 하나. API 키가 없으면 FakeClient 로 동작한다."""
+    global _default
+    with _default_lock:
+        if _default is None:
+            api_key = os.environ.get("GEMINI_API_KEY") or os.environ.get("GOOGLE_API_KEY")
+            client = GeminiClient(api_key) if api_key else FakeClient()
+            _default = LLMGateway(client, DiskCache())
+        return _default
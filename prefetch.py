@@ -0,0 +1,113 @@
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+import streamlit as st
+
+# -------------------------------------------------
+# 이웃 주 미리 계산 (◀/▶)
+# -------------------------------------------------
+# ◀/▶ 를 누르면 그 주의 이벤트 범위 조회와 HTML 조립을 사용자가 기다리는 동안 했다.
+# 한 주를 그린 뒤 앞뒤 주를 워커 스레드에서 미리 계산해 세션별 캐시에 넣어 두고,
+# 다음 rerun 에서 그 주를 그릴 때 바로 꺼내 쓴다.
+#
+#   - 세션마다 Prefetcher 하나 (session_state), 최근 maxsize 개만 보관(LRU)
+#   - 워커 스레드는 프로세스 전체가 공유하는 작은 풀에서 돈다
+#   - 같은 키가 이미 있거나 계산 중이면 다시 넣지 않는다
+#   - hit/miss, 미리 계산한 수, 쓰이지 않고 밀려난 수를 센다 (설정 탭에 표시)
+#
+# 워커는 session_state 를 건드리지 않고 이 객체(락으로 보호)만 고친다.
+
+_SESSION_KEY = "_week_prefetch"
+
+_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="prefetch")
+
+
+class Prefetcher:
+    def __init__(self, maxsize=8):
+        self.maxsize = maxsize
+        self._items = OrderedDict()  # 키 -> (값, 아직 안 쓰인 미리 계산 결과인지)
+        self._pending = set()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.prefetched = 0
+        self.unused = 0  # 미리 계산했지만 쓰이기 전에 밀려남
+        self.errors = 0
+
+    def get(self, key):
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            self._items[key] = (item[0], False)
+            self._items.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def put(self, key, value, speculative=False):
+        with self._lock:
+            self._put(key, value, speculative)
+
+    def _put(self, key, value, speculative):
+        self._items[key] = (value, speculative)
+        self._items.move_to_end(key)
+        while len(self._items) > self.maxsize:
+            _, (_, was_speculative) = self._items.popitem(last=False)
+            self.unused += was_speculative
+
+    def schedule(self, key, compute):
+        """key 가 없으면 워커에서 compute() 를 돌려 저장한다 (기다리지 않는다)"""
+        with self._lock:
+            if key in self._items or key in self._pending:
+                return False
+            self._pending.add(key)
+        _pool.submit(self._run, key, compute)
+        return True
+
+    def _run(self, key, compute):
+        try:
+            value = compute()
+        except Exception:
+            with self._lock:
+                self._pending.discard(key)
+                self.errors += 1
+            return
+        with self._lock:
+            self._pending.discard(key)
+            if key not in self._items:
+                self._put(key, value, True)
+                self.prefetched += 1
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "prefetched": self.prefetched,
+                "unused": self.unused,
+                "errors": self.errors,
+                "pending": len(self._pending),
+                "size": len(self._items),
+                "maxsize": self.maxsize,
+            }
+
+
+def session_prefetcher():
+    """이 세션의 Prefetcher (없으면 만든다)"""
+    prefetcher = st.session_state.get(_SESSION_KEY)
+    if prefetcher is None:
+        prefetcher = st.session_state[_SESSION_KEY] = Prefetcher()
+    return prefetcher
+
+
+def existing_prefetcher():
+    """설정 탭 등에서 통계만 볼 때 — 아직 주간 보기를 안 그렸으면 None"""
+    return st.session_state.get(_SESSION_KEY)
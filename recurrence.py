@@ -0,0 +1,154 @@
+from collections import namedtuple
+import calendar
+import dataclasses
+import datetime
+import heapq
+
+# -------------------------------------------------
+# 반복 규칙 (수업 / 반복 과제)
+# -------------------------------------------------
+# 수업은 학기 내내 매주, 과제는 Assignment.repeat("daily"/"weekly"/"monthly")로
+# 반복되지만 지금까지는 반복 개념이 없어서 한 번만 있거나, 학기 전체를 미리
+# 펼쳐 둬야 했다. 여기서는 규칙만 저장하고
+#
+#   - occurrences(first, last): 보고 있는(또는 배치할) 날짜 범위의 발생만
+#     제너레이터로 만든다. 범위 첫 발생까지는 산술로 건너뛰므로 ◀/▶ 로 아무리
+#     멀리 가도 시간/메모리가 범위 크기에만 비례한다.
+#   - 발생별 예외: skip(날짜) 는 그날만 빼고, override(날짜, ...) 는 그날 발생만
+#     다른 날짜/내용으로 바꾼다 (바뀐 날짜가 범위 안이면 그 자리에 나온다).
+#
+# 발생은 세션에 저장하지 않는다 — 세션에는 규칙(Series)만 둔다.
+
+FREQS = ("daily", "weekly", "monthly")
+
+ONE_DAY = datetime.timedelta(days=1)
+
+
+class RecurrenceError(ValueError):
+    """잘못된 반복 규칙/예외가 입력되었을 때 발생"""
+
+
+class Rule(namedtuple("Rule", "freq start until interval")):
+    """start 부터 freq 마다 (interval 배), until 은 포함하는 마지막 날짜 또는 None(끝 없음)
+
+    monthly 는 start 의 날짜(일)를 유지하고, 그 날이 없는 달은 말일로 당긴다 (1/31 -> 2/28).
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, freq, start, until=None, interval=1):
+        if freq not in FREQS:
+            raise RecurrenceError(f"알 수 없는 반복 주기입니다: {freq!r}")
+        if interval < 1:
+            raise RecurrenceError(f"반복 간격은 1 이상이어야 합니다: {interval}")
+        if until is not None and until < start:
+            raise RecurrenceError(f"반복 종료일이 시작일보다 앞섭니다: {start} ~ {until}")
+        return super().__new__(cls, freq, start, until, interval)
+
+    def dates(self, first, last):
+        """[first, last) 안의 발생 날짜 (오름차순 제너레이터)"""
+        if self.until is not None:
+            last = min(last, self.until + ONE_DAY)
+        first = max(first, self.start)
+        if first >= last:
+            return
+        if self.freq == "monthly":
+            yield from self._monthly(first, last)
+            return
+        step = self.interval * (7 if self.freq == "weekly" else 1)
+        k = -(-(first - self.start).days // step)  # first 이후 첫 발생 번호 (올림)
+        day = self.start + datetime.timedelta(days=k * step)
+        delta = datetime.timedelta(days=step)
+        while day < last:
+            yield day
+            day += delta
+
+    def _monthly(self, first, last):
+        months = (first.year - self.start.year) * 12 + first.month - self.start.month
+        k = max(0, months // self.interval * self.interval - self.interval)  # 한 칸 앞부터 (말일 보정 대비)
+        while True:
+            y, m = divmod(self.start.month - 1 + k, 12)
+            year, month = self.start.year + y, m + 1
+            day = datetime.date(year, month, min(self.start.day, calendar.monthrange(year, month)[1]))
+            if day >= last:
+                return
+            if day >= first:
+                yield day
+            k += self.interval
+
+
+class Series:
+    """반복 규칙 + 발생별 예외. item 은 발생마다 돌려줄 값 (Event, Assignment 등)"""
+
+    __slots__ = ("rule", "item", "skipped", "overrides")
+
+    def __init__(self, rule, item):
+        self.rule = rule
+        self.item = item
+        self.skipped = set()  # 원래 날짜
+        self.overrides = {}  # 원래 날짜 -> (바뀐 날짜, 바뀐 item)
+
+    def __repr__(self):
+        return f"Series({self.rule!r}, {self.item!r}, skipped={len(self.skipped)}, overrides={len(self.overrides)})"
+
+    def _check(self, date):
+        if next(self.rule.dates(date, date + ONE_DAY), None) is None:
+            raise RecurrenceError(f"{date} 에는 반복 발생이 없습니다")
+
+    def skip(self, date):
+        """그날 발생만 뺀다"""
+        self._check(date)
+        self.overrides.pop(date, None)
+        self.skipped.add(date)
+
+    def override(self, date, new_date=None, item=None):
+        """그날 발생만 다른 날짜/내용으로 바꾼다"""
+        self._check(date)
+        self.skipped.discard(date)
+        self.overrides[date] = (new_date or date, self.item if item is None else item)
+
+    def restore(self, date):
+        """예외를 지우고 규칙대로 되돌린다"""
+        self.skipped.discard(date)
+        self.overrides.pop(date, None)
+
+    def occurrences(self, first, last):
+        """[first, last) 안의 (날짜, item) — 날짜순 제너레이터"""
+        regular = (
+            (d, self.item)
+            for d in self.rule.dates(first, last)
+            if d not in self.skipped and d not in self.overrides
+        )
+        if not self.overrides:
+            yield from regular
+            return
+        moved = sorted(
+            ((d, item) for d, item in self.overrides.values() if first <= d < last),
+            key=lambda x: x[0],
+        )
+        yield from heapq.merge(regular, moved, key=lambda x: x[0])
+
+
+# -------------------------------------------------
+# 반복 과제
+# -------------------------------------------------
+def assignment_series(a):
+    """repeat 가 있는 과제 -> 마감일 기준 Series (없으면 None)"""
+    if a.repeat in (None, "", "none"):
+        return None
+    return Series(Rule(a.repeat, a.due_date), a)
+
+
+def expand_assignments(assignments, first, last, series=None):
+    """[first, last) 에 마감이 있는 과제 발생들 (반복 없는 과제는 그대로)
+
+    반복 과제의 발생은 id 뒤에 "@마감일" 을 붙인 사본이다.
+    series: 과제 id -> Series (예외가 있는 경우에만, 없으면 규칙만으로 만든다)
+    """
+    for a in assignments:
+        s = (series or {}).get(a.id) or assignment_series(a)
+        if s is None:
+            yield a
+            continue
+        for due, item in s.occurrences(first, last):
+            yield dataclasses.replace(item, id=f"{a.id}@{due.isoformat()}", due_date=due)
@@ -0,0 +1,291 @@
+from collections import OrderedDict, deque, namedtuple
+import datetime
+import heapq
+import itertools
+import json
+import os
+import threading
+import time
+
+# -------------------------------------------------
+# 과제 알림 스케줄러 (프로세스당 스레드 하나)
+# -------------------------------------------------
+# Assignment.reminder("10min"/"30min"/"1hour"/"1day")는 있었지만 알림을 보내는 곳이
+# 없었다. rerun 마다 모든 과제를 훑어 시각을 비교하면 세션·과제 수에 비례해 느려지므로
+#
+#   - 알림 시각 힙 + 키((소유자, 과제 id)) -> 항목 사전. 등록/변경은 새 항목을 넣고
+#     이전 항목은 죽은 표시만 한다 (lazy deletion, O(log n)). 죽은 항목이 산 항목보다
+#     많아지면 힙을 다시 만든다.
+#   - 백그라운드 스레드 하나가 힙의 맨 앞 시각까지 Condition 으로 잠들어 있다가 깨어
+#     그때가 된 알림만 꺼낸다 — 대기 중인 알림이 수만 개여도 유휴 CPU 는 거의 없다.
+#     더 이른 알림이 등록되면 깨워서 다시 잔다.
+#   - 꺼낸 알림은 싱크(sink)들로 보낸다: 세션 수신함(화면에서 st.toast),
+#     JSON 줄 파일, 웹훅. 싱크는 reminder 하나를 받는 callable 이면 된다.
+#
+# 과제 저장소(assignments.AssignmentStore)의 on_change 에 watch() 를 걸어 두면
+# 과제 추가/수정/완료/삭제 때 알림이 등록·취소된다.
+
+REMINDER_OFFSETS = {
+    "10min": datetime.timedelta(minutes=10),
+    "30min": datetime.timedelta(minutes=30),
+    "1hour": datetime.timedelta(hours=1),
+    "1day": datetime.timedelta(days=1),
+}
+DUE_TIME = datetime.time(23, 59)  # 과제는 마감일만 있으므로 그날 23:59 마감으로 본다
+
+LOG_PATH = os.environ.get("AI_TIMETABLE_REMINDER_LOG", "")
+WEBHOOK_URL = os.environ.get("AI_TIMETABLE_REMINDER_WEBHOOK", "")
+
+# owner: 세션 키, fire_at/due: epoch 초
+Reminder = namedtuple("Reminder", "owner assignment_id title due fire_at")
+
+
+class ReminderError(ValueError):
+    """알 수 없는 알림 설정이 들어왔을 때 발생"""
+
+
+def due_timestamp(due_date):
+    return datetime.datetime.combine(due_date, DUE_TIME).timestamp()
+
+
+def fire_timestamp(a):
+    """과제 -> 알림 시각 (알림이 없으면 None)"""
+    if a.reminder == "none":
+        return None
+    offset = REMINDER_OFFSETS.get(a.reminder)
+    if offset is None:
+        raise ReminderError(f"알 수 없는 알림 설정입니다: {a.reminder!r}")
+    return due_timestamp(a.due_date) - offset.total_seconds()
+
+
+# -------------------------------------------------
+# 스케줄러
+# -------------------------------------------------
+class ReminderScheduler:
+    def __init__(self, sinks=(), clock=time.time):
+        self.sinks = list(sinks)
+        self.clock = clock
+        self._heap = []  # [알림 시각, 순번, Reminder, 살아 있음]
+        self._entries = {}  # (소유자, 과제 id) -> 힙 항목
+        self._by_owner = {}  # 소유자 -> 과제 id 집합 (세션 화면은 자기 알림만 본다)
+        self._seq = itertools.count()
+        self._dead = 0
+        self._cond = threading.Condition()
+        self._thread = None
+        self._stopped = False
+        self.delivered = 0
+        self.errors = 0
+
+    def __len__(self):
+        with self._cond:
+            return len(self._entries)
+
+    def start(self):
+        with self._cond:
+            if self._thread is None:
+                self._stopped = False
+                self._thread = threading.Thread(target=self._loop, name="reminders", daemon=True)
+                self._thread.start()
+        return self
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join()
+
+    def schedule(self, owner, a):
+        """과제의 알림을 등록(이미 있으면 교체). 알림이 없거나 완료/마감 지남이면 취소만 한다"""
+        fire_at = fire_timestamp(a)
+        if fire_at is None or a.completed or due_timestamp(a.due_date) <= self.clock():
+            self.cancel(owner, a.id)
+            return None
+        reminder = Reminder(owner, a.id, a.title, due_timestamp(a.due_date), fire_at)
+        key = (owner, a.id)
+        with self._cond:
+            old = self._entries.get(key)
+            if old is not None:
+                if old[2] == reminder:
+                    return reminder  # 바뀐 것 없음
+                self._kill(old)
+            entry = [fire_at, next(self._seq), reminder, True]
+            self._entries[key] = entry
+            self._by_owner.setdefault(owner, set()).add(a.id)
+            heapq.heappush(self._heap, entry)
+            if self._heap[0] is entry:
+                self._cond.notify()  # 맨 앞이 바뀜 — 스레드가 더 일찍 깨어야 한다
+        return reminder
+
+    def cancel(self, owner, assignment_id):
+        with self._cond:
+            entry = self._entries.get((owner, assignment_id))
+            if entry is not None:
+                self._kill(entry)
+
+    def cancel_owner(self, owner):
+        with self._cond:
+            for aid in list(self._by_owner.get(owner, ())):
+                self._kill(self._entries[(owner, aid)])
+
+    def _forget(self, reminder):
+        del self._entries[(reminder.owner, reminder.assignment_id)]
+        ids = self._by_owner[reminder.owner]
+        ids.discard(reminder.assignment_id)
+        if not ids:
+            del self._by_owner[reminder.owner]
+
+    def _kill(self, entry):
+        entry[3] = False
+        self._forget(entry[2])
+        self._dead += 1
+        if self._dead > 64 and self._dead > len(self._entries):
+            self._heap = [e for e in self._heap if e[3]]
+            heapq.heapify(self._heap)
+            self._dead = 0
+
+    def pending(self, owner):
+        """그 소유자의 대기 중인 알림 (시각 순)"""
+        with self._cond:
+            reminders = [self._entries[(owner, aid)][2] for aid in self._by_owner.get(owner, ())]
+        return sorted(reminders, key=lambda r: r.fire_at)
+
+    def count(self, owner):
+        """그 소유자의 대기 중인 알림 수 (O(1))"""
+        with self._cond:
+            return len(self._by_owner.get(owner, ()))
+
+    def pop_due(self, now=None):
+        """now 까지 시각이 된 알림을 꺼낸다 (스레드 없이 직접 돌릴 때도 쓴다)"""
+        now = self.clock() if now is None else now
+        due = []
+        with self._cond:
+            while self._heap and (not self._heap[0][3] or self._heap[0][0] <= now):
+                entry = heapq.heappop(self._heap)
+                if not entry[3]:
+                    self._dead -= 1
+                    continue
+                self._forget(entry[2])
+                due.append(entry[2])
+        return due
+
+    def deliver(self, reminders):
+        for reminder in reminders:
+            for sink in self.sinks:
+                try:
+                    sink(reminder)
+                except Exception:
+                    self.errors += 1
+            self.delivered += 1
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                while not self._stopped:
+                    while self._heap and not self._heap[0][3]:
+                        heapq.heappop(self._heap)
+                        self._dead -= 1
+                    if not self._heap:
+                        self._cond.wait()
+                        continue
+                    delay = self._heap[0][0] - self.clock()
+                    if delay <= 0:
+                        break
+                    self._cond.wait(delay)
+                if self._stopped:
+                    return
+            # 싱크(파일/웹훅)는 락 밖에서 — 느린 싱크가 등록/취소를 막지 않게
+            self.deliver(self.pop_due())
+
+
+# -------------------------------------------------
+# 싱크
+# -------------------------------------------------
+class SessionInbox:
+    """세션별 수신함 — 화면 쪽에서 drain() 해서 st.toast 로 보여 준다"""
+
+    def __init__(self, max_owners=1000, per_owner=20):
+        self.max_owners = max_owners
+        self.per_owner = per_owner
+        self._boxes = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __call__(self, reminder):
+        with self._lock:
+            box = self._boxes.get(reminder.owner)
+            if box is None:
+                box = self._boxes[reminder.owner] = deque(maxlen=self.per_owner)
+                while len(self._boxes) > self.max_owners:
+                    self._boxes.popitem(last=False)  # 가장 오래된 세션부터
+            self._boxes.move_to_end(reminder.owner)
+            box.append(reminder)
+
+    def drain(self, owner):
+        with self._lock:
+            box = self._boxes.pop(owner, None)
+        return list(box) if box else []
+
+
+class FileSink:
+    """알림을 JSON 줄로 파일에 덧붙인다 (테스트/로그용)"""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def __call__(self, reminder):
+        line = json.dumps(reminder._asdict(), ensure_ascii=False)
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+
+class WebhookSink:
+    """알림을 JSON 으로 POST"""
+
+    def __init__(self, url, timeout=5):
+        self.url = url
+        self.timeout = timeout
+
+    def __call__(self, reminder):
+        import urllib.request  # 웹훅을 쓸 때만 로드
+
+        body = json.dumps(reminder._asdict(), ensure_ascii=False).encode()
+        request = urllib.request.Request(self.url, body, {"Content-Type": "application/json"})
+        with urllib.request.urlopen(request, timeout=self.timeout):
+            pass
+
+
+# -------------------------------------------------
+# 프로세스 기본 인스턴스
+# -------------------------------------------------
+inbox = SessionInbox()
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def default_reminders():
+    """프로세스 전체에서 하나 (처음 쓸 때 스레드 시작)"""
+    global _default
+    with _default_lock:
+        if _default is None:
+            sinks = [inbox]
+            if LOG_PATH:
+                sinks.append(FileSink(LOG_PATH))
+            if WEBHOOK_URL:
+                sinks.append(WebhookSink(WEBHOOK_URL))
+            _default = ReminderScheduler(sinks).start()
+        return _default
+
+
+def watch(owner, scheduler=None):
+    """AssignmentStore(on_change=...) 에 넘길 콜백 — 과제가 바뀔 때 알림을 등록/취소"""
+    def on_change(a, removed=False):
+        s = scheduler if scheduler is not None else default_reminders()
+        if removed:
+            s.cancel(owner, a.id)
+        else:
+            s.schedule(owner, a)
+    return on_change
@@ -0,0 +1,65 @@
+from collections import OrderedDict
+import threading
+
+# -------------------------------------------------
+# 시간표 HTML 렌더 캐시 (프로세스 전체 공유)
+# -------------------------------------------------
+# 위젯을 누를 때마다 스크립트가 다시 실행되지만, 시간표 내용과 보기 옵션이
+# 같으면 HTML 도 같다. 내용 지문(events.fingerprint)을 키로 결과를 보관하고
+# 크기를 넘으면 가장 오래 안 쓴 항목부터 버린다(LRU).
+# 모듈 전역 객체라 같은 프로세스의 모든 세션이 공유한다.
+
+
+class RenderCache:
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            html = self._items.get(key)
+            if html is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return html
+
+    def put(self, key, html):
+        with self._lock:
+            self._items[key] = html
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def get_or_render(self, key, build):
+        """캐시에 있으면 그대로, 없으면 build() 결과를 저장해서 돌려준다"""
+        html = self.get(key)
+        if html is None:
+            # 빌드는 락 밖에서 (느린 렌더링이 다른 세션을 막지 않도록)
+            html = build()
+            self.put(key, html)
+        return html
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "size": len(self._items),
+                "maxsize": self.maxsize,
+            }
+
+
+timetable_cache = RenderCache()
@@ -0,0 +1,145 @@
+from collections import deque
+
+import streamlit as st
+
+# -------------------------------------------------
+# 하단 탭 라우터
+# -------------------------------------------------
+# 세 앱이 탭을 각자 다르게 바꾸고 있었다.
+#   - app.py: 라디오 값을 읽고 active_tab 을 쓴 뒤 st.rerun() → 탭 전환마다 2번 실행
+#   - test1.py: window.location.href 로 페이지 전체를 새로 고침 → 웹소켓 세션까지 재시작
+#   - test2.py: option_menu 결과를 비교하고 다시 st.rerun()
+# 여기서는 라디오의 on_change 콜백이 스크립트 실행 전에 상태를 바꾸므로
+# 탭 전환 한 번이 스크립트 실행 한 번이다. 모양은 app.py 의 하단 고정 탭 그대로.
+#
+# 사용법: 스크립트 맨 앞에서 router.begin_run(), 탭 본문은 router.current 로 분기,
+# 아무 곳에서나 router.render_nav() (CSS 로 화면 하단에 고정된다), 맨 끝에서 router.end_run().
+#
+# 탭 전환마다 실행 횟수를 센다: 전환이 시작된 뒤 실행이 끝까지 그려질(end_run) 때까지의
+# 모든 실행. 중간에 st.rerun() 이 끼면 그 실행은 end_run 에 닿지 못하므로 2회 이상이 된다.
+
+NAV_KEY = "bottom_nav"  # 컨테이너 키 (CSS 클래스 st-key-bottom_nav)
+RADIO_KEY = "bottom_nav_radio"
+
+# 라디오 버튼을 하단 고정 탭으로 변신시키는 CSS (st-key-bottom_nav 컨테이너 안으로 한정)
+NAV_CSS = """
+    .st-key-bottom_nav div[data-testid="stRadio"] {
+        position: fixed;
+        bottom: 0;
+        left: 0;
+        width: 100%;
+        background-color: white;
+        border-top: 1px solid #e5e7eb;
+        z-index: 9999;
+        padding: 8px 0 12px 0;
+        box-shadow: 0 -2px 10px rgba(0,0,0,0.05);
+    }
+    .st-key-bottom_nav div[data-testid="stRadio"] > label {
+        display: none !important; /* 라디오 라벨 숨김 */
+    }
+    .st-key-bottom_nav div[role="radiogroup"] {
+        display: flex;
+        justify-content: space-around; /* 간격 균등 배치 */
+        width: 100%;
+    }
+    .st-key-bottom_nav div[role="radiogroup"] > label {
+        flex: 1;
+        background: white !important;
+        border: none;
+        margin: 0;
+        padding: 0;
+        display: flex;
+        flex-direction: column;
+        align-items: center;
+        justify-content: center;
+        cursor: pointer;
+    }
+    /* 라디오 동그라미 숨김 */
+    .st-key-bottom_nav div[role="radiogroup"] > label > div:first-child {
+        display: none;
+    }
+
+    /* 탭 내부 텍스트/아이콘 스타일 */
+    .st-key-bottom_nav div[data-testid="stRadio"] p {
+        font-size: 10px;
+        margin: 0;
+        line-height: 1.2;
+        text-align: center;
+        color: #9ca3af; /* 선택 안됨: 회색 */
+    }
+
+    /* 선택된 탭 스타일 */
+    .st-key-bottom_nav label:has(input:checked) p {
+        color: #4f46e5 !important; /* 선택됨: 파란색 */
+        font-weight: 700;
+    }
+
+    /* 아이콘 크기 키우기 (이모지) */
+    .st-key-bottom_nav div[data-testid="stRadio"] p span {
+        display: block;
+        font-size: 20px;
+        margin-bottom: 2px;
+    }
+"""
+
+
+class Router:
+    def __init__(self, tabs, state_key="active_tab"):
+        """tabs: [(탭 이름, 아이콘), ...] — 첫 번째가 기본 탭"""
+        self.tabs = [name for name, _ in tabs]
+        self.icons = dict(tabs)
+        self.state_key = state_key
+        self._log_key = f"_router_log_{state_key}"
+        self._pending_key = f"_router_pending_{state_key}"
+
+    @property
+    def current(self):
+        tab = st.session_state.get(self.state_key)
+        return tab if tab in self.icons else self.tabs[0]
+
+    def begin_run(self):
+        """매 스크립트 실행 맨 앞에서 호출 — 진행 중인 탭 전환의 실행 횟수를 센다"""
+        ss = st.session_state
+        if self.state_key not in ss or ss[self.state_key] not in self.icons:
+            ss[self.state_key] = self.tabs[0]
+        if ss.get(self._pending_key):
+            ss[self._log_key][-1][2] += 1
+
+    def end_run(self):
+        """스크립트 맨 끝에서 호출 — 여기까지 온 실행이 목표 탭을 다 그렸으면 전환 완료"""
+        ss = st.session_state
+        if ss.get(self._pending_key) and ss[self.state_key] == ss[self._log_key][-1][1]:
+            ss[self._pending_key] = False
+
+    def go(self, tab):
+        """콜백(on_click 등)에서 부르는 탭 이동"""
+        if tab not in self.icons or tab == st.session_state.get(self.state_key):
+            return
+        ss = st.session_state
+        log = ss.setdefault(self._log_key, deque(maxlen=20))
+        log.append([ss.get(self.state_key), tab, 0])  # [이전 탭, 목표 탭, 실행 횟수]
+        ss[self._pending_key] = True
+        ss[self.state_key] = tab
+        ss[RADIO_KEY] = tab  # 버튼 등으로 이동했을 때 라디오 표시도 맞춘다
+
+    def render_nav(self):
+        if RADIO_KEY not in st.session_state:
+            st.session_state[RADIO_KEY] = self.current
+        with st.container(key=NAV_KEY):
+            # 줄바꿈(\n)을 이용해서 아이콘을 위로, 텍스트를 아래로 배치
+            st.radio(
+                "bottom_nav",
+                self.tabs,
+                format_func=lambda t: f"{self.icons[t]}\n{t}",
+                horizontal=True,
+                label_visibility="collapsed",
+                key=RADIO_KEY,
+                on_change=self._on_radio,
+            )
+
+    def _on_radio(self):
+        self.go(st.session_state[RADIO_KEY])
+
+    def history(self):
+        """최근 탭 전환 [(이전 탭, 목표 탭, 그 전환에 든 스크립트 실행 수), ...]"""
+        return [tuple(entry) for entry in st.session_state.get(self._log_key, ())]
@@ -0,0 +1,140 @@
+from collections import namedtuple
+import datetime
+import heapq
+
+from assignments import AssignmentStore
+from events import KIND_TASK, Event, format_time, intern_title
+from freetime import free_ranges
+from recurrence import expand_assignments
+
+# -------------------------------------------------
+# 과제 → 공강 배치 스케줄러
+# -------------------------------------------------
+# no-touch.tsx 의 generateRecommendations 는 공강마다 과제 목록을 .find() 로
+# 선형 탐색하고(O(공강 × 과제)), 공강보다 긴 과제는 아예 추천하지 못한다.
+#
+# 여기서는
+#   - 요일별 빈 구간(freetime.free_ranges)을 시작일부터 날짜순으로 펼치고
+#   - 대기 과제를 (마감일, 우선순위) 힙에 넣어 매 구간마다 맨 앞 과제를 꺼내
+#     (마감이 이른 것부터 — 우선순위만 보면 3주 뒤 마감인 중요 과제가 내일 마감인
+#     과제의 자리를 모두 가져간다. 같은 날 마감이면 우선순위 순)
+#   - 남은 구간이 min_block 이상이면 맨 앞 과제는 항상 들어간다 (모자라면 잘라서
+#     나머지는 다음 구간에). min_block 보다 짧게 남았으면 남은 시간이 그 이하인 과제만
+#     들어가므로 (남은 시간, 마감일) 힙의 맨 앞 하나만 보고, 안 들어가면 다음 구간으로.
+#     두 힙 모두 끝났거나 마감이 지난 항목은 맨 앞에 올 때 버린다(lazy deletion).
+# 마감일이 지난 과제는 꺼낼 때 버리고 남은 시간을 unscheduled 로 보고한다.
+# 반복 과제(repeat)는 배치 기간 안에 마감이 있는 발생만 펼쳐서 따로 배치한다 (id@마감일).
+# 전체 O((구간 수 + 과제 수 + 분할 수) log 과제 수).
+
+# date: 날짜, start/end: 분, assignment_id/title: 과제, reason: 추천 사유
+Block = namedtuple("Block", "date start end assignment_id title reason")
+ScheduleResult = namedtuple("ScheduleResult", "blocks unscheduled")
+
+
+def iter_schedule(assignments, events, start_date, horizon_days=120, min_block=30,
+                  weekdays=(0, 1, 2, 3, 4), **free_options):
+    """배치되는 대로 Block 을 하나씩 내보내는 제너레이터 (반환값은 unscheduled)
+
+    백그라운드 작업(jobs)이 부분 결과를 바로 화면에 흘려보낼 수 있도록 한다.
+    min_block: 이보다 짧은 조각은 만들지 않는다 (과제 자체가 더 짧으면 예외)
+    free_options: freetime.free_ranges 의 day_start/day_end/avoid/preferred
+    assignments: 과제 목록 또는 AssignmentStore (저장소면 AI 대상 인덱스만 읽는다)
+    """
+    if isinstance(assignments, AssignmentStore):
+        assignments = assignments.pending_for_ai()
+    # 요일별 빈 구간은 한 주 분량만 계산해서 날짜마다 재사용
+    free_options.setdefault("min_minutes", min_block)
+    weekly = free_ranges(events, days=weekdays, **free_options)
+
+    # (마감일, 우선순위, 순번) 힙 — 순번으로 입력 순서를 안정적으로 유지
+    # (남은 분, 마감일, 우선순위, 순번) 힙 — 짧게 남은 구간을 채울 후보
+    heap = []
+    by_need = []
+    remaining = {}
+    by_id = {}
+    order = {}  # id -> 순번
+    live = set()  # 아직 배치할 시간이 남았고 마감이 지나지 않은 과제
+    last_day = start_date + datetime.timedelta(days=horizon_days)
+    occurrences = expand_assignments(assignments, start_date, last_day + datetime.timedelta(days=1))
+    for seq, a in enumerate(occurrences):
+        if not a.pending_for_ai:
+            continue
+        by_id[a.id] = a
+        order[a.id] = seq
+        remaining[a.id] = a.remaining_time
+        heap.append((a.due_date, a.priority_rank, seq, a.id))
+        by_need.append((a.remaining_time, a.due_date, a.priority_rank, seq, a.id))
+        live.add(a.id)
+    heapq.heapify(heap)
+    heapq.heapify(by_need)
+
+    if by_id:
+        last_day = min(last_day, max(a.due_date for a in by_id.values()))
+
+    day = start_date
+    while live and day <= last_day:
+        for s, e in weekly.get(day.weekday(), ()):
+            cur = s
+            while live and e - cur > 0:
+                room = e - cur
+                if room >= min_block:
+                    # 어떤 과제든 들어간다 — 마감이 가장 이른 것
+                    while heap and (heap[0][3] not in live or heap[0][0] < day):
+                        live.discard(heapq.heappop(heap)[3])  # 끝났거나 마감 지남
+                    if not heap:
+                        break
+                    aid = heap[0][3]
+                else:
+                    # 남은 시간이 room 이하인 과제만 들어간다 — 가장 짧은 것 하나만 보면 된다
+                    while by_need and (by_need[0][4] not in live or by_need[0][0] != remaining[by_need[0][4]]
+                                       or by_need[0][1] < day):
+                        entry = heapq.heappop(by_need)
+                        if entry[1] < day:
+                            live.discard(entry[4])  # 마감 지남 — 남은 시간은 unscheduled
+                    if not by_need or by_need[0][0] > room:
+                        break  # 이 구간은 쓸 만한 길이가 남지 않음
+                    aid = by_need[0][4]
+                need = remaining[aid]
+                take = min(need, room)
+                a = by_id[aid]
+                yield Block(day, cur, cur + take, aid, a.title, _reason(a, day, cur, take, need))
+                cur += take
+                remaining[aid] = need - take
+                if remaining[aid]:
+                    heapq.heappush(by_need, (remaining[aid], a.due_date, a.priority_rank, order[aid], aid))
+                else:
+                    live.discard(aid)  # 두 힙의 항목은 맨 앞에 올 때 버린다
+        day += datetime.timedelta(days=1)
+
+    return [(aid, left) for aid, left in remaining.items() if left > 0]
+
+
+def schedule(assignments, events, start_date, **options):
+    """AI 에 추가된 미완료 과제를 start_date 부터 공강에 배치한다 (iter_schedule 참고)"""
+    gen = iter_schedule(assignments, events, start_date, **options)
+    blocks = []
+    while True:
+        try:
+            blocks.append(next(gen))
+        except StopIteration as stop:
+            return ScheduleResult(blocks, stop.value)
+
+
+def _reason(a, day, start, take, need):
+    when = f"{day.month}/{day.day} {format_time(start)}-{format_time(start + take)}"
+    if take < need:
+        return f"{need}분 중 {take}분 - {when} 공강 활용 (나머지는 다음 공강에)"
+    if a.progress > 0:
+        return f"진도율 {a.progress}%, 남은 {take}분 - {when} 공강 활용"
+    return f"{take}분 소요 예상 - {when} 공강 활용"
+
+
+def blocks_to_events(blocks, week_start):
+    """week_start(월요일) 주에 해당하는 블록을 시간표 오버레이용 Event 로"""
+    week_end = week_start + datetime.timedelta(days=7)
+    sub_id = intern_title("AI 추천")
+    return [
+        Event(b.date.weekday(), b.start, b.end, KIND_TASK, intern_title(b.title), sub_id)
+        for b in blocks
+        if week_start <= b.date < week_end
+    ]
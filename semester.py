@@ -0,0 +1,177 @@
+from bisect import bisect_left
+from collections import namedtuple
+import datetime
+import functools
+
+from recurrence import Rule, Series
+
+# -------------------------------------------------
+# 학기 달력 / 날짜 인덱스 이벤트 저장소
+# -------------------------------------------------
+# 시간표 이벤트는 요일 기준(매주 반복)이라 ◀/▶ 로 날짜를 옮겨도 같은 격자만 보였고,
+# 주차 라벨은 isocalendar()[1] % 4 + 1 로 어림했다.
+#
+#   - SemesterCalendar: 학기 주차별 월요일과 "YYYY년 M월 N주차" 라벨을 미리 계산해 둔다.
+#     (그 주의 목요일이 속한 달의 몇 번째 주인지 — 달력 앱들이 쓰는 규칙)
+#   - EventIndex: (날짜, 시작 시각) 순으로 정렬된 배열. 날짜 서수를 키로 bisect 해서
+#     일/주/월 범위의 이벤트만 잘라 온다 — 보기를 바꿔도 학기 전체를 훑지 않는다.
+#     반복 일정(recurrence.Series)은 펼쳐 두지 않고 조회 범위만 그때그때 만든다.
+#   - semester_index(): 주간 시간표를 학기 동안 매주 반복하는 인덱스 (같은 입력이면 재사용)
+
+DatedEvent = namedtuple("DatedEvent", "date event")
+
+ONE_DAY = datetime.timedelta(days=1)
+ONE_WEEK = datetime.timedelta(weeks=1)
+
+
+def monday_of(date):
+    return date - datetime.timedelta(days=date.weekday())
+
+
+def month_week(date):
+    """(연, 월, N) — 그 주의 목요일이 속한 달의 N주차"""
+    thursday = monday_of(date) + datetime.timedelta(days=3)
+    return thursday.year, thursday.month, (thursday.day - 1) // 7 + 1
+
+
+def week_label(date):
+    year, month, n = month_week(date)
+    return f"{year}년 {month}월 {n}주차"
+
+
+def month_range(date):
+    """[그 달 1일, 다음 달 1일)"""
+    first = date.replace(day=1)
+    nxt = (first + datetime.timedelta(days=32)).replace(day=1)
+    return first, nxt
+
+
+class SemesterCalendar:
+    def __init__(self, start, weeks=16, name=""):
+        self.start = monday_of(start)
+        self.weeks = weeks
+        self.name = name
+        self.end = self.start + weeks * ONE_WEEK  # 마지막 주 다음 월요일
+        self.week_starts = tuple(self.start + i * ONE_WEEK for i in range(weeks))
+        self._labels = tuple(week_label(ws) for ws in self.week_starts)
+
+    def __repr__(self):
+        return f"SemesterCalendar({self.start}, weeks={self.weeks}, name={self.name!r})"
+
+    def __hash__(self):
+        return hash((self.start, self.weeks))
+
+    def __eq__(self, other):
+        return isinstance(other, SemesterCalendar) and (self.start, self.weeks) == (other.start, other.weeks)
+
+    def week_index(self, date):
+        """학기 몇 번째 주인지 (0부터), 학기 밖이면 None"""
+        i = (date - self.start).days // 7
+        return i if 0 <= i < self.weeks else None
+
+    def week_label(self, date):
+        i = self.week_index(date)
+        return self._labels[i] if i is not None else week_label(date)
+
+    def caption(self, date):
+        """라벨 아래 보조 설명: "2025년 2학기 14주차" 또는 "방학" """
+        i = self.week_index(date)
+        return f"{self.name} {i + 1}주차" if i is not None else "방학"
+
+
+# 데모 시간표가 속한 학기 (2025-12-01 = 14주차)
+DEFAULT_SEMESTER = SemesterCalendar(datetime.date(2025, 9, 1), 16, "2025년 2학기")
+
+
+# -------------------------------------------------
+# 날짜 인덱스
+# -------------------------------------------------
+def _order(x):
+    return x.date, x.event.start, x.event.end
+
+
+class EventIndex:
+    """날짜 순 정렬 배열 + bisect 범위 조회 (+ 범위만 펼치는 반복 일정)"""
+
+    __slots__ = ("_keys", "_items", "_series")
+
+    def __init__(self, dated=(), series=()):
+        items = sorted(dated, key=_order)
+        self._items = items
+        self._keys = [x.date.toordinal() for x in items]
+        self._series = list(series)
+
+    def __len__(self):
+        """한 번짜리 일정 수 (반복 일정의 발생은 세지 않는다)"""
+        return len(self._items)
+
+    @property
+    def series(self):
+        return tuple(self._series)
+
+    def add_series(self, series):
+        """반복 일정 추가 — item 은 Event, 발생 날짜의 요일 칸에 그려진다"""
+        self._series.append(series)
+
+    def add(self, date, ev):
+        """하루짜리 일정 추가 (추천 블록 등). ev.day 는 date 의 요일이어야 한다."""
+        if ev.day != date.weekday():
+            raise ValueError(f"{date} 는 {ev.day} 요일이 아닙니다")
+        key = date.toordinal()
+        # 같은 날짜 안에서는 시작 시각 순을 유지
+        i = bisect_left(self._keys, key)
+        end = bisect_left(self._keys, key + 1, i)
+        while i < end and (self._items[i].event.start, self._items[i].event.end) <= (ev.start, ev.end):
+            i += 1
+        self._items.insert(i, DatedEvent(date, ev))
+        self._keys.insert(i, key)
+
+    def between(self, first, last):
+        """[first, last) 날짜의 DatedEvent 리스트"""
+        lo = bisect_left(self._keys, first.toordinal())
+        hi = bisect_left(self._keys, last.toordinal(), lo)
+        if not self._series:
+            return self._items[lo:hi]
+        items = self._items[lo:hi]
+        # 예외 없는 반복은 규칙이 같은 것끼리 날짜를 한 번만 계산한다 (학기 시간표는 요일당 규칙 하나)
+        plain = {}
+        for s in self._series:
+            if s.skipped or s.overrides:
+                for date, ev in s.occurrences(first, last):
+                    if ev.day != date.weekday():  # 다른 요일로 옮긴 발생
+                        ev = ev._replace(day=date.weekday())
+                    items.append(DatedEvent(date, ev))
+            else:
+                plain.setdefault(s.rule, []).append(s.item)
+        for rule, events in plain.items():
+            for date in rule.dates(first, last):
+                items.extend(DatedEvent(date, ev) for ev in events)
+        items.sort(key=_order)
+        return items
+
+    def day(self, date):
+        return tuple(x.event for x in self.between(date, date + ONE_DAY))
+
+    def week(self, date):
+        """그 주(월~일)의 이벤트 — 요일 기준 Event 라 주간 격자에 그대로 그린다"""
+        first = monday_of(date)
+        return tuple(x.event for x in self.between(first, first + ONE_WEEK))
+
+    def month(self, date):
+        return self.between(*month_range(date))
+
+
+def weekly_series(ev, calendar=DEFAULT_SEMESTER):
+    """학기 첫 주부터 마지막 주까지 ev.day 요일마다 반복"""
+    first = calendar.start + datetime.timedelta(days=ev.day)
+    return Series(Rule("weekly", first, calendar.end - ONE_DAY), ev)
+
+
+@functools.lru_cache(maxsize=64)
+def semester_index(events, calendar=DEFAULT_SEMESTER):
+    """주간 반복 이벤트 튜플을 학기 동안 반복하는 인덱스 (같은 튜플이면 재사용)
+
+    이벤트마다 규칙 하나만 두므로 학기 길이와 상관없이 크기가 이벤트 수에 비례한다.
+    프로세스 안에서 공유되는 객체이므로 add()/add_series() 나 예외로 바꾸지 않는다.
+    """
+    return EventIndex(series=(weekly_series(ev, calendar) for ev in events))
@@ -0,0 +1,112 @@
+import importlib
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import streamlit as st
+
+# -------------------------------------------------
+# 시작 시간 보고서
+# -------------------------------------------------
+# 컨테이너가 새로 뜬 직후 첫 화면이 늦게 나오는 건 대부분 import 시간이다.
+# 앱 안에서는
+#   - 스크립트 실행 시간 (세션 첫 실행 = 첫 화면, 프로세스 첫 실행 = 콜드 스타트)
+#   - timed_import 로 늦게 불러온 모듈(탭 모듈, pandas 등)의 import 시간
+# 을 기록해서 설정 탭에 보여 주고,
+#     python startup.py app.py test1.py
+# 처럼 실행하면 앱마다 새 인터프리터에서 첫 실행(콜드)과 두 번째 실행(웜)을
+# 재서 JSON 으로 출력한다.
+
+HEAVY_MODULES = ("pandas", "numpy", "pyarrow", "google.genai")
+
+_RUN_KEY = "_startup_run_started"
+_FIRST_KEY = "_startup_first_paint"
+_LAST_KEY = "_startup_last_run"
+
+_lock = threading.Lock()
+_process = {"first_paint": None, "runs": 0}
+import_times = {}  # 모듈 이름 -> 처음 import 에 걸린 초
+
+
+def begin_run():
+    """스크립트 맨 앞(set_page_config 직후)에서 호출"""
+    st.session_state[_RUN_KEY] = time.perf_counter()
+
+
+def end_run():
+    """스크립트 맨 끝에서 호출 — 실행 시간을 세션/프로세스 기록에 남긴다"""
+    ss = st.session_state
+    started = ss.pop(_RUN_KEY, None)
+    if started is None:
+        return
+    elapsed = time.perf_counter() - started
+    ss.setdefault(_FIRST_KEY, elapsed)
+    ss[_LAST_KEY] = elapsed
+    with _lock:
+        _process["runs"] += 1
+        if _process["first_paint"] is None:
+            _process["first_paint"] = elapsed
+
+
+def timed_import(name):
+    """처음 쓸 때 모듈을 import 하고 걸린 시간을 기록한다 (이미 로드됐으면 바로 반환)"""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    started = time.perf_counter()
+    module = importlib.import_module(name)
+    with _lock:
+        import_times.setdefault(name, time.perf_counter() - started)
+    return module
+
+
+def report():
+    ss = st.session_state
+    with _lock:
+        return {
+            "process_first_paint": _process["first_paint"],
+            "process_runs": _process["runs"],
+            "session_first_paint": ss.get(_FIRST_KEY),
+            "last_run": ss.get(_LAST_KEY),
+            "imports": dict(import_times),
+            "heavy_loaded": [m for m in HEAVY_MODULES if m in sys.modules],
+        }
+
+
+# -------------------------------------------------
+# 콜드 스타트 측정 (명령줄)
+# -------------------------------------------------
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+harness = time.perf_counter() - started
+at = AppTest.from_file(sys.argv[1], default_timeout=120)
+t0 = time.perf_counter(); at.run(); cold = time.perf_counter() - t0
+t0 = time.perf_counter(); at.run(); warm = time.perf_counter() - t0
+print(json.dumps({
+    "app": sys.argv[1],
+    "harness_import": harness,
+    "cold_first_paint": cold,
+    "warm_rerun": warm,
+    "exception": [e.value for e in at.exception],
+    "modules": len(sys.modules),
+    "heavy_loaded": [m for m in %r if m in sys.modules],
+}, ensure_ascii=False))
+""" % (HEAVY_MODULES,)
+
+
+def measure(app_path):
+    """새 인터프리터에서 앱을 두 번 실행해 콜드/웜 시간을 잰다"""
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE, os.path.abspath(app_path)], capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    apps = sys.argv[1:] or ["app.py", "test0.py", "test1.py", "test2.py"]
+    print(json.dumps([measure(app) for app in apps], ensure_ascii=False, indent=2))
@@ -0,0 +1,319 @@
+from collections import OrderedDict
+import os
+import sqlite3
+import threading
+
+from catalog import Overlay, shared_catalog
+from events import Event, intern_title
+
+# -------------------------------------------------
+# 시간표 저장소 (SQLite)
+# -------------------------------------------------
+# st.session_state.timetables 에 모든 시간표를 들고 있으면 새로고침할 때마다
+# 사라지고, 세션마다 전체 데이터를 메모리에 들고 있어야 한다.
+# 여기서는 WAL 모드 SQLite 에 시간표/이벤트를 인덱스 있는 테이블로 두고
+#   - 생성/이름 변경/이벤트 추가·수정·삭제는 해당 행만 바꾸는 증분 쓰기
+#   - 세션에는 시간표 id 같은 가벼운 핸들만
+#   - 사용자의 시간표 목록은 owner 인덱스 한 번으로 로드
+#   - 복제는 SQL 안에서 행만 복사 (이벤트를 파이썬 객체로 읽지 않는다)
+# 읽은 이벤트는 (시간표 id, rev) 를 키로 프로세스 안에서 잠시 재사용한다.
+#
+# 카탈로그(catalog.py)에서 시작한 시간표는 base 로 카탈로그 항목 이름만
+# 기록하고, events 테이블에는 사용자가 추가한 것만, hidden_events 에는 지운
+# 카탈로그 이벤트의 인덱스만 둔다(copy-on-write). 수정이 없으면 load_events 는
+# 프로세스 공유 튜플을 그대로 돌려준다.
+
+DB_PATH = os.environ.get("AI_TIMETABLE_DB", "timetable.sqlite3")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS timetables (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,  -- id 재사용 방지 (읽기 캐시 키)
+    owner TEXT NOT NULL,
+    name TEXT NOT NULL,
+    rev INTEGER NOT NULL DEFAULT 0,
+    base TEXT,  -- 카탈로그 항목 이름 (없으면 NULL)
+    UNIQUE (owner, name)
+);
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    timetable_id INTEGER NOT NULL REFERENCES timetables(id) ON DELETE CASCADE,
+    day INTEGER NOT NULL,
+    start INTEGER NOT NULL,
+    "end" INTEGER NOT NULL,
+    kind INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    sub TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS events_timetable ON events (timetable_id, day, start);
+CREATE TABLE IF NOT EXISTS hidden_events (
+    timetable_id INTEGER NOT NULL REFERENCES timetables(id) ON DELETE CASCADE,
+    base_index INTEGER NOT NULL,
+    PRIMARY KEY (timetable_id, base_index)
+);
+"""
+
+
+class StoreError(ValueError):
+    """이름 중복, 없는 시간표 등"""
+
+
+def unique_name(taken, base, n=None):
+    """taken 에 없는 이름 — n 이 없으면 base 부터, 그다음 "base 2", "base 3" ...
+
+    (시간표 이름은 사용자마다 UNIQUE 이므로 새로 만들기/복제 전에 고른다)
+    """
+    taken = set(taken)
+    if n is None:
+        if base not in taken:
+            return base
+        n = 2
+    while f"{base} {n}" in taken:
+        n += 1
+    return f"{base} {n}"
+
+
+class TimetableStore:
+    def __init__(self, path=DB_PATH, catalog=None, cache_size=256):
+        self.path = path
+        self.catalog = catalog
+        self._local = threading.local()
+        self._cache = OrderedDict()
+        self._cache_size = cache_size
+        self._cache_lock = threading.Lock()
+        db = self._conn()
+        db.executescript(_SCHEMA)
+        columns = {row[1] for row in db.execute("PRAGMA table_info(timetables)")}
+        if "base" not in columns:  # base 컬럼이 없던 이전 DB
+            db.execute("ALTER TABLE timetables ADD COLUMN base TEXT")
+
+    # Streamlit 은 세션마다 다른 스레드에서 스크립트를 돌리므로 스레드별 연결
+    def _conn(self):
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute("PRAGMA foreign_keys=ON")
+            self._local.db = db
+        return db
+
+    def _tx(self):
+        return _Transaction(self._conn())
+
+    # -------------------------------------------------
+    # 시간표
+    # -------------------------------------------------
+    def list_timetables(self, owner):
+        """[(id, 이름), ...] 생성 순"""
+        return self._conn().execute(
+            "SELECT id, name FROM timetables WHERE owner = ? ORDER BY id", (owner,)
+        ).fetchall()
+
+    def create_timetable(self, owner, name, events=(), base=None):
+        """base 를 주면 카탈로그 항목을 복사하지 않고 참조만 한다"""
+        if base is not None and (self.catalog is None or base not in self.catalog):
+            raise StoreError(f"카탈로그에 없는 시간표입니다: {base}")
+        try:
+            with self._tx() as db:
+                tt_id = db.execute(
+                    "INSERT INTO timetables (owner, name, base) VALUES (?, ?, ?)", (owner, name, base)
+                ).lastrowid
+                if self._insert_events(db, tt_id, events):
+                    self._bump(db, tt_id)  # rev 0 은 "카탈로그 그대로" 라는 뜻 (load_events)
+        except sqlite3.IntegrityError:
+            raise StoreError(f"이미 있는 시간표 이름입니다: {name}") from None
+        return tt_id
+
+    def rename_timetable(self, tt_id, name):
+        try:
+            with self._tx() as db:
+                cur = db.execute("UPDATE timetables SET name = ? WHERE id = ?", (name, tt_id))
+        except sqlite3.IntegrityError:
+            raise StoreError(f"이미 있는 시간표 이름입니다: {name}") from None
+        if cur.rowcount == 0:
+            raise StoreError(f"없는 시간표입니다: {tt_id}")
+
+    def clone_timetable(self, tt_id, owner, name):
+        """같은 base 를 참조하고 추가/숨김 행만 복사한 새 시간표"""
+        try:
+            with self._tx() as db:
+                new_id = db.execute(
+                    "INSERT INTO timetables (owner, name, rev, base) SELECT ?, ?, rev, base FROM timetables WHERE id = ?",
+                    (owner, name, tt_id),
+                ).lastrowid
+                if db.execute("SELECT changes()").fetchone()[0] == 0:
+                    raise StoreError(f"없는 시간표입니다: {tt_id}")
+                db.execute(
+                    'INSERT INTO events (timetable_id, day, start, "end", kind, title, sub) '
+                    'SELECT ?, day, start, "end", kind, title, sub FROM events WHERE timetable_id = ? ORDER BY id',
+                    (new_id, tt_id),
+                )
+                db.execute("INSERT INTO hidden_events SELECT ?, base_index FROM hidden_events WHERE timetable_id = ?",
+                           (new_id, tt_id))
+        except sqlite3.IntegrityError:
+            raise StoreError(f"이미 있는 시간표 이름입니다: {name}") from None
+        return new_id
+
+    def delete_timetable(self, tt_id):
+        with self._tx() as db:
+            db.execute("DELETE FROM timetables WHERE id = ?", (tt_id,))
+
+    # -------------------------------------------------
+    # 이벤트 (증분 쓰기)
+    # -------------------------------------------------
+    def _insert_events(self, db, tt_id, events):
+        """-> 넣은 행 수"""
+        return db.executemany(
+            'INSERT INTO events (timetable_id, day, start, "end", kind, title, sub) VALUES (?, ?, ?, ?, ?, ?, ?)',
+            ((tt_id, ev.day, ev.start, ev.end, ev.kind, ev.title, ev.sub) for ev in events),
+        ).rowcount
+
+    def _bump(self, db, tt_id):
+        cur = db.execute("UPDATE timetables SET rev = rev + 1 WHERE id = ?", (tt_id,))
+        if cur.rowcount == 0:
+            raise StoreError(f"없는 시간표입니다: {tt_id}")
+
+    def add_events(self, tt_id, events):
+        with self._tx() as db:
+            self._bump(db, tt_id)
+            self._insert_events(db, tt_id, events)
+
+    def add_event(self, tt_id, ev):
+        with self._tx() as db:
+            self._bump(db, tt_id)
+            return db.execute(
+                'INSERT INTO events (timetable_id, day, start, "end", kind, title, sub) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (tt_id, ev.day, ev.start, ev.end, ev.kind, ev.title, ev.sub),
+            ).lastrowid
+
+    def update_event(self, tt_id, event_id, ev):
+        with self._tx() as db:
+            self._bump(db, tt_id)
+            db.execute(
+                'UPDATE events SET day = ?, start = ?, "end" = ?, kind = ?, title = ?, sub = ? '
+                "WHERE id = ? AND timetable_id = ?",
+                (ev.day, ev.start, ev.end, ev.kind, ev.title, ev.sub, event_id, tt_id),
+            )
+
+    def remove_event(self, tt_id, event_id):
+        with self._tx() as db:
+            self._bump(db, tt_id)
+            db.execute("DELETE FROM events WHERE id = ? AND timetable_id = ?", (event_id, tt_id))
+
+    def replace_events(self, tt_id, removed, added):
+        """내용이 같은 이벤트를 하나씩 지우고 새 이벤트를 넣는다 (한 트랜잭션) -> 새 rev
+
+        추가한 행에 없으면 카탈로그 쪽에서 숨긴다. 같은 내용의 이벤트는 서로 바꿔 써도
+        되므로 행 id 를 몰라도 된다 (versions.Workspace 가 버전 차이를 반영할 때).
+        """
+        with self._tx() as db:
+            if removed or added:
+                self._bump(db, tt_id)
+            base = None
+            for ev in removed:
+                cur = db.execute(
+                    "DELETE FROM events WHERE id = (SELECT id FROM events WHERE timetable_id = ? AND day = ? "
+                    'AND start = ? AND "end" = ? AND kind = ? AND title = ? AND sub = ? LIMIT 1)',
+                    (tt_id, ev.day, ev.start, ev.end, ev.kind, ev.title, ev.sub),
+                )
+                if cur.rowcount:
+                    continue
+                if base is None:
+                    base = db.execute("SELECT base FROM timetables WHERE id = ?", (tt_id,)).fetchone()[0]
+                    hidden = {r[0] for r in db.execute(
+                        "SELECT base_index FROM hidden_events WHERE timetable_id = ?", (tt_id,))}
+                for i, base_ev in enumerate(self.catalog[base] if base is not None else ()):
+                    if base_ev == ev and i not in hidden:
+                        db.execute("INSERT INTO hidden_events VALUES (?, ?)", (tt_id, i))
+                        hidden.add(i)
+                        break
+            self._insert_events(db, tt_id, added)
+            return self._revision(db, tt_id)
+
+    def hide_base_event(self, tt_id, base_index):
+        """카탈로그에서 온 이벤트를 이 시간표에서만 지운다"""
+        with self._tx() as db:
+            self._bump(db, tt_id)
+            db.execute("INSERT OR IGNORE INTO hidden_events VALUES (?, ?)", (tt_id, base_index))
+
+    # -------------------------------------------------
+    # 읽기
+    # -------------------------------------------------
+    def event_rows(self, tt_id):
+        """[(이벤트 id, Event), ...] — 수정/삭제 UI 에서 id 가 필요할 때"""
+        rows = self._conn().execute(
+            'SELECT id, day, start, "end", kind, title, sub FROM events '
+            "WHERE timetable_id = ? ORDER BY day, start",
+            (tt_id,),
+        ).fetchall()
+        return [(r[0], Event(r[1], r[2], r[3], r[4], intern_title(r[5]), intern_title(r[6]))) for r in rows]
+
+    def _revision(self, db, tt_id):
+        row = db.execute("SELECT rev FROM timetables WHERE id = ?", (tt_id,)).fetchone()
+        if row is None:
+            raise StoreError(f"없는 시간표입니다: {tt_id}")
+        return row[0]
+
+    def revision(self, tt_id):
+        """쓰기마다 1씩 오르는 번호 (캐시/작업 공간이 저장소와 맞는지 확인용)"""
+        return self._revision(self._conn(), tt_id)
+
+    def load_events(self, tt_id):
+        """시간표의 이벤트 튜플. 바뀌지 않았으면(rev 동일) 메모리에 있는 것을 돌려준다."""
+        db = self._conn()
+        row = db.execute("SELECT rev, base FROM timetables WHERE id = ?", (tt_id,)).fetchone()
+        if row is None:
+            raise StoreError(f"없는 시간표입니다: {tt_id}")
+        rev, base = row
+        if base is not None and rev == 0:
+            return self.catalog[base]  # 수정 없는 카탈로그 시간표 — 공유 튜플 그대로
+
+        key = (tt_id, rev)
+        with self._cache_lock:
+            events = self._cache.get(key)
+            if events is not None:
+                self._cache.move_to_end(key)
+                return events
+
+        added = [ev for _, ev in self.event_rows(tt_id)]
+        if base is None:
+            events = tuple(added)
+        else:
+            hidden = [r[0] for r in db.execute(
+                "SELECT base_index FROM hidden_events WHERE timetable_id = ?", (tt_id,)
+            )]
+            events = Overlay(self.catalog[base], hidden, added).events()
+
+        with self._cache_lock:
+            self._cache[key] = events
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return events
+
+
+class _Transaction:
+    """with 블록 하나를 BEGIN IMMEDIATE ~ COMMIT 으로 묶는다"""
+
+    def __init__(self, db):
+        self.db = db
+
+    def __enter__(self):
+        self.db.execute("BEGIN IMMEDIATE")
+        return self.db
+
+    def __exit__(self, exc_type, exc, tb):
+        self.db.execute("ROLLBACK" if exc_type else "COMMIT")
+        return False
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def default_store():
+    """프로세스 전체에서 하나"""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = TimetableStore(catalog=shared_catalog())
+        return _default
@@ -0,0 +1,19 @@
+import types
+
+from startup import timed_import
+
+# -------------------------------------------------
+# 탭별 페이지 모듈
+# -------------------------------------------------
+# 탭 본문과 그 탭이 쓰는 의존성(스케줄러, LLM 게이트웨이, 내보내기 등)을
+# 스크립트 맨 위에서 전부 import 하면, 홈 화면만 보는 첫 실행도 그 비용을 낸다.
+# 탭마다 모듈을 하나씩 두고 처음 보여 줄 때 import 하므로
+# 첫 화면에는 그 탭에 필요한 것만 로드된다. 한 번 로드된 모듈은 프로세스에서 재사용된다.
+# (pages/ 폴더는 Streamlit 이 멀티페이지 앱으로 인식하므로 tabs/ 에 둔다)
+#
+# 각 모듈은 render(ctx) 하나만 공개한다. ctx 는 show() 에 넘긴 키워드 인자.
+
+
+def show(name, **ctx):
+    """tabs/<name>.py 의 render(ctx) 호출"""
+    timed_import(f"{__name__}.{name}").render(types.SimpleNamespace(**ctx))
@@ -0,0 +1,112 @@
+import streamlit as st
+
+from events import fingerprint
+from exporter import LineStream, iter_ics
+from freetime import describe, find_free_slots
+from jobs import DONE, ERROR, recommendation_jobs
+from llm_gateway import default_gateway, recommendation_prompt
+from scheduler import blocks_to_events, iter_schedule
+from tabs.common import render_timetable
+
+# -------------------------------------------------
+# AI 일정 추천
+# -------------------------------------------------
+# 스케줄러·LLM 게이트웨이·내보내기는 이 탭에서만 쓰므로 여기서만 import 한다.
+
+
+def show_recommendations(job, free_slots, events, week_start):
+    # 부분 결과만 읽는다 (작업이 끝날 때까지 기다리지 않음)
+    status, blocks = job.snapshot()
+    if job.done and not job.cancelled and status != DONE:
+        st.error(f"추천 생성 중 오류가 발생했습니다: {job.error}")
+        return
+
+    if status == DONE:
+        st.success(f"공강 시간 {len(free_slots)}개, 추천 일정 {len(blocks)}개를 찾았습니다.")
+    else:
+        st.info(f"추천 일정을 계산하고 있습니다... ({len(blocks)}개)")
+
+    # 이번 주 추천 블록을 시간표 위에 겹쳐서 표시
+    render_timetable((*events, *blocks_to_events(blocks, week_start)))
+
+    for block in blocks:
+        st.write(f"- **{block.title}** · {block.reason}")
+    for aid, left in job.result or ():
+        st.warning(f"{aid}: 마감 전까지 {left}분을 배치하지 못했습니다.")
+
+    with st.expander("공강 시간"):
+        for slot in free_slots:
+            st.write(f"- {describe(slot)}")
+
+    if status == DONE:
+        # 수업은 주간 반복(RRULE), 추천 블록은 날짜 일정으로 휴대폰 캘린더에 넣을 수 있게
+        st.download_button(
+            "📤 캘린더로 내보내기 (.ics)",
+            lambda: LineStream(iter_ics(events, blocks, name="AI 시간표")),
+            file_name="ai-timetable.ics",
+            mime="text/calendar",
+            on_click="ignore",
+        )
+
+    # 다 끝났으면 전체를 한 번 다시 실행해서 주기적 갱신을 멈춘다
+    if job.done and st.session_state.get("polling_schedule"):
+        st.session_state.polling_schedule = False
+        st.rerun()
+    st.session_state.polling_schedule = not job.done
+
+
+def show_advice(job):
+    status, answers = job.snapshot()
+    if status == ERROR:
+        st.error(f"AI 호출에 실패했습니다: {job.error}")
+    elif answers:
+        st.write(answers[-1])
+    else:
+        st.info("AI가 공강 시간을 분석하고 있습니다...")
+
+    if job.done and st.session_state.get("polling_advice"):
+        st.session_state.polling_advice = False
+        st.rerun()
+    st.session_state.polling_advice = not job.done
+
+
+def render(ctx):
+    st.title("✨ AI 일정 추천")
+    events, assignments, week_start = ctx.events, ctx.assignments, ctx.week_start
+
+    # 공강 분석 (요일별 sweep line, O(n log n))
+    min_minutes = st.select_slider("최소 공강 길이 (분)", options=[30, 60, 90, 120], value=60)
+    free_options = {
+        "min_minutes": min_minutes,
+        "avoid": [("12:00", "13:00")],  # 점심시간 제외
+    }
+    free_slots = find_free_slots(events, **free_options)
+
+    if not free_slots:
+        st.info("조건에 맞는 공강 시간이 없습니다.")
+    else:
+        # 과제 배치는 백그라운드 작업으로 — 같은 입력이면 진행 중/완료된 작업을 그대로 읽고,
+        # 시간표나 과제가 바뀌면 이전 작업은 취소된다
+        # 워커 스레드가 세션 저장소를 직접 읽지 않도록 AI 대상 과제를 지금 꺼내 둔다 (우선순위 순)
+        targets = assignments.pending_for_ai()
+        pending = tuple((a.id, a.remaining_time, a.due_date, a.priority, a.repeat) for a in targets)
+        job = recommendation_jobs.submit(
+            (ctx.session_key, "schedule"),
+            fingerprint(events, "schedule", week_start, pending, free_options),
+            lambda: iter_schedule(targets, events, week_start, **free_options),
+        )
+
+        # 작업이 끝날 때까지는 이 부분만 주기적으로 다시 그린다 (전체 rerun 없음)
+        st.fragment(show_recommendations, run_every=None if job.done else 0.5)(job, free_slots, events, week_start)
+
+    # 모델 조언 — 같은 입력이면 디스크 캐시/진행 중인 호출을 재사용
+    advice = recommendation_jobs.get((ctx.session_key, "advice"))
+    if st.button("AI 코멘트 받기"):
+        key, prompt = recommendation_prompt(events, assignments, free_options)
+
+        def ask():
+            yield default_gateway().request(prompt, key=key, timeout=60)
+
+        advice = recommendation_jobs.submit((ctx.session_key, "advice"), key, ask)
+    if advice is not None:
+        st.fragment(show_advice, run_every=None if advice.done else 0.5)(advice)
@@ -0,0 +1,208 @@
+import datetime
+import uuid
+
+import streamlit as st
+
+from assignments import AssignmentStore
+from catalog import demo_assignments
+from events import DAYS, fingerprint
+from exporter import LineStream, iter_csv, iter_ics
+import instrument
+from prefetch import session_prefetcher
+import reminders
+from render_cache import timetable_cache
+from semester import DEFAULT_SEMESTER, monday_of
+from timetable_component import build_payload, timetable
+from timetable_html import DEFAULT_WINDOW, build_html, fit_window, make_window, month_html
+
+# -------------------------------------------------
+# 여러 탭이 같이 쓰는 시간표 출력
+# -------------------------------------------------
+
+# 점 색은 테마의 종류별 변수(--evt-accent)를 그대로 쓴다
+LEGEND = """
+<div style="display:flex; justify-content:flex-end; gap:12px; margin-top:8px; font-size:12px; color:#6b7280;">
+    <span style="display:flex; align-items:center;">
+        <span class="evt-class" style="width:8px; height:8px; background:var(--evt-accent); border-radius:50%; margin-right:4px;"></span>수업
+    </span>
+    <span style="display:flex; align-items:center;">
+        <span class="evt-task" style="width:8px; height:8px; background:var(--evt-accent); border-radius:50%; margin-right:4px;"></span>과제
+    </span>
+</div>
+"""
+
+
+def timetable_markup(events, view="app.weekly", window=DEFAULT_WINDOW):
+    """시간표 HTML (워커 스레드에서 불러도 된다 — streamlit 호출 없음)"""
+    # 기본 월~금 9~17시 창을 쓰되, 저녁/주말 일정이 있으면 그만큼 넓힌다
+    window = fit_window(events, window)
+
+    # 내용이 같으면 이전에 만든 HTML 을 재사용 (모든 세션 공유 캐시)
+    # 배경 그리드는 창 설정별로 한 번만 만들어지고, 이벤트 레이어만 새로 조립된다
+    key = fingerprint(events, view, window)
+    return timetable_cache.get_or_render(key, lambda: _build(events, window))
+
+
+def render_timetable(events, view="app.weekly", legend=True, window=DEFAULT_WINDOW):
+    with instrument.section("render_timetable"):
+        _emit(timetable_markup(events, view, window), legend)
+
+
+def _emit(html, legend):
+    # Streamlit에 렌더링 (여기가 핵심: html 변수를 한 번에 출력)
+    st.markdown(instrument.payload("timetable", html), unsafe_allow_html=True)
+
+    # 범례
+    if legend:
+        st.markdown(instrument.payload("legend", LEGEND), unsafe_allow_html=True)
+
+
+def _build(events, window):
+    # 캐시에 없을 때만 불린다
+    instrument.count("timetable_build")
+    with instrument.section("build_html"):
+        return build_html(events, window)
+
+
+def render_month(dated, date, view="app.monthly"):
+    """dated: 그 달의 (date, Event) — 같은 달/같은 내용이면 캐시된 HTML"""
+    with instrument.section("render_month"):
+        key = fingerprint([ev for _, ev in dated], view, date.year, date.month,
+                          tuple(d.toordinal() for d, _ in dated))
+        html = timetable_cache.get_or_render(key, lambda: month_html(date.year, date.month, dated))
+        st.markdown(instrument.payload("month", html), unsafe_allow_html=True)
+
+
+# -------------------------------------------------
+# 세션 공통 상태
+# -------------------------------------------------
+REMINDER_POLL = 30  # 초 — 알림 수신함만 들여다보는 주기 (과제 전체를 훑지 않는다)
+
+
+def session_key():
+    """세션마다 고유한 키 (백그라운드 작업/알림 소유자 구분용)"""
+    if "session_key" not in st.session_state:
+        st.session_state.session_key = uuid.uuid4().hex
+    return st.session_state.session_key
+
+
+def assignment_store():
+    """세션의 과제 저장소 — 과제가 바뀌면 알림 스케줄러에 등록/취소된다"""
+    if "assignments" not in st.session_state:
+        st.session_state.assignments = AssignmentStore(
+            demo_assignments(), on_change=reminders.watch(session_key()))
+    return st.session_state.assignments
+
+
+@st.fragment(run_every=REMINDER_POLL)
+def reminder_toasts():
+    """이 세션 수신함에 도착한 알림을 토스트로 (이 부분만 주기적으로 다시 실행)"""
+    for r in reminders.inbox.drain(session_key()):
+        due = datetime.datetime.fromtimestamp(r.due)
+        st.toast(f"⏰ {r.title} — {due.month}/{due.day} {due:%H:%M} 마감", icon="🔔")
+
+
+# -------------------------------------------------
+# ◀/▶ 주간 보기 (앞뒤 주는 미리 계산)
+# -------------------------------------------------
+ONE_WEEK = datetime.timedelta(weeks=1)
+
+
+def _week_key(index, view, monday, interactive):
+    # 캐시 항목이 index 를 붙잡고 있으므로 살아 있는 동안 id 가 겹치지 않는다
+    return id(index), view, monday, interactive
+
+
+def _week_entry(index, view, monday, interactive):
+    events = index.week(monday)
+    if interactive:
+        return index, build_payload(events, fit_window(events))
+    return index, timetable_markup(events, view)
+
+
+def render_week(index, date, view="app.weekly", legend=True, interactive=False):
+    """index(semester.EventIndex)의 date 주를 그리고, 앞뒤 주를 백그라운드에서 준비해 둔다
+
+    interactive: HTML 대신 양방향 컴포넌트(timetable_component)로 그리고
+    이번 실행의 클릭(Click 또는 None)을 돌려준다.
+    """
+    with instrument.section("render_week"):
+        prefetcher = session_prefetcher()
+        monday = monday_of(date)
+        key = _week_key(index, view, monday, interactive)
+        entry = prefetcher.get(key)
+        if entry is None:
+            instrument.count("prefetch_miss")
+            entry = _week_entry(index, view, monday, interactive)
+            prefetcher.put(key, entry)
+        else:
+            instrument.count("prefetch_hit")
+
+        click = None
+        if interactive:
+            if instrument.enabled():
+                instrument.payload("timetable_json", entry[1].data)
+            # 주를 옮겨도 같은 key 라 iframe 이 유지되고, 바뀐 일정만 브라우저에서 고친다
+            click = timetable(entry[1], key=f"{view}.component")
+            if legend:
+                st.markdown(instrument.payload("legend", LEGEND), unsafe_allow_html=True)
+        else:
+            _emit(entry[1], legend)
+
+        for neighbour in (monday + ONE_WEEK, monday - ONE_WEEK):
+            prefetcher.schedule(_week_key(index, view, neighbour, interactive),
+                                lambda m=neighbour: _week_entry(index, view, m, interactive))
+        return click
+
+
+# -------------------------------------------------
+# 일간 / 주간 / 월간 보기
+# -------------------------------------------------
+VIEW_MODES = ("일간", "주간", "월간")
+
+
+def view_title(mode, date, calendar=DEFAULT_SEMESTER):
+    if mode == "일간":
+        return f"{date.year}년 {date.month}월 {date.day}일 ({DAYS[date.weekday()]})"
+    if mode == "월간":
+        return f"{date.year}년 {date.month}월"
+    return calendar.week_label(date)
+
+
+def render_view(index, mode, date, view="app", legend=True):
+    """semester.EventIndex 에서 보기 범위의 이벤트만 잘라 그린다 (학기 전체를 훑지 않음)"""
+    if mode == "일간":
+        render_timetable(index.day(date), f"{view}.daily", legend, make_window(days=(date.weekday(),)))
+    elif mode == "월간":
+        render_month(index.month(date), date, f"{view}.monthly")
+    else:
+        render_week(index, date, f"{view}.weekly", legend)
+
+
+# -------------------------------------------------
+# 내보내기 (.ics / CSV)
+# -------------------------------------------------
+def export_buttons(load_events, name, key):
+    """📤 다운로드 버튼 두 개. 파일은 버튼을 누를 때 제너레이터로 한 줄씩 만든다.
+
+    load_events 는 스크립트 밖 스레드에서 불리므로 session_state 를 읽지 않는
+    인자 없는 함수여야 한다 (필요한 값은 미리 꺼내 닫아 둔다).
+    """
+    with st.expander("📤 시간표 내보내기"):
+        e1, e2 = st.columns(2)
+        e1.download_button(
+            "캘린더 (.ics)",
+            lambda: LineStream(iter_ics(load_events(), name=name)),  # 주간 수업은 RRULE 하나
+            file_name=f"{name}.ics",
+            mime="text/calendar",
+            on_click="ignore",
+            key=f"{key}.ics",
+        )
+        e2.download_button(
+            "CSV",
+            lambda: LineStream(iter_csv(load_events())),
+            file_name=f"{name}.csv",
+            mime="text/csv",
+            on_click="ignore",
+            key=f"{key}.csv",
+        )
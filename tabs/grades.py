@@ -0,0 +1,134 @@
+import math
+
+import streamlit as st
+
+from grades import GRADES, MAX_POINTS, demo_gradebook, letter_for, synthetic_department
+import instrument
+
+# -------------------------------------------------
+# 성적
+# -------------------------------------------------
+# 세션마다 성적부(grades.GradeBook) 하나, 학과 비교용 합성 성적부는 프로세스에서 하나.
+# 집계는 성적부의 합계 배열에서 바로 읽으므로 rerun 마다 과목을 다시 훑지 않는다.
+
+STUDENT = "me"
+
+
+@st.cache_resource
+def department_book():
+    """학과 전체 비교용 (읽기 전용으로 공유)"""
+    return synthetic_department()
+
+
+def _book():
+    if "gradebook" not in st.session_state:
+        st.session_state.gradebook = demo_gradebook(STUDENT)
+    return st.session_state.gradebook
+
+
+def _fmt(value, digits=2):
+    return "-" if value is None or math.isnan(value) else f"{value:.{digits}f}"
+
+
+def _set_grade(book):
+    # 콜백: 바뀐 과목 하나의 기여만 합계에서 빼고 더한다
+    row = st.session_state.grade_row
+    grade = st.session_state.grade_value
+    book.set_grade(row, None if grade == "미입력" else grade)
+
+
+_SERIES_COLORS = {"학기 평점": "#22c55e", "누적 평점": "#6366f1", "학과 평균": "#9ca3af"}
+
+
+def _trend_chart(semesters, series):
+    """학기별 평점 꺾은선 (SVG) — Streamlit 차트는 데이터를 pandas 로 바꾸므로 직접 그린다"""
+    w, h, pad = 600, 200, 28
+    step = (w - 2 * pad) / max(1, len(semesters) - 1)
+
+    def xy(i, v):
+        return pad + i * step, h - pad - (h - 2 * pad) * v / MAX_POINTS
+
+    parts = [f'<svg viewBox="0 0 {w} {h}" style="width:100%; max-width:{w}px; font-size:11px;">']
+    for v in (0, 1, 2, 3, 4):
+        y = xy(0, v)[1]
+        parts.append(f'<line x1="{pad}" y1="{y:.1f}" x2="{w - pad}" y2="{y:.1f}" stroke="#f3f4f6"/>'
+                     f'<text x="4" y="{y + 4:.1f}" fill="#9ca3af">{v}</text>')
+    for i, name in enumerate(semesters):
+        parts.append(f'<text x="{xy(i, 0)[0]:.1f}" y="{h - 8}" fill="#6b7280" text-anchor="middle">{name}</text>')
+    for name, values in series.items():
+        color = _SERIES_COLORS[name]
+        points = [xy(i, v) for i, v in enumerate(values) if not math.isnan(v)]
+        parts.append(f'<polyline fill="none" stroke="{color}" stroke-width="2" '
+                     f'points="{" ".join(f"{x:.1f},{y:.1f}" for x, y in points)}"/>')
+        parts.extend(f'<circle cx="{x:.1f}" cy="{y:.1f}" r="3" fill="{color}"/>' for x, y in points)
+    parts.append("</svg>")
+    legend = " ".join(f'<span style="color:{_SERIES_COLORS[n]};">●</span> {n}' for n in series)
+    st.markdown("".join(parts) + f'<div style="font-size:12px; color:#6b7280;">{legend}</div>',
+                unsafe_allow_html=True)
+
+
+def render(ctx):
+    st.title("📊 성적")
+    book = _book()
+    dept = department_book()
+
+    with instrument.section("grades_aggregate"):
+        summary = book.summary(STUDENT)
+        semesters, term_gpa, cum_gpa, _ = book.trend(STUDENT)
+        dept_semesters, dept_means = dept.semester_means()
+        dept_by_sem = dict(zip(dept_semesters, dept_means))
+        percentile = dept.percentile(summary["gpa"])
+        categories = book.category_averages(STUDENT)
+
+    # 요약
+    c1, c2, c3 = st.columns(3)
+    c1.metric("누적 평점", f"{_fmt(summary['gpa'])} / {MAX_POINTS}")
+    c2.metric("취득 학점", f"{summary['earned']:.0f}")
+    c3.metric("학과 내 위치", "-" if math.isnan(percentile) else f"상위 {100 * (1 - percentile):.0f}%")
+    if not math.isnan(summary["score_mean"]):
+        st.caption(f"원점수 학점 가중 평균 {summary['score_mean']:.1f} (표준편차 {summary['score_std']:.1f}) · "
+                   f"평점 반영 {summary['gpa_credits']:.0f}학점")
+
+    # 학기별 추이
+    if semesters:
+        _trend_chart(semesters, {
+            "학기 평점": term_gpa,
+            "누적 평점": cum_gpa,
+            "학과 평균": [dept_by_sem.get(s, math.nan) for s in semesters],
+        })
+
+    # 영역별 평균
+    if categories:
+        st.markdown("#### 영역별 평균")
+        for col, (name, (gpa, credits)) in zip(st.columns(len(categories)), categories.items()):
+            col.metric(name, _fmt(gpa), f"{credits:.0f}학점", delta_color="off")
+
+    # 성적 입력/수정
+    st.markdown("#### 성적 입력")
+    rows = [int(r) for r in book.courses(STUDENT)]
+    credits = book.column("credits")
+    semester_codes = book.column("semester")
+    g1, g2, g3 = st.columns([4, 2, 1])
+    g1.selectbox(
+        "과목", rows, key="grade_row", label_visibility="collapsed",
+        format_func=lambda r: f"{book.semesters.names[semester_codes[r]]} {book.titles[r]} "
+                              f"({credits[r]:.0f}학점, {book.grades[r] or '미입력'})",
+    )
+    g2.selectbox("성적", ("미입력", *GRADES), key="grade_value", label_visibility="collapsed")
+    g3.button("반영", on_click=_set_grade, args=(book,), use_container_width=True)
+
+    # 목표 평점
+    st.markdown("#### 목표 평점")
+    pending = sum(credits[r] for r in rows if book.grades[r] is None)
+    t1, t2 = st.columns(2)
+    target = t1.number_input("목표 누적 평점", 0.0, MAX_POINTS, 4.0, 0.1)
+    remaining = t2.number_input("남은 학점", 0, 200, int(pending), 1)
+    need = book.needed_average(STUDENT, target, remaining)
+    if need is None:
+        st.info("남은 학점을 입력하면 필요한 평균을 계산합니다.")
+    elif need > MAX_POINTS:
+        st.warning(f"남은 {remaining}학점을 모두 A+ 로 받아도 {target:.2f} 에 닿지 않습니다 (필요 평균 {need:.2f}).")
+    elif need <= 0:
+        st.success(f"남은 학점과 상관없이 {target:.2f} 이상입니다.")
+    else:
+        st.success(f"남은 {remaining}학점에서 평균 {need:.2f} (약 {letter_for(need)}) 이상이 필요합니다.")
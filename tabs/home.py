@@ -0,0 +1,50 @@
+import datetime
+
+import streamlit as st
+
+from semester import DEFAULT_SEMESTER, month_range, semester_index
+from tabs.common import VIEW_MODES, export_buttons, render_view, view_title
+
+# -------------------------------------------------
+# 홈 (일간 / 주간 / 월간 시간표)
+# -------------------------------------------------
+
+
+def _set_mode(mode):
+    st.session_state.view_mode = mode
+
+
+def _shift(step):
+    # 보기 단위만큼 날짜 이동 (콜백이라 이번 실행의 제목/시간표에 바로 반영된다)
+    ss = st.session_state
+    if ss.view_mode == "일간":
+        ss.view_date += datetime.timedelta(days=step)
+    elif ss.view_mode == "월간":
+        first, nxt = month_range(ss.view_date)
+        ss.view_date = nxt if step > 0 else month_range(first - datetime.timedelta(days=1))[0]
+    else:
+        ss.view_date += datetime.timedelta(weeks=step)
+
+
+def render(ctx):
+    ss = st.session_state
+    ss.setdefault("view_mode", "주간")
+    ss.setdefault("view_date", ctx.week_start)
+    mode, date = ss.view_mode, ss.view_date
+
+    colL, colM, colR = st.columns([1, 4, 1])
+    colL.button("◀", key="home_prev", on_click=_shift, args=(-1,))
+    colM.markdown(f"### 📅 {view_title(mode, date)}")
+    colR.button("▶", key="home_next", on_click=_shift, args=(1,))
+    st.caption(DEFAULT_SEMESTER.caption(date))
+
+    # 뷰 모드 버튼
+    for col, name in zip(st.columns(len(VIEW_MODES)), VIEW_MODES):
+        col.button(name, use_container_width=True, type="primary" if name == mode else "secondary",
+                   on_click=_set_mode, args=(name,))
+
+    # 학기 날짜 인덱스에서 보기 범위만 잘라 온다
+    render_view(semester_index(ctx.events), mode, date)
+
+    events = ctx.events  # 다운로드 콜백은 스크립트 밖에서 불린다
+    export_buttons(lambda: events, "시간표", key="home.export")
@@ -0,0 +1,44 @@
+import streamlit as st
+
+import instrument
+from prefetch import existing_prefetcher
+from render_cache import timetable_cache
+import startup
+
+# -------------------------------------------------
+# 설정
+# -------------------------------------------------
+
+
+def _ms(seconds):
+    return "-" if seconds is None else f"{seconds * 1000:,.0f}ms"
+
+
+def render(ctx):
+    st.title("⚙️ 설정")
+    st.write("계정 및 알림 설정")
+
+    # 렌더 캐시 동작 확인용 카운터
+    stats = timetable_cache.stats()
+    st.caption(f"렌더 캐시: hit {stats['hits']} / miss {stats['misses']} · {stats['size']}/{stats['maxsize']}개")
+
+    # ◀/▶ 이웃 주 미리 계산 (이 세션)
+    prefetcher = existing_prefetcher()
+    if prefetcher is not None:
+        p = prefetcher.stats()
+        st.caption(f"주간 미리 계산: 적중률 {p['hit_rate']:.0%} (hit {p['hits']} / miss {p['misses']}) · "
+                   f"미리 계산 {p['prefetched']} · 안 쓰고 버림 {p['unused']} · {p['size']}/{p['maxsize']}개")
+
+    # 탭 전환마다 스크립트가 몇 번 실행됐는지 (콜백 방식이면 항상 1)
+    for prev, to, runs in ctx.router.history()[-5:]:
+        st.caption(f"{prev} → {to}: {runs}회 실행")
+
+    # 첫 화면까지 걸린 시간과 처음 쓸 때 불러온 모듈
+    report = startup.report()
+    st.caption(f"첫 화면: 이 세션 {_ms(report['session_first_paint'])} · "
+               f"프로세스 첫 실행 {_ms(report['process_first_paint'])} · 직전 실행 {_ms(report['last_run'])}")
+    for name, seconds in report["imports"].items():
+        st.caption(f"{name} 로드: {_ms(seconds)}")
+
+    # ?debug=1 또는 AI_TIMETABLE_PROFILE=1 일 때만 보이는 계측 패널
+    instrument.render_panel()
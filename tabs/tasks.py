@@ -0,0 +1,132 @@
+import datetime
+import uuid
+
+import streamlit as st
+
+from assignments import PRIORITIES, STATUS_AI, STATUS_COMPLETED, STATUS_PENDING, Assignment
+import reminders
+from tabs.common import assignment_store, reminder_toasts, session_key
+
+# -------------------------------------------------
+# 과제
+# -------------------------------------------------
+# 목록은 저장소(assignments.AssignmentStore)의 인덱스에서 바로 읽는다 —
+# 미완료는 우선순위 힙 순서, 마감 임박은 마감일 힙의 앞 몇 개, 완료는 상태 인덱스.
+# 체크/진도/AI 추가는 콜백으로 저장소 메서드를 부르므로 목록 전체를 다시 정렬하지 않는다.
+
+PRIORITY_LABELS = {"high": "🔴 높음", "medium": "🟡 보통", "low": "🟢 낮음"}
+TYPE_LABELS = {"school": "학교", "personal": "개인"}
+REPEAT_LABELS = {"none": "반복 없음", "daily": "매일", "weekly": "매주", "monthly": "매월"}
+REMINDER_LABELS = {"none": "알림 없음", "10min": "10분 전", "30min": "30분 전", "1hour": "1시간 전", "1day": "하루 전"}
+NEXT_DUE = 3
+
+
+def _store(ctx):
+    # app.py 는 세션 저장소를 ctx 로 넘기고, test1/test2 는 여기서 만든다 (알림 토스트도 함께)
+    store = getattr(ctx, "assignments", None)
+    if store is None:
+        store = assignment_store()
+        reminder_toasts()
+    return store
+
+
+def _toggle_done(store, aid):
+    store.complete(aid, st.session_state[f"done_{aid}"])
+
+
+def _set_progress(store, aid):
+    a = store.set_progress(aid, st.session_state[f"progress_{aid}"])
+    st.session_state[f"done_{aid}"] = a.completed  # 100 ↔ 100 미만이면 체크 표시도 따라간다
+
+
+def _toggle_ai(store, aid):
+    store.update(aid, added_to_ai=st.session_state[f"ai_{aid}"])
+
+
+def _add(store):
+    ss = st.session_state
+    title = ss.new_task_title.strip()
+    if not title:
+        ss.task_error = "과제 이름을 입력하세요."
+        return
+    try:
+        store.add(Assignment(
+            f"task-{uuid.uuid4().hex[:8]}", title, ss.new_task_due, ss.new_task_minutes,
+            ss.new_task_priority, type=ss.new_task_type, repeat=ss.new_task_repeat,
+            reminder=ss.new_task_reminder,
+        ))
+    except ValueError as e:
+        ss.task_error = str(e)
+        return
+    ss.task_error = None
+    ss.new_task_title = ""
+
+
+def _row(store, a):
+    c1, c2, c3 = st.columns([5, 3, 1])
+    with c1:
+        st.checkbox(f"**{a.title}**", a.completed, key=f"done_{a.id}", on_change=_toggle_done, args=(store, a.id))
+        repeat = f" · {REPEAT_LABELS[a.repeat]}" if a.repeat in REPEAT_LABELS and a.repeat != "none" else ""
+        remind = f" · 🔔 {REMINDER_LABELS[a.reminder]}" if a.reminder in REMINDER_LABELS and a.reminder != "none" else ""
+        st.caption(f"{PRIORITY_LABELS[a.priority]} · {a.due_date.month}/{a.due_date.day} 마감 · "
+                   f"{a.estimated_time}분 ({TYPE_LABELS.get(a.type, a.type)}){repeat}{remind}")
+    with c2:
+        st.slider("진도율", 0, 100, a.progress, 10, key=f"progress_{a.id}", label_visibility="collapsed",
+                  on_change=_set_progress, args=(store, a.id))
+    with c3:
+        st.toggle("AI", a.added_to_ai, key=f"ai_{a.id}", on_change=_toggle_ai, args=(store, a.id))
+
+
+def render(ctx):
+    st.title("✅ 과제 관리")
+    store = _store(ctx)
+    counts = store.counts()
+    scheduled = reminders.default_reminders().count(session_key())
+    st.caption(f"미완료 {counts[STATUS_PENDING]} · 완료 {counts[STATUS_COMPLETED]} · AI 배치 대기 {counts[STATUS_AI]}"
+               f" · 예약된 알림 {scheduled}")
+
+    # 마감 임박 (마감일 힙의 앞부분만)
+    upcoming = store.next_due(NEXT_DUE)
+    if upcoming:
+        today = getattr(ctx, "week_start", None) or datetime.date.today()
+        st.markdown("#### ⏰ 마감 임박")
+        for a in upcoming:
+            days = (a.due_date - today).days
+            when = "마감 지남" if days < 0 else "오늘 마감" if days == 0 else f"D-{days}"
+            st.markdown(f"- **{when}** {a.title} ({a.due_date.month}/{a.due_date.day})")
+
+    # 미완료 목록 (우선순위, 마감일 순) — 종류별 보기는 종류 인덱스로
+    st.markdown("#### 📋 할 일")
+    types = store.types()
+    kind = st.radio("종류", ["전체", *types], horizontal=True, label_visibility="collapsed",
+                    format_func=lambda t: TYPE_LABELS.get(t, t))
+    shown = 0
+    for a in store.by_priority():
+        if kind == "전체" or a.type == kind:
+            _row(store, a)
+            shown += 1
+    if not shown:
+        st.info("남은 과제가 없습니다.")
+
+    done = store.with_status(STATUS_COMPLETED)
+    if done:
+        with st.expander(f"완료한 과제 {len(done)}개"):
+            for a in done:
+                _row(store, a)
+
+    # 새 과제
+    with st.expander("➕ 과제 추가"):
+        ss = st.session_state
+        ss.setdefault("new_task_due", getattr(ctx, "week_start", None) or datetime.date.today())
+        st.text_input("과제 이름", key="new_task_title")
+        a1, a2 = st.columns(2)
+        a1.date_input("마감일", key="new_task_due")
+        a2.number_input("예상 시간 (분)", 10, 600, 60, 10, key="new_task_minutes")
+        b1, b2, b3, b4 = st.columns(4)
+        b1.selectbox("우선순위", PRIORITIES, index=1, key="new_task_priority", format_func=PRIORITY_LABELS.get)
+        b2.selectbox("종류", tuple(TYPE_LABELS), key="new_task_type", format_func=TYPE_LABELS.get)
+        b3.selectbox("반복", tuple(REPEAT_LABELS), key="new_task_repeat", format_func=REPEAT_LABELS.get)
+        b4.selectbox("알림", tuple(REMINDER_LABELS), key="new_task_reminder", format_func=REMINDER_LABELS.get)
+        st.button("추가", on_click=_add, args=(store,))
+        if ss.get("task_error"):
+            st.error(ss.task_error)
@@ -1,6 +1,7 @@
 import streamlit as st
 from streamlit_option_menu import option_menu
-import pandas as pd
+
+import tabs
 
 # 페이지 설정
 st.set_page_config(page_title="시간표 앱", layout="wide")
@@ -23,10 +24,12 @@ timetable_data = {
     "목": [""] * 8,
     "금": [""] * 8,
 }
-timetable_df = pd.DataFrame(timetable_data, index=["9","10","11","12","13","14","15","16"])
+hours = ["9","10","11","12","13","14","15","16"]
 
 # HTML + CSS 로 셀 크기 3:2 고정
-def timetable_html(df):
+# (빈 표 하나 그리자고 pandas 를 import 하면 첫 화면이 0.5초쯤 늦어지므로
+#  DataFrame.to_html 과 같은 모양의 표를 직접 만든다)
+def timetable_html(data, index):
     html = """
     <style>
         table {
@@ -45,19 +48,26 @@ def timetable_html(df):
         }
     </style>
     """
-    html += df.to_html(escape=False)
+    html += '<table border="1" class="dataframe">\n  <thead>\n    <tr style="text-align: right;">\n      <th></th>\n'
+    html += "".join(f"      <th>{day}</th>\n" for day in data)
+    html += "    </tr>\n  </thead>\n  <tbody>\n"
+    for i, hour in enumerate(index):
+        html += f"    <tr>\n      <th>{hour}</th>\n"
+        html += "".join(f"      <td>{cells[i]}</td>\n" for cells in data.values())
+        html += "    </tr>\n"
+    html += "  </tbody>\n</table>"
     return html
 
 # 탭 화면 표시
 if selected == "시간표":
     st.markdown("### 시간표")
-    st.markdown(timetable_html(timetable_df), unsafe_allow_html=True)
+    st.markdown(timetable_html(timetable_data, hours), unsafe_allow_html=True)
 
 elif selected == "과제":
     st.markdown("### 과제")
 
 elif selected == "성적":
-    st.markdown("### 성적")
+    tabs.show("grades")  # 성적 분석 (처음 열 때 numpy 와 함께 로드)
 
 elif selected == "설정":
     st.markdown("### 설정")
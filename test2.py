@@ -1,125 +1,118 @@
 import streamlit as st
-from streamlit_option_menu import option_menu
 import datetime
+import uuid
+
+from events import DAYS, EventError, format_time, make_event
+import instrument
+from importer import import_file
+from router import Router
+from semester import DEFAULT_SEMESTER, semester_index
+import startup
+from storage import StoreError, default_store, unique_name
+import tabs
+from tabs.common import export_buttons, render_week
+import theme
+from versions import VersionError, Workspace
 
 # -------------------------------------------------
 # 1. 기본 페이지 설정
 # -------------------------------------------------
 st.set_page_config(page_title="AI Timetable", layout="centered")
+startup.begin_run()
+instrument.begin_run("test2")  # ?debug=1 이면 구간별 시간 기록
 
-if "active_tab" not in st.session_state:
-    st.session_state.active_tab = "시간표"
+# 하단 탭 — 콜백으로 전환하므로 option_menu 결과 비교 후 다시 rerun 할 필요가 없다
+router = Router([("시간표", "📅"), ("과제", "☑️"), ("성적", "📊"), ("설정", "⚙️")])
+router.begin_run()
+with instrument.section("css"):
+    theme.apply()  # 시간표/하단 탭 스타일시트 (세션당 한 번 전송)
 
 # -------------------------------------------------
 # 2. 전역 상태 초기화
 # -------------------------------------------------
-if (
-    "timetables" not in st.session_state
-    or not isinstance(st.session_state.timetables, dict)
-):
-    st.session_state.timetables = {"시간표 1": []}
-    st.session_state.current_tt = "시간표 1"
-
-if "current_tt" not in st.session_state or \
-   st.session_state.current_tt not in st.session_state.timetables:
-    st.session_state.current_tt = list(st.session_state.timetables.keys())[0]
-
-if "rename_mode" not in st.session_state:
-    st.session_state.rename_mode = False
+# 시간표는 SQLite 저장소에 두고, 세션에는 사용자 키와 시간표 id 만 둔다
+# (사용자 키는 URL 에 남겨서 새로고침해도 같은 시간표를 불러온다)
+# 일정 수정은 작업 공간(versions.Workspace)을 거친다 — 버전끼리 이벤트를 공유하므로
+# 복제/되돌리기 기록이 시간표 크기만큼 메모리를 쓰지 않는다
+with instrument.section("state"):
+    store = default_store()
+    if "versions" not in st.session_state:
+        st.session_state.versions = Workspace(store)
+    versions = st.session_state.versions
 
-if "current_date" not in st.session_state:
-    st.session_state.current_date = datetime.date(2025, 12, 1)
+    if "owner" not in st.session_state:
+        st.session_state.owner = st.query_params.get("u") or uuid.uuid4().hex
+    st.query_params["u"] = st.session_state.owner
 
+    timetables = store.list_timetables(st.session_state.owner)  # [(id, 이름), ...]
+    if not timetables:
+        store.create_timetable(st.session_state.owner, "시간표 1")
+        timetables = store.list_timetables(st.session_state.owner)
+    tt_names = dict(timetables)
 
-# -------------------------------------------------
-# 3. 탭 메뉴 (요청한 그대로)
-# -------------------------------------------------
-selected = option_menu(
-    None,
-    ["시간표", "과제", "성적", "설정"],
-    icons=["calendar-week", "check2-square", "bar-chart-line", "gear"],
-    menu_icon=None,
-    default_index=["시간표","과제","성적","설정"].index(st.session_state.active_tab),
-    orientation="horizontal",
-)
+    if "current_tt" not in st.session_state or \
+       st.session_state.current_tt not in tt_names:
+        st.session_state.current_tt = timetables[0][0]
+        st.session_state.picked = None  # 클릭 위치/일정은 시간표마다
 
-if selected != st.session_state.active_tab:
-    st.session_state.active_tab = selected
-    st.rerun()
+    if "rename_mode" not in st.session_state:
+        st.session_state.rename_mode = False
 
+    if "current_date" not in st.session_state:
+        st.session_state.current_date = datetime.date(2025, 12, 1)
+
+
+def shift_week(weeks):
+    st.session_state.current_date += datetime.timedelta(weeks=weeks)
+
+
+def select_timetable(tt_id):
+    # 고른 일정/클릭 위치는 이전 시간표의 것이므로 시간표가 바뀌면 버린다
+    st.session_state.current_tt = tt_id
+    st.session_state.rename_mode = False
+    st.session_state.picked = None
+
+
+def step_history(redo):
+    try:
+        if redo:
+            versions.redo(st.session_state.current_tt)
+        else:
+            versions.undo(st.session_state.current_tt)
+    except VersionError:
+        pass  # 버튼이 비활성인 사이 눌린 경우
+    st.session_state.picked = None
 
-# -------------------------------------------------
-# 4. 시간표 렌더링 함수
-# -------------------------------------------------
-def render_timetable():
-    data = st.session_state.timetables[st.session_state.current_tt]
-    days = ["월", "화", "수", "목", "금"]
-    day_idx = {d: i for i, d in enumerate(days)}
-
-    html = '<div class="timetable-wrapper">'
-    html += '<div class="timetable-header"><div></div>'
-    for d in days:
-        html += f"<div>{d}</div>"
-    html += "</div>"
-
-    html += '<div class="timetable-body">'
-
-    # 배경 그리드
-    for h in range(9, 17):
-        base = (h - 9) * 6 + 1
-        html += f'<div class="time-label" style="grid-row:{base}/span 6;">{h}</div>'
-        for col in range(2, 7):
-            html += f'<div class="grid-bg-cell" style="grid-column:{col}; grid-row:{base}/span 6;"></div>'
-
-    # 일정 렌더링
-    for item in data:
-        col = day_idx[item["day"]] + 2
-        sh, sm = map(int, item["start"].split(":"))
-        eh, em = map(int, item["end"].split(":"))
-        start = (sh - 9) * 60 + sm
-        duration = (eh * 60 + em) - (sh * 60 + sm)
-
-        row = start // 10 + 1
-        span = max(1, duration // 10)
-
-        cls = {
-            "class": "evt-class",
-            "task": "evt-task",
-            "personal": "evt-personal"
-        }.get(item.get("kind", "class"), "evt-class")
-
-        sub = item.get("sub", "")
-
-        html += f"""
-        <div class="event-item {cls}" style="grid-column:{col}; grid-row:{row}/span {span};">
-            <div class="evt-title">{item['title']}</div>
-            <div class="evt-time">{sub}</div>
-        </div>
-        """
-
-    html += "</div></div>"
-    st.markdown(html, unsafe_allow_html=True)
+
+def clone_timetable(names):
+    # 이벤트는 복사하지 않는다 — 새 시간표의 기록이 지금 버전을 그대로 가리킨다
+    name = unique_name(names.values(), f"{names[st.session_state.current_tt]} 복사본")
+    try:
+        select_timetable(versions.clone(st.session_state.current_tt, st.session_state.owner, name))
+    except StoreError as e:
+        st.session_state.tt_error = str(e)  # 다른 탭에서 같은 이름을 먼저 만든 경우
 
 
 # -------------------------------------------------
-# 5. 화면별 렌더링
+# 3. 화면별 렌더링
 # -------------------------------------------------
-if st.session_state.active_tab == "시간표":
+if router.current == "시간표":
     st.markdown("### 시간표")
 
     # UI 생략 — 기존 코드 그대로 유지
-    c1, c2, c3 = st.columns([5, 1, 1])
+    c1, c2, c3, c4 = st.columns([5, 1, 1, 1])
 
     with c1:
-        tt_names = list(st.session_state.timetables.keys())
+        tt_ids = list(tt_names)
         selected_tt = st.selectbox(
             "",
-            tt_names,
-            index=tt_names.index(st.session_state.current_tt),
+            tt_ids,
+            index=tt_ids.index(st.session_state.current_tt),
+            format_func=tt_names.get,
             label_visibility="collapsed",
         )
         if selected_tt != st.session_state.current_tt:
-            st.session_state.current_tt = selected_tt
+            select_timetable(selected_tt)
             st.rerun()
 
     with c2:
@@ -128,46 +121,129 @@ if st.session_state.active_tab == "시간표":
 
     with c3:
         if st.button("➕"):
-            new_name = f"시간표 {len(st.session_state.timetables) + 1}"
-            st.session_state.timetables[new_name] = []
-            st.session_state.current_tt = new_name
-            st.session_state.rename_mode = False
-            st.rerun()
+            new_name = unique_name(tt_names.values(), "시간표", len(tt_names) + 1)
+            try:
+                select_timetable(store.create_timetable(st.session_state.owner, new_name))
+            except StoreError as e:
+                st.session_state.tt_error = str(e)  # 다른 탭에서 같은 이름을 먼저 만든 경우
+            else:
+                st.rerun()
+
+    with c4:
+        st.button("⧉", help="현재 시간표 복제", on_click=clone_timetable, args=(tt_names,))
+
+    if st.session_state.get("tt_error"):
+        st.error(st.session_state.pop("tt_error"))
 
     if st.session_state.rename_mode:
         with st.form("rename_form"):
-            new_name = st.text_input("새 이름", st.session_state.current_tt)
+            new_name = st.text_input("새 이름", tt_names[st.session_state.current_tt])
             ok = st.form_submit_button("변경")
             if ok and new_name.strip():
-                data = st.session_state.timetables.pop(st.session_state.current_tt)
-                st.session_state.timetables[new_name] = data
-                st.session_state.current_tt = new_name
-                st.session_state.rename_mode = False
-                st.rerun()
-
-    # 주차 이동 버튼
+                # 이름 한 칸만 바꾸는 증분 쓰기 (id 는 그대로)
+                try:
+                    store.rename_timetable(st.session_state.current_tt, new_name.strip())
+                except StoreError as e:
+                    st.error(str(e))
+                else:
+                    st.session_state.rename_mode = False
+                    st.rerun()
+
+    # CSV / iCalendar 가져오기 (한 줄씩 스트리밍, 배치로 저장)
+    with st.expander("📥 시간표 가져오기"):
+        upload = st.file_uploader("CSV 또는 .ics 파일", type=["csv", "ics"])
+        skip_overlaps = st.checkbox("겹치는 일정은 건너뛰기")
+        # 같은 파일을 rerun 마다 다시 가져오지 않도록 마지막 파일 id 를 기억
+        if upload is not None and st.session_state.get("imported_file") != upload.file_id:
+            report = import_file(upload, upload.name, store, st.session_state.current_tt,
+                                 skip_overlaps=skip_overlaps)
+            st.session_state.imported_file = upload.file_id
+            st.success(f"{report.imported}개 일정을 가져왔습니다. "
+                       f"({report.rows}행, {report.rows_per_sec:,.0f}행/초, 겹침 {report.overlaps}개)")
+            if report.rejected:
+                st.warning(f"{report.rejected}개 행을 건너뛰었습니다.")
+                st.dataframe([{"줄": no, "사유": reason} for no, reason in report.errors])
+
+    # 내보내기 — 스크립트 밖 스레드에서 불리므로 시간표 id 는 미리 꺼내 둔다
+    export_tt = st.session_state.current_tt
+    export_buttons(lambda: store.load_events(export_tt), tt_names[export_tt], key="test2.export")
+
+    # 주차 이동 버튼 (콜백이라 누른 실행의 라벨/시간표에 바로 반영된다)
     colL, colM, colR = st.columns([1, 3, 1])
     with colL:
-        if st.button("◀"):
-            st.session_state.current_date -= datetime.timedelta(weeks=1)
+        st.button("◀", on_click=shift_week, args=(-1,))
+    with colM:
+        st.caption(f"{DEFAULT_SEMESTER.week_label(st.session_state.current_date)} · "
+                   f"{DEFAULT_SEMESTER.caption(st.session_state.current_date)}")
     with colR:
-        if st.button("▶"):
-            st.session_state.current_date += datetime.timedelta(weeks=1)
-
-    # 시간표 표시 (스크롤 영역)
-    st.markdown("<div style='height:520px; overflow-y:auto;'>", unsafe_allow_html=True)
-    render_timetable()
-    st.markdown("</div>", unsafe_allow_html=True)
+        st.button("▶", on_click=shift_week, args=(1,))
+
+    # 되돌리기/다시 실행 — 두 버전의 차이만 저장소에 쓴다
+    history = versions.history(st.session_state.current_tt)
+    u1, u2, u3 = st.columns([1, 1, 5])
+    u1.button("↩️", help="되돌리기", on_click=step_history, args=(False,), disabled=not history.can_undo)
+    u2.button("↪️", help="다시 실행", on_click=step_history, args=(True,), disabled=not history.can_redo)
+    if history.can_undo or history.can_redo:
+        labels = history.labels()
+        pos = next(i for i, (_, current) in enumerate(labels) if current)
+        u3.caption(f"{pos}/{len(labels) - 1} · {labels[pos][0] or '처음 상태'}")
+
+    # 시간표 표시 — 학기 날짜 인덱스에서 이번 주 일정만, 앞뒤 주는 백그라운드에서 미리 계산
+    # 양방향 컴포넌트라 바뀐 일정만 브라우저에서 고치고, 빈칸을 누르면 그 자리에 일정을 추가한다
+    index = semester_index(history.events())
+    click = render_week(index, st.session_state.current_date, view="test2.weekly", legend=False,
+                        interactive=True)
+    if click is not None:
+        st.session_state.picked = click
+
+    picked = st.session_state.get("picked")
+    if picked is not None and picked.kind == "event":
+        ev = picked.event
+        i1, i2 = st.columns([5, 1])
+        i1.info(f"{DAYS[ev.day]} {format_time(ev.start)}~{format_time(ev.end)} · {ev.title}"
+                + (f" ({ev.sub})" if ev.sub else ""))
+        if i2.button("🗑️", help="이 일정 삭제"):
+            key = next((k for k, e in history.current.events.items() if e == ev), None)
+            if key is not None:
+                versions.remove(st.session_state.current_tt, key)
+            st.session_state.picked = None
+            st.rerun()
+    elif picked is not None:
+        with st.form("add_event_form"):
+            st.markdown(f"**{DAYS[picked.day]} {format_time(picked.minute)} 일정 추가**")
+            title = st.text_input("제목")
+            length = st.selectbox("길이", [30, 50, 60, 90, 120], index=2, format_func=lambda m: f"{m}분")
+            kind = st.radio("종류", ["class", "task", "personal"], horizontal=True,
+                            format_func={"class": "수업", "task": "과제", "personal": "개인"}.get)
+            a1, a2 = st.columns(2)
+            ok = a1.form_submit_button("추가")
+            cancel = a2.form_submit_button("취소")
+            if ok and title.strip():
+                try:
+                    ev = make_event(picked.day, picked.minute, min(picked.minute + length, 24 * 60),
+                                    title.strip(), kind)
+                except EventError as e:
+                    st.error(str(e))
+                else:
+                    versions.add(st.session_state.current_tt, ev)
+                    st.session_state.picked = None
+                    st.rerun()
+            elif cancel:
+                st.session_state.picked = None
+                st.rerun()
 
 
-elif st.session_state.active_tab == "과제":
-    st.title("📘 과제")
-    st.info("과제 기능 개발 예정")
+else:
+    # 나머지 탭은 app.py 와 같은 페이지 모듈 (처음 열 때 import)
+    with instrument.section(f"tab:{router.current}"):
+        tabs.show({"과제": "tasks", "성적": "grades", "설정": "settings"}[router.current], router=router)
 
-elif st.session_state.active_tab == "성적":
-    st.title("📊 성적")
-    st.info("성적 기능 개발 예정")
 
-elif st.session_state.active_tab == "설정":
-    st.title("⚙️ 설정")
-    st.info("설정 기능 개발 예정")
+# -------------------------------------------------
+# 4. 하단 탭 네비게이션 (고정)
+# -------------------------------------------------
+with instrument.section("nav"):
+    router.render_nav()
+router.end_run()
+startup.end_run()
+instrument.end_run(tab=router.current)
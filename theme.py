@@ -0,0 +1,191 @@
+from collections import namedtuple
+import functools
+import hashlib
+
+import streamlit as st
+
+from events import KINDS
+import instrument
+from router import NAV_CSS
+
+# -------------------------------------------------
+# 시간표 스타일시트 / 테마
+# -------------------------------------------------
+# 앱마다 수 KB 의 <style> 블록을 st.markdown 으로 매 rerun 보내고 있었고,
+# test2.py 처럼 CSS 를 빠뜨리면 evt-personal 같은 클래스는 아무 모양이 없었다.
+# 여기서는 시간표 클래스 전체(+ 하단 탭, 앱별 추가 CSS)를 스타일시트 하나로 만든다.
+#
+#   - 테마(종류별 색, 행 높이)와 추가 CSS 가 같으면 문자열도 바이트 단위로 같고,
+#     내용 해시가 버전이 된다 (lru_cache 로 프로세스에서 한 번만 생성).
+#   - Streamlit 은 일정 크기 이상의 메시지를 브라우저에 캐시해 두고, 같은 내용이면
+#     다음 rerun 부터 해시 참조만 보낸다. .streamlit/config.toml 의
+#     global.minCachedMessageSize 를 스타일시트보다 작게 두었으므로
+#     스타일시트 본문은 세션당 한 번만 전송된다.
+#   - 색은 종류별 CSS 변수(--evt-bg 등)로만 들어가므로 테마를 바꿔도
+#     이벤트 마크업(event-item evt-<kind>)과 렌더 캐시는 그대로다.
+
+KindStyle = namedtuple("KindStyle", "background accent text")
+
+
+class Theme(namedtuple("Theme", "name kinds row_px")):
+    """kinds: events.KINDS 순서의 KindStyle 튜플, row_px: 10분 한 칸의 높이"""
+
+    __slots__ = ()
+
+    def kind_style(self, kind):
+        return self.kinds[KINDS.index(kind)]
+
+    def with_kind(self, kind, **colors):
+        """한 종류의 색만 바꾼 새 테마"""
+        kinds = list(self.kinds)
+        i = KINDS.index(kind)
+        kinds[i] = kinds[i]._replace(**colors)
+        return self._replace(kinds=tuple(kinds))
+
+
+DEFAULT_THEME = Theme(
+    "default",
+    (
+        KindStyle("#dcfce7", "#22c55e", "#14532d"),  # class
+        KindStyle("#fef9c3", "#eab308", "#854d0e"),  # task
+        KindStyle("#fce7f3", "#ec4899", "#831843"),  # personal
+        KindStyle("#eef2ff", "#818cf8", "#3730a3"),  # free
+    ),
+    10,
+)
+
+Stylesheet = namedtuple("Stylesheet", "css version")
+
+_LAYOUT_CSS = """
+/* --- 시간표 그리드 --- */
+.timetable-wrapper {
+    background: white;
+    border-radius: 15px;
+    border: 1px solid #e5e7eb;
+    overflow: hidden;
+    margin-top: 10px;
+    box-shadow: 0 4px 6px rgba(0,0,0,0.02);
+}
+.timetable-header {
+    display: grid;
+    grid-template-columns: 40px repeat(var(--days, 5), 1fr);
+    background: #f9fafb;
+    border-bottom: 1px solid #e5e7eb;
+    text-align: center;
+    font-size: 12px;
+    font-weight: 600;
+    color: #6b7280;
+    padding: 8px 0;
+}
+.timetable-body {
+    display: grid;
+    grid-template-columns: 40px repeat(var(--days, 5), 1fr);
+    /* 보이는 시간 범위 -> 10분 단위 grid (행 수는 timetable_html 이 지정) */
+    grid-template-rows: repeat(var(--rows, 48), ROW_PXpx);
+    position: relative;
+}
+.time-label {
+    font-size: 10px;
+    color: #9ca3af;
+    text-align: center;
+    border-right: 1px solid #f3f4f6;
+    border-bottom: 1px solid #f3f4f6;
+    display: flex;
+    align-items: start;
+    justify-content: center;
+    padding-top: 2px;
+}
+.grid-bg-cell {
+    border-right: 1px solid #f3f4f6;
+    border-bottom: 1px solid #f3f4f6;
+}
+
+/* --- 이벤트 카드 (색은 종류별 변수) --- */
+.event-item {
+    margin: 1px;
+    padding: 4px 6px;
+    border-radius: 6px;
+    font-size: 11px;
+    line-height: 1.2;
+    display: flex;
+    flex-direction: column;
+    justify-content: center;
+    overflow: hidden;
+    z-index: 10;
+    box-shadow: 0 1px 2px rgba(0,0,0,0.1);
+    background-color: var(--evt-bg);
+    border-left: 3px solid var(--evt-accent);
+    color: var(--evt-text);
+}
+.evt-free {
+    border: 1px dashed var(--evt-accent);
+    box-shadow: none;
+}
+/* 겹치는 일정: 요일 칸을 --lanes 개로 나눠 --lane 번째 줄에 (timetable_html / lanes.py) */
+.event-item.lane {
+    justify-self: start;
+    width: calc(100% / var(--lanes) - 2px);
+    margin-left: calc(100% * var(--lane) / var(--lanes) + 1px);
+}
+.evt-title { font-weight: 700; margin-bottom: 2px; }
+.evt-time { font-size: 9px; opacity: 0.8; }
+
+/* --- 월간 보기 --- */
+.month-grid {
+    display: grid;
+    grid-template-columns: repeat(7, 1fr);
+}
+.month-head {
+    background: #f9fafb;
+    border-bottom: 1px solid #e5e7eb;
+    text-align: center;
+    font-size: 12px;
+    font-weight: 600;
+    color: #6b7280;
+    padding: 8px 0;
+}
+.month-cell {
+    min-height: 72px;
+    padding: 2px;
+    border-right: 1px solid #f3f4f6;
+    border-bottom: 1px solid #f3f4f6;
+    overflow: hidden;
+}
+.month-cell.other { background: #fafafa; color: #d1d5db; }
+.month-date { font-size: 11px; color: #6b7280; margin-bottom: 2px; }
+.month-evt {
+    font-size: 10px;
+    line-height: 1.3;
+    margin-bottom: 1px;
+    padding: 0 3px;
+    border-radius: 3px;
+    white-space: nowrap;
+    overflow: hidden;
+    text-overflow: ellipsis;
+    background-color: var(--evt-bg);
+    border-left: 2px solid var(--evt-accent);
+    color: var(--evt-text);
+}
+.month-more { font-size: 10px; color: #9ca3af; }
+"""
+
+
+def _kind_rules(theme):
+    for kind, style in zip(KINDS, theme.kinds):
+        yield (f".evt-{kind} {{ --evt-bg: {style.background}; "
+               f"--evt-accent: {style.accent}; --evt-text: {style.text}; }}")
+
+
+@functools.lru_cache(maxsize=32)
+def stylesheet(theme=DEFAULT_THEME, extra=""):
+    """테마 + 추가 CSS -> Stylesheet(css, 내용 해시 버전)"""
+    body = "\n".join((_LAYOUT_CSS.replace("ROW_PX", str(theme.row_px)), *_kind_rules(theme), NAV_CSS, extra))
+    version = hashlib.blake2b(body.encode(), digest_size=6).hexdigest()
+    return Stylesheet(f"<style>/* ai-timetable {theme.name} v{version} */\n{body}\n</style>", version)
+
+
+def apply(theme=DEFAULT_THEME, extra=""):
+    """스크립트 앞쪽에서 매 실행 호출 — 내용이 같으면 브라우저 캐시에서 재사용된다"""
+    sheet = stylesheet(theme, extra)
+    st.html(instrument.payload("stylesheet", sheet.css))  # <style> 만 있으면 화면 공간을 차지하지 않는다
+    return sheet
@@ -0,0 +1,100 @@
+from collections import namedtuple
+import json
+import os
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+from events import KINDS
+from lanes import assign_lanes
+import theme
+
+# -------------------------------------------------
+# 양방향 시간표 컴포넌트
+# -------------------------------------------------
+# st.markdown 으로는 rerun 마다 그리드 전체(칸마다 inline style)를 HTML 문자열로
+# 다시 보내고, 브라우저는 일정 하나만 바뀌어도 그리드 전체를 다시 파싱한다.
+# 이 컴포넌트는
+#   - 창 설정 + 일정 목록만 작은 JSON 으로 보내고 ([id, 요일, 시작, 끝, 종류, 제목, 부제, 레인, 레인 수])
+#   - 브라우저 쪽(frontend/timetable/index.html)이 직전 목록과 id 로 비교해서
+#     바뀐 일정만 추가/수정/삭제한다 (창 설정이 바뀔 때만 배경 그리드를 다시 만든다)
+#   - 일정/빈칸 클릭을 Python 으로 돌려준다 -> 빈칸을 눌러 일정 추가
+#
+# id 는 일정 내용으로 만들기 때문에 그대로인 일정은 rerun 사이에 같은 id 를 유지한다.
+#
+# 인자 비용:
+#   - 스타일은 iframe 안이라 theme.stylesheet(약 5KB)가 필요하지만, 이 세션에서 그
+#     버전을 이미 보냈으면 빼고 버전만 보낸다. iframe 이 새로 만들어져(페이지 이동 등)
+#     스타일이 없으면 컴포넌트가 {"type": "css"} 값으로 다시 요청한다 (rerun 한 번).
+#   - 일정 JSON 은 build_payload 에서 문자열로 만들어 둔다. dict 를 넘기면 Streamlit 이
+#     인자마다 is_dataframe_like 검사를 하면서 pandas 를 import 한다 (콜드 스타트 약 0.15초).
+#     pyarrow 는 컴포넌트 호출마다 Streamlit 이 import 하므로 피할 수 없다 (약 0.06초).
+
+FRONTEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "frontend", "timetable")
+
+_component = components.declare_component("timetable", path=FRONTEND_DIR)
+
+# data: 컴포넌트에 보낼 JSON 문자열, events: id -> Event (클릭된 일정 찾기용)
+Payload = namedtuple("Payload", "data events")
+
+# kind: "event" 또는 "cell", event: 눌린 Event (cell 이면 None), day/minute: 눌린 칸
+Click = namedtuple("Click", "kind event day minute")
+
+
+def event_id(ev, seen):
+    base = f"{ev.day}.{ev.start}.{ev.end}.{ev.kind}.{ev.title_id}.{ev.sub_id}"
+    n = seen.get(base, 0)
+    seen[base] = n + 1
+    return base if n == 0 else f"{base}#{n}"  # 완전히 같은 일정이 여럿이면 순번
+
+
+def build_payload(events, window):
+    """이벤트 + 창 설정 -> Payload (워커 스레드에서 불러도 된다)"""
+    lo, hi = window.start_min, window.end_min
+    visible = [ev for ev in events if ev.day in window.days and ev.start < hi and ev.end > lo]
+    seen = {}
+    rows = []
+    by_id = {}
+    for ev, lane, lanes in assign_lanes(visible):
+        eid = event_id(ev, seen)
+        by_id[eid] = ev
+        rows.append([eid, ev.day, ev.start, ev.end, KINDS[ev.kind], ev.title, ev.sub, lane, lanes])
+    data = {
+        "window": {"days": list(window.days), "first_hour": window.first_hour,
+                   "last_hour": window.last_hour, "slot": window.slot_minutes},
+        "events": rows,
+    }
+    return Payload(json.dumps(data, ensure_ascii=False, separators=(",", ":")), by_id)
+
+
+def timetable(payload, key, style=theme.DEFAULT_THEME, height=None):
+    """컴포넌트를 그리고, 이번 실행에 새로 들어온 클릭(Click)이 있으면 돌려준다"""
+    sheet = theme.stylesheet(style)
+    # 컴포넌트 값은 다음 클릭까지 그대로 남으므로 순번으로 새 값만 골라낸다
+    seen_key = f"_{key}_click_seq"
+    css_key = f"_{key}_css_version"  # 이 세션에서 마지막으로 보낸 스타일 버전
+    pending = st.session_state.get(key)
+    if pending and pending.get("type") == "css" and pending.get("seq") != st.session_state.get(seen_key):
+        st.session_state[seen_key] = pending.get("seq")
+        st.session_state.pop(css_key, None)  # 새 iframe — 스타일을 다시 보낸다
+
+    send_css = st.session_state.get(css_key) != sheet.version
+    st.session_state[css_key] = sheet.version
+    value = _component(
+        data=payload.data,
+        css=sheet.css if send_css else None,
+        css_version=sheet.version,
+        row_px=style.row_px,
+        height=height,
+        key=key,
+        default=None,
+    )
+    if not value or value.get("seq") == st.session_state.get(seen_key):
+        return None
+    st.session_state[seen_key] = value.get("seq")
+    if value.get("type") == "event":
+        ev = payload.events.get(value.get("id"))
+        return Click("event", ev, ev.day, ev.start) if ev is not None else None
+    if value.get("type") == "cell":
+        return Click("cell", None, value.get("day"), value.get("minute"))
+    return None
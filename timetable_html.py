@@ -0,0 +1,152 @@
+from collections import namedtuple
+import calendar
+import functools
+import html
+
+from events import DAYS, KINDS
+from lanes import assign_lanes
+
+# -------------------------------------------------
+# 시간표 그리드 HTML 조립
+# -------------------------------------------------
+# 보이는 범위(요일, 시작/끝 시각, 칸 단위)를 GridWindow 로 받는다.
+# 헤더와 배경 칸(시간축 + 빈칸)은 창 설정마다 한 번만 만들어 재사용하고,
+# 매 렌더마다 새로 만드는 것은 이벤트 레이어뿐이다.
+# 같은 요일에 겹치는 일정은 lanes.assign_lanes 로 나란히 배치한다.
+
+# days: 보여줄 요일 인덱스 튜플 (0=월), first_hour~last_hour: [시작, 끝) 시각,
+# slot_minutes: 그리드 한 칸의 분 단위 (60 의 약수)
+class GridWindow(namedtuple("GridWindow", "days first_hour last_hour slot_minutes")):
+    __slots__ = ()
+
+    @property
+    def rows(self):
+        return (self.last_hour - self.first_hour) * 60 // self.slot_minutes
+
+    @property
+    def start_min(self):
+        return self.first_hour * 60
+
+    @property
+    def end_min(self):
+        return self.last_hour * 60
+
+
+def make_window(days=(0, 1, 2, 3, 4), first_hour=9, last_hour=17, slot_minutes=10):
+    days = tuple(sorted(set(days)))
+    if not days or days[0] < 0 or days[-1] >= len(DAYS):
+        raise ValueError(f"요일 범위가 올바르지 않습니다: {days}")
+    if not 0 <= first_hour < last_hour <= 24:
+        raise ValueError(f"시간 범위가 올바르지 않습니다: {first_hour}~{last_hour}")
+    if slot_minutes <= 0 or 60 % slot_minutes:
+        raise ValueError(f"칸 단위는 60의 약수여야 합니다: {slot_minutes}")
+    return GridWindow(days, first_hour, last_hour, slot_minutes)
+
+
+# 기존 화면과 같은 월~금, 9~17시, 10분 단위
+DEFAULT_WINDOW = make_window()
+
+
+def fit_window(events, window=DEFAULT_WINDOW):
+    """이벤트가 창 밖으로 넘치지 않도록 요일/시간 범위를 넓힌 창을 돌려준다"""
+    if not events:
+        return window
+    days = set(window.days)
+    first, last = window.first_hour, window.last_hour
+    for ev in events:
+        days.add(ev.day)
+        if ev.start < first * 60:
+            first = ev.start // 60
+        if ev.end > last * 60:
+            last = min(24, -(-ev.end // 60))
+    if len(days) == len(window.days) and first == window.first_hour and last == window.last_hour:
+        return window
+    return make_window(days, first, last, window.slot_minutes)
+
+
+# -------------------------------------------------
+# 정적 골격 (창 설정별 1회 생성)
+# -------------------------------------------------
+@functools.lru_cache(maxsize=32)
+def skeleton(window):
+    """(앞부분, 뒷부분) HTML. 이벤트 레이어는 두 조각 사이에 들어간다."""
+    per_hour = 60 // window.slot_minutes
+    parts = [
+        f'<div class="timetable-wrapper" style="--days:{len(window.days)}; --rows:{window.rows};">',
+        '<div class="timetable-header"><div></div>',
+    ]
+    parts.extend(f"<div>{DAYS[d]}</div>" for d in window.days)
+    parts.append("</div>")
+
+    parts.append('<div class="timetable-body">')
+    for h in range(window.first_hour, window.last_hour):
+        row = (h - window.first_hour) * per_hour + 1
+        parts.append(f'<div class="time-label" style="grid-column:1; grid-row:{row}/span {per_hour};">{h}</div>')
+        for col in range(2, len(window.days) + 2):
+            parts.append(f'<div class="grid-bg-cell" style="grid-column:{col}; grid-row:{row}/span {per_hour};"></div>')
+    return "".join(parts), "</div></div>"
+
+
+@functools.lru_cache(maxsize=32)
+def _column_map(days):
+    return {d: i + 2 for i, d in enumerate(days)}  # 1은 시간축, 2부터 첫 요일
+
+
+# -------------------------------------------------
+# 이벤트 레이어 (매 렌더)
+# -------------------------------------------------
+def event_layer(events, window=DEFAULT_WINDOW):
+    cols = _column_map(window.days)
+    lo, hi, slot = window.start_min, window.end_min, window.slot_minutes
+    # 창 밖 일정은 빼고, 남은 것끼리 겹침 레인을 정한다
+    visible = [ev for ev in events if ev.day in cols and ev.start < hi and ev.end > lo]
+    parts = []
+    for ev, lane, lanes in assign_lanes(visible):
+        # 창 밖 부분은 잘라낸다
+        start, end = max(ev.start, lo), min(ev.end, hi)
+        row = (start - lo) // slot + 1
+        span = max(1, -(-(end - start) // slot))
+        sub = f'<div class="evt-time">{html.escape(ev.sub)}</div>' if ev.sub_id else ""
+        # 겹치는 일정은 요일 칸을 lanes 개의 세로 줄로 나눠 나란히 (너비/위치는 스타일시트의 .lane)
+        lane_cls, lane_style = (" lane", f" --lane:{lane}; --lanes:{lanes};") if lanes > 1 else ("", "")
+        parts.append(
+            f'<div class="event-item evt-{KINDS[ev.kind]}{lane_cls}" '
+            f'style="grid-column:{cols[ev.day]}; grid-row:{row}/span {span};{lane_style}">'
+            f'<div class="evt-title">{html.escape(ev.title)}</div>{sub}</div>'
+        )
+    return "".join(parts)
+
+
+def build_html(events, window=DEFAULT_WINDOW):
+    head, tail = skeleton(window)
+    return head + event_layer(events, window) + tail
+
+
+# -------------------------------------------------
+# 월간 보기
+# -------------------------------------------------
+MONTH_CHIPS = 3  # 날짜 칸 하나에 보여 줄 일정 수 (나머지는 +N)
+
+_month_calendar = calendar.Calendar(firstweekday=0)  # 월요일 시작
+
+
+def month_html(year, month, dated):
+    """dated: 그 달의 (date, Event) 를 날짜 순으로 — semester.EventIndex.month() 결과"""
+    by_date = {}
+    for date, ev in dated:
+        by_date.setdefault(date, []).append(ev)
+
+    parts = ['<div class="timetable-wrapper month-view">', '<div class="month-grid">']
+    parts.extend(f'<div class="month-head">{d}</div>' for d in DAYS)
+    for week in _month_calendar.monthdatescalendar(year, month):
+        for date in week:
+            other = "" if date.month == month else " other"
+            parts.append(f'<div class="month-cell{other}"><div class="month-date">{date.day}</div>')
+            evs = by_date.get(date, ())
+            for ev in evs[:MONTH_CHIPS]:
+                parts.append(f'<div class="month-evt evt-{KINDS[ev.kind]}">{html.escape(ev.title)}</div>')
+            if len(evs) > MONTH_CHIPS:
+                parts.append(f'<div class="month-more">+{len(evs) - MONTH_CHIPS}</div>')
+            parts.append("</div>")
+    parts.append("</div></div>")
+    return "".join(parts)
@@ -0,0 +1,300 @@
+from collections import namedtuple
+import threading
+
+# -------------------------------------------------
+# 시간표 버전 (구조 공유 copy-on-write)
+# -------------------------------------------------
+# 시간표를 복제하거나 되돌리기 기록을 남길 때 이벤트를 통째로 복사하면 메모리가
+# "시간표 수 × 크기" 로 는다. 여기서는 이벤트를 불변 32갈래 트라이(EventMap)에 둔다.
+#
+#   - 수정은 바뀐 경로의 노드(깊이 × 32칸 튜플)만 새로 만들고 나머지는 이전
+#     버전과 공유한다 — 이벤트 1만 개여도 수정 한 번에 튜플 3개.
+#   - 버전은 (트라이 루트, 라벨) 뿐이라 스냅샷/복제는 O(1).
+#   - 두 버전의 차이는 같은(is) 서브트리를 건너뛰며 찾으므로 바뀐 양에 비례한다.
+#     되돌리기/다시 실행은 그 차이만 저장소(storage.py)에 쓴다.
+#
+# 키는 작업 공간 안에서만 쓰는 순번이다 (저장소 행 id 와 무관). 같은 내용의 이벤트는
+# 서로 바꿔 써도 되므로 저장소에는 내용으로 지우고 더한다 (catalog.Overlay 와 같은 방식).
+
+BITS = 5
+WIDTH = 1 << BITS
+MASK = WIDTH - 1
+_EMPTY_SLOTS = (None,) * WIDTH
+
+
+class VersionError(ValueError):
+    """되돌릴 버전이 없거나 없는 이벤트 키를 고치려 할 때 발생"""
+
+
+# -------------------------------------------------
+# 영속 트라이
+# -------------------------------------------------
+def _assoc(node, shift, key, value):
+    slots = list(node or _EMPTY_SLOTS)
+    i = (key >> shift) & MASK
+    slots[i] = value if shift == 0 else _assoc(slots[i], shift - BITS, key, value)
+    if slots[i] is None and not any(slots):
+        return None  # 빈 노드는 남기지 않는다 (메모리는 살아 있는 이벤트에 비례)
+    return tuple(slots)
+
+
+def _items(node, shift, base):
+    if node is None:
+        return
+    for i, child in enumerate(node):
+        if child is None:
+            continue
+        if shift == 0:
+            yield base | i, child
+        else:
+            yield from _items(child, shift - BITS, base | (i << shift))
+
+
+def _lift(node, shift, to_shift):
+    # 얕은 트라이를 깊은 쪽 높이로 — 원래 루트는 그대로 0번 칸에 들어가므로 공유가 유지된다
+    while shift < to_shift:
+        if node is not None:
+            node = (node, *_EMPTY_SLOTS[1:])
+        shift += BITS
+    return node
+
+
+def _diff(a, b, shift, base):
+    if a is b:
+        return  # 공유 서브트리 — 볼 필요 없음
+    a = a or _EMPTY_SLOTS
+    b = b or _EMPTY_SLOTS
+    for i in range(WIDTH):
+        x, y = a[i], b[i]
+        if x is y:
+            continue
+        if shift == 0:
+            if x != y:
+                yield base | i, x, y
+        else:
+            yield from _diff(x, y, shift - BITS, base | (i << shift))
+
+
+class EventMap(namedtuple("EventMap", "root shift size next_key")):
+    """키(정수) -> Event 불변 맵. 수정 메서드는 새 EventMap 을 돌려준다.
+
+    튜플이므로 len() 은 필드 수다 — 이벤트 수는 size.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_events(cls, events):
+        m = EMPTY_EVENTS
+        for ev in events:
+            m, _ = m.add(ev)
+        return m
+
+    def get(self, key, default=None):
+        if not 0 <= key < self.next_key or key >> self.shift >= WIDTH:
+            return default
+        node, shift = self.root, self.shift
+        while node is not None:
+            node = node[(key >> shift) & MASK]
+            if shift == 0:
+                return default if node is None else node
+            shift -= BITS
+        return default
+
+    def add(self, ev):
+        """새 키로 추가 -> (새 맵, 키)"""
+        key = self.next_key
+        root, shift = self.root, self.shift
+        while key >> shift >= WIDTH:
+            root = _lift(root, shift, shift + BITS)
+            shift += BITS
+        return EventMap(_assoc(root, shift, key, ev), shift, self.size + 1, key + 1), key
+
+    def replace(self, key, ev):
+        if self.get(key) is None:
+            raise VersionError(f"없는 일정입니다: {key}")
+        return self._replace(root=_assoc(self.root, self.shift, key, ev))
+
+    def remove(self, key):
+        if self.get(key) is None:
+            raise VersionError(f"없는 일정입니다: {key}")
+        return self._replace(root=_assoc(self.root, self.shift, key, None), size=self.size - 1)
+
+    def items(self):
+        """(키, Event) — 키 순 (= 추가한 순)"""
+        return _items(self.root, self.shift, 0)
+
+    def events(self):
+        return tuple(ev for _, ev in self.items())
+
+    def diff(self, other):
+        """self -> other 로 바뀐 (키, 이전 Event|None, 새 Event|None), 바뀐 양에 비례"""
+        shift = max(self.shift, other.shift)
+        return _diff(_lift(self.root, self.shift, shift), _lift(other.root, other.shift, shift), shift, 0)
+
+
+EMPTY_EVENTS = EventMap(None, 0, 0, 0)
+
+
+# -------------------------------------------------
+# 버전 기록 (되돌리기/다시 실행)
+# -------------------------------------------------
+Version = namedtuple("Version", "events label")
+
+
+class History:
+    """버전 목록 + 현재 위치. 버전끼리 트라이를 공유하므로 기록은 수정량에 비례한다."""
+
+    def __init__(self, events=EMPTY_EVENTS, limit=100):
+        self.limit = limit
+        self._versions = [Version(events, "")]
+        self._cursor = 0
+        self._view = (None, ())  # (EventMap, 이벤트 튜플) — 현재 버전만 펼쳐 둔다
+
+    @property
+    def current(self):
+        return self._versions[self._cursor]
+
+    @property
+    def can_undo(self):
+        return self._cursor > 0
+
+    @property
+    def can_redo(self):
+        return self._cursor < len(self._versions) - 1
+
+    def labels(self):
+        """[(라벨, 현재 버전인지)] 오래된 순"""
+        return [(v.label, i == self._cursor) for i, v in enumerate(self._versions)]
+
+    def events(self):
+        m = self.current.events
+        if self._view[0] is not m:
+            self._view = (m, m.events())
+        return self._view[1]
+
+    def commit(self, events, label=""):
+        """새 버전을 현재 위치 뒤에 (다시 실행 기록은 버린다)"""
+        del self._versions[self._cursor + 1:]
+        self._versions.append(Version(events, label))
+        if len(self._versions) > self.limit:
+            del self._versions[0]
+        self._cursor = len(self._versions) - 1
+        return self.current
+
+    def undo(self):
+        """-> (이전 현재 버전, 새 현재 버전)"""
+        if not self.can_undo:
+            raise VersionError("되돌릴 작업이 없습니다.")
+        self._cursor -= 1
+        return self._versions[self._cursor + 1], self.current
+
+    def redo(self):
+        if not self.can_redo:
+            raise VersionError("다시 실행할 작업이 없습니다.")
+        self._cursor += 1
+        return self._versions[self._cursor - 1], self.current
+
+    def clone(self):
+        """현재 버전에서 시작하는 새 기록 — 트라이/펼친 튜플 모두 공유 (O(1))"""
+        h = History(self.current.events, self.limit)
+        h._view = self._view
+        return h
+
+
+# -------------------------------------------------
+# 세션 작업 공간 (저장소에 바로 쓰기)
+# -------------------------------------------------
+class Workspace:
+    """시간표 id -> History. 수정/되돌리기는 바뀐 이벤트만 저장소에 반영한다.
+
+    다른 세션(같은 사용자 키로 연 다른 탭)이 저장소를 바꾸면 rev 가 달라지므로
+    그 시간표의 기록은 저장소에서 다시 만든다.
+    """
+
+    def __init__(self, store, limit=100):
+        self.store = store
+        self.limit = limit
+        self._histories = {}  # 시간표 id -> [History, 맞춰 둔 rev]
+        self._lock = threading.Lock()
+
+    def history(self, tt_id):
+        rev = self.store.revision(tt_id)
+        with self._lock:
+            entry = self._histories.get(tt_id)
+            if entry is None or entry[1] != rev:
+                entry = self._histories[tt_id] = [
+                    History(EventMap.from_events(self.store.load_events(tt_id)), self.limit), rev]
+            return entry[0]
+
+    def events(self, tt_id):
+        return self.history(tt_id).events()
+
+    def _apply(self, tt_id, before, after):
+        removed, added = [], []
+        for _, old, new in before.diff(after):
+            if old is not None:
+                removed.append(old)
+            if new is not None:
+                added.append(new)
+        rev = self.store.replace_events(tt_id, removed, added)
+        with self._lock:
+            self._histories[tt_id][1] = rev
+
+    def _commit(self, tt_id, h, events, label):
+        # 저장소에 먼저 쓰고 (실패하면 기록은 그대로) 버전을 남긴다
+        self._apply(tt_id, h.current.events, events)
+        h.commit(events, label)
+
+    def add(self, tt_id, ev, label=""):
+        h = self.history(tt_id)
+        events, key = h.current.events.add(ev)
+        self._commit(tt_id, h, events, label or f"추가: {ev.title}")
+        return key
+
+    def replace(self, tt_id, key, ev, label=""):
+        h = self.history(tt_id)
+        self._commit(tt_id, h, h.current.events.replace(key, ev), label or f"수정: {ev.title}")
+
+    def remove(self, tt_id, key, label=""):
+        h = self.history(tt_id)
+        current = h.current.events
+        ev = current.get(key)
+        self._commit(tt_id, h, current.remove(key), label or f"삭제: {ev.title if ev else key}")
+
+    def undo(self, tt_id):
+        h = self.history(tt_id)
+        before, after = h.undo()
+        try:
+            self._apply(tt_id, before.events, after.events)
+        except Exception:
+            h.redo()
+            raise
+        return after
+
+    def redo(self, tt_id):
+        h = self.history(tt_id)
+        before, after = h.redo()
+        try:
+            self._apply(tt_id, before.events, after.events)
+        except Exception:
+            h.undo()
+            raise
+        return after
+
+    def snapshot(self, tt_id):
+        """현재 버전 (O(1)) — restore() 로 돌아올 수 있다"""
+        return self.history(tt_id).current
+
+    def restore(self, tt_id, version, label="스냅샷 복원"):
+        """스냅샷을 새 버전으로 (그 사이 작업도 되돌리기 기록에 남는다)"""
+        self._commit(tt_id, self.history(tt_id), version.events, label)
+
+    def clone(self, tt_id, owner, name):
+        """시간표 복제 — 저장소는 SQL 안에서 행만 복사, 메모리는 트라이를 그대로 공유"""
+        h = self.history(tt_id)
+        new_id = self.store.clone_timetable(tt_id, owner, name)
+        rev = self.store.revision(new_id)
+        with self._lock:
+            self._histories[new_id] = [h.clone(), rev]
+        return new_id